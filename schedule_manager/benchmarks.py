@@ -0,0 +1,175 @@
+# schedule_manager/benchmarks.py
+"""
+GUI 성능 회귀 점검(오프스크린 Qt).
+
+실제 data/ 파일은 건드리지 않고, 임시 폴더에 합성 직원/스케줄을 만든 뒤 측정한다.
+
+    python -m schedule_manager.benchmarks               # 전부
+    python -m schedule_manager.benchmarks attendance    # 근태 새로고침당 파일 파싱 수/시간
+    python -m schedule_manager.benchmarks calendar      # 달력 월 이동 시간
+    python -m schedule_manager.benchmarks parallel      # 1년치 자동 배정: 다중 시나리오(프로세스 풀) vs 단일 실행
+
+예산(BUDGETS)을 넘는 항목이 있으면 종료코드 1.
+"""
+from __future__ import annotations
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from schedule_manager.data import data_manager as dm
+from schedule_manager.data import store as store_mod
+from schedule_manager.logic.scheduler import plan_assignments
+from schedule_manager.models.employee import Employee
+
+# 항목 → 허용 상한
+BUDGETS = {
+    "attendance.parses_per_refresh": 0,   # 새로고침은 메모리 저장소만 본다(파일 파싱 없음)
+}
+
+
+@contextmanager
+def temp_data_dir():
+    """data_manager 경로를 임시 폴더로 돌리고, 전역 저장소도 새로 로드되게 한다."""
+    names = ("DATA_DIR", "EMP_FILE", "SCH_FILE", "NOTES_FILE", "ATT_FILE", "GEN_FILE", "ROT_FILE", "TOMB_FILE", "AGG_FILE")
+    saved = {n: getattr(dm, n) for n in names}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for n in names:
+            setattr(dm, n, root if n == "DATA_DIR" else root / saved[n].name)
+        store_mod.reset_store()
+        try:
+            yield root
+        finally:
+            for n, v in saved.items():
+                setattr(dm, n, v)
+            store_mod.reset_store()
+
+
+def seed_data(n_emps: int, year: int = 2025) -> None:
+    """직원 n명 + 1년치 자동 배정 스케줄 + 근태 일부를 임시 폴더에 저장."""
+    emps = [
+        Employee(i, f"직원{i}", "직원", "C" if i % 3 else "N", "OS" if i % 2 else "HC",
+                 min_shifts_per_week=0, max_shifts_per_week=6)
+        for i in range(1, n_emps + 1)
+    ]
+    schedules: Dict = {}
+    for m in range(1, 13):
+        plan_assignments(emps, schedules, f"{year}-{m:02d}-01", 28, seed=m).apply(schedules)
+    att = {k: {str(e.id): {"in": "09:00", "out": "18:00"} for e in emps[: n_emps // 2]}
+           for k in list(schedules)[::3]}
+    dm.save_employees(emps)
+    dm.save_schedules(schedules)
+    dm.save_attendance(att)
+
+
+def _timed(fn: Callable[[], None], repeat: int) -> float:
+    """repeat회 실행 중 최소 시간(ms)."""
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1000
+
+
+def bench_attendance(n_emps: int = 50, refreshes: int = 20) -> Dict[str, float]:
+    from PySide6.QtCore import QDate
+    from PySide6.QtWidgets import QApplication
+    from schedule_manager.gui.views.attendance_dialog import AttendanceDialog
+
+    app = QApplication.instance() or QApplication([])
+    with temp_data_dir():
+        seed_data(n_emps)
+        dlg = AttendanceDialog(None, QDate(2025, 3, 4))
+        app.processEvents()
+
+        before = sum(dm.PARSE_COUNTS.values())
+        day = QDate(2025, 3, 1)
+        for i in range(refreshes):
+            dlg.date_edit.setDate(day.addDays(i % 28))   # dateChanged → refresh
+        dlg.refresh()
+        parses = sum(dm.PARSE_COUNTS.values()) - before
+        ms = _timed(dlg.refresh, 10)
+        dlg.close()
+    return {
+        "attendance.parses_per_refresh": parses / (refreshes + 1),
+        "attendance.refresh_ms": ms,
+    }
+
+
+def bench_calendar(n_emps: int = 20) -> Dict[str, float]:
+    from PySide6.QtWidgets import QApplication
+    from schedule_manager.gui.calendar_widget import CalendarWidget
+
+    app = QApplication.instance() or QApplication([])
+    with temp_data_dir():
+        seed_data(n_emps)
+        store = store_mod.get_store()
+        cal = CalendarWidget(on_day_open=lambda *a: None)
+        cal.resize(1000, 800)
+        cal.show()
+        month = [0]
+
+        def switch():
+            month[0] = month[0] % 12 + 1
+            cal.render_month(2025, month[0], store.employees, store.schedules)
+            cal.repaint()
+
+        ms = _timed(switch, 24)
+        cal.close()
+        app.processEvents()
+    return {"calendar.month_switch_ms": ms}
+
+
+def bench_parallel(n_emps: int = 20, days: int = 365) -> Dict[str, float]:
+    """
+    같은 1년치 배정을 plan_assignments 한 번(직렬) / 시나리오 scenarios개를 프로세스 풀로 / 같은 개수를 직렬로.
+    풀 실행 시간이 직렬 1회에 가까울수록 코어 수만큼 확장된다는 뜻.
+    """
+    from schedule_manager.logic.parallel import generate_parallel
+
+    emps = [
+        Employee(i, f"직원{i}", "직원", "C" if i % 3 else "N", "OS" if i % 2 else "HC",
+                 min_shifts_per_week=0, max_shifts_per_week=6)
+        for i in range(1, n_emps + 1)
+    ]
+    scenarios = max(2, min(os.cpu_count() or 1, 8))
+    start = "2025-01-01"
+    single = _timed(lambda: plan_assignments(emps, {}, start, days, seed=1), 3)
+    pooled = _timed(lambda: generate_parallel(emps, {}, start, days, scenarios=scenarios, base_seed=1), 3)
+    serial = _timed(lambda: generate_parallel(emps, {}, start, days, scenarios=scenarios, base_seed=1,
+                                              max_workers=1), 1)
+    return {
+        "parallel.scenarios": scenarios,
+        "parallel.plan_assignments_ms": single,
+        "parallel.pool_ms": pooled,
+        "parallel.serial_ms": serial,
+        "parallel.speedup": serial / pooled if pooled else 0.0,
+    }
+
+
+BENCHES = {"attendance": bench_attendance, "calendar": bench_calendar, "parallel": bench_parallel}
+
+
+def main(argv: List[str]) -> int:
+    names = [a for a in argv if a in BENCHES] or list(BENCHES)
+    failed = False
+    for name in names:
+        for metric, value in BENCHES[name]().items():
+            budget = BUDGETS.get(metric)
+            over = budget is not None and value > budget
+            failed |= over
+            mark = "FAIL" if over else "ok  "
+            limit = f" (budget {budget})" if budget is not None else ""
+            print(f"{mark} {metric}: {value:.2f}{limit}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
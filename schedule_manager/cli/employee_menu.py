@@ -1,5 +1,6 @@
 # cli/employee_menu.py
-from schedule_manager.data.data_manager import load_employees, save_employees
+from schedule_manager.data.data_manager import load_employees, save_employees, load_tombstones
+from schedule_manager.data.store import DataStore
 from schedule_manager.models.employee import Employee
 from schedule_manager.utils.input_handler import get_input
 
@@ -35,7 +36,7 @@ def show_employees():
 
 def add_employee():
     employees = load_employees()
-    new_id = max([emp.id for emp in employees], default=0) + 1
+    new_id = max([emp.id for emp in employees] + load_tombstones(), default=0) + 1
     name = get_input("이름: ")
     role = get_input("직급(사장/매니저/직원): ")
     skill = get_input("숙련도(조리/비조리): ")
@@ -64,8 +65,13 @@ def edit_employee():
     print("직원 정보가 수정되었습니다.")
 
 def delete_employee():
-    employees = load_employees()
+    store = DataStore()
     emp_id = int(get_input("삭제할 직원 ID: "))
-    employees = [e for e in employees if e.id != emp_id]
-    save_employees(employees)
+    if not store.remove_employee(emp_id):
+        print("해당 ID의 직원이 없습니다.")
+        return
     print("직원이 삭제되었습니다.")
+    # CLI는 바로 정리(색인으로 그 직원이 들어 있는 날짜만)
+    days = store.compact_tombstones()
+    if days:
+        print(f"과거 스케줄 {len(days)}일에서 정리했습니다.")
@@ -5,8 +5,13 @@ from schedule_manager.cli.schedule_menu import (
     employee_work_schedule_menu,
     employee_off_schedule_menu
 )
+from schedule_manager.cli.rotation_menu import rotation_menu
 from schedule_manager.logic.scheduler import auto_assign
-from schedule_manager.utils.input_handler import get_input
+from schedule_manager.logic.local_search import DEFAULT_ITERATIONS
+from schedule_manager.logic.parallel import generate_parallel
+from schedule_manager.data.data_manager import load_employees, load_schedules, save_schedules, append_generation
+from schedule_manager.data.store import DataStore
+from schedule_manager.utils.input_handler import get_input, get_optional_int
 from schedule_manager.exceptions import CancelAction, GoBackAction
 
 def main_menu():
@@ -18,6 +23,9 @@ def main_menu():
         print("4. 스케줄 보기")
         print("5. 직원별 근무만 보기")
         print("6. 직원별 휴무만 보기")
+        print("7. 다중 시나리오 자동 배정(병렬)")
+        print("8. 로테이션 템플릿")
+        print("9. 메모/노트 검색")
         print("0. 종료")
 
         try:
@@ -29,13 +37,22 @@ def main_menu():
             elif choice == "3":
                 start_date = get_input("시작 날짜(YYYY-MM-DD)")
                 days = int(get_input("배정 일수"))
-                auto_assign(start_date, days)
+                seed = get_optional_int("시드(비우면 무작위)")
+                improve = get_input("공정성 개선 후처리(Y/N)", allow_empty=True, default="N") or "N"
+                auto_assign(start_date, days, seed=seed,
+                            improve_iterations=DEFAULT_ITERATIONS if improve.strip().upper().startswith("Y") else 0)
             elif choice == "4":
                 show_schedule()
             elif choice == "5":
                 employee_work_schedule_menu()   # ← 근무만
             elif choice == "6":
                 employee_off_schedule_menu()    # ← 휴무만
+            elif choice == "7":
+                parallel_assign_menu()
+            elif choice == "8":
+                rotation_menu()
+            elif choice == "9":
+                memo_search_menu()
             elif choice == "0":
                 print("프로그램을 종료합니다.")
                 break
@@ -45,3 +62,39 @@ def main_menu():
             print("이전 메뉴로 이동")
         except CancelAction:
             print("메인 메뉴로 이동")
+
+
+def parallel_assign_menu():
+    """시드가 다른 시나리오를 프로세스 풀로 돌려(각자 기간 전체) 가장 좋은 배정을 골라 저장."""
+    employees = load_employees()
+    if not employees:
+        print("직원 데이터가 없습니다. 먼저 직원을 등록해주세요.")
+        return
+    start_date = get_input("시작 날짜(YYYY-MM-DD)")
+    days = int(get_input("배정 일수"))
+    scenarios = int(get_input("시나리오 수", allow_empty=True, default="4") or 4)
+
+    schedules = load_schedules()
+    result = generate_parallel(employees, schedules, start_date, days, scenarios=scenarios)
+    result.apply(schedules)
+    save_schedules(schedules)
+    append_generation(result.generation_record())
+    print(result.summary())
+    print(result.stats.report())
+    print(f"시나리오 {scenarios}개 중 최적안(시드 {result.seed}) 선택, 충원 {result.stats.slots_filled}/{result.stats.slots_required}칸")
+
+
+def memo_search_menu():
+    """날짜 메모 + 노트 전문 검색. 색인은 한 번 만들고 빈 입력까지 여러 번 검색."""
+    store = DataStore()
+    while True:
+        query = get_input("검색어(비우면 종료)", allow_empty=True)
+        if not query:
+            return
+        hits = store.search_text(query, limit=50)
+        if not hits:
+            print("검색 결과가 없습니다.")
+            continue
+        for hit in hits:
+            print(f"{hit.label} | {hit.snippet}")
+        print(f"{len(hits)}건" + (" (최대 50건만 표시)" if len(hits) >= 50 else ""))
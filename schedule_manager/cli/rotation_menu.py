@@ -0,0 +1,150 @@
+# cli/rotation_menu.py
+from datetime import datetime, timedelta
+
+from schedule_manager.data.data_manager import (
+    load_employees, load_schedules, save_schedules, append_generation,
+    load_rotations, save_rotations,
+)
+from schedule_manager.logic.rotation import tile_rotations, plan_with_rotations, CODES
+from schedule_manager.models.rotation import Rotation
+from schedule_manager.utils.input_handler import get_input, get_optional_int
+from schedule_manager.utils.parse_utils import parse_id_list
+from schedule_manager.exceptions import CancelAction, GoBackAction
+
+MAX_CONFLICTS_SHOWN = 20
+
+
+def rotation_menu():
+    while True:
+        print("\n[로테이션 템플릿]")
+        print("1. 템플릿 목록")
+        print("2. 템플릿 추가")
+        print("3. 템플릿 삭제")
+        print("4. 기간에 템플릿 적용")
+        print("5. 템플릿 적용 + 빈 칸 자동 배정")
+        print("0. 메인 메뉴로")
+
+        try:
+            choice = get_input("선택")
+            if choice == "1":
+                show_rotations()
+            elif choice == "2":
+                add_rotation()
+            elif choice == "3":
+                delete_rotation()
+            elif choice == "4":
+                apply_rotations()
+            elif choice == "5":
+                apply_rotations(fill_gaps=True)
+            elif choice == "0":
+                break
+            else:
+                print("잘못된 선택.")
+        except GoBackAction:
+            print("이전 메뉴로 이동")
+        except CancelAction:
+            print("메인 메뉴로 이동")
+
+
+def _pattern_text(pattern) -> str:
+    return ",".join(code or "-" for code in pattern)
+
+
+def parse_pattern(text: str) -> list:
+    """'OS,OS,OFF,-' → ['OS', 'OS', 'OFF', None]. '-'(또는 빈 칸)은 비움. 모르는 코드는 ValueError."""
+    out = []
+    for tok in text.split(","):
+        tok = tok.strip().upper()
+        if tok in ("", "-"):
+            out.append(None)
+        elif tok in CODES:
+            out.append(tok)
+        else:
+            raise ValueError(f"알 수 없는 코드: {tok}")
+    return out
+
+
+def show_rotations():
+    rotations = load_rotations()
+    if not rotations:
+        print("등록된 템플릿이 없습니다.")
+        return
+    print("\n[템플릿 목록]")
+    for i, r in enumerate(rotations, 1):
+        print(f"{i}. {r.name} | 직원 {r.emp_ids} | {r.period}일 주기 [{_pattern_text(r.pattern)}]"
+              f" | 기준일 {r.anchor} | 팀원 간격 {r.stagger}일")
+
+
+def add_rotation():
+    employees = load_employees()
+    valid_ids = {e.id for e in employees}
+    name = get_input("템플릿 이름")
+    emp_ids = [i for i in parse_id_list(get_input("직원 ID(,구분 / 여러 명이면 팀)")) if i in valid_ids]
+    if not emp_ids:
+        print("유효한 직원 ID가 없습니다.")
+        return
+    try:
+        pattern = parse_pattern(get_input("패턴(OS/HC/OFF/- 를 ,로 구분. 예: OS,OS,OS,OFF,OFF)"))
+    except ValueError as e:
+        print(e)
+        return
+    anchor = get_input("기준일(패턴 첫 칸, YYYY-MM-DD)")
+    datetime.strptime(anchor, "%Y-%m-%d")
+    stagger = 0
+    if len(emp_ids) > 1:
+        stagger = int(get_input("팀원 간 간격(일)", allow_empty=True, default="0") or 0)
+
+    rotations = load_rotations()
+    rotations.append(Rotation(name, emp_ids, pattern, anchor, stagger))
+    save_rotations(rotations)
+    print("템플릿이 추가되었습니다.")
+
+
+def delete_rotation():
+    rotations = load_rotations()
+    show_rotations()
+    if not rotations:
+        return
+    idx = int(get_input("삭제할 번호")) - 1
+    if not 0 <= idx < len(rotations):
+        print("해당 번호가 없습니다.")
+        return
+    removed = rotations.pop(idx)
+    save_rotations(rotations)
+    print(f"'{removed.name}' 삭제 완료")
+
+
+def apply_rotations(fill_gaps: bool = False):
+    rotations = load_rotations()
+    if not rotations:
+        print("등록된 템플릿이 없습니다.")
+        return
+    employees = load_employees()
+    start_date = get_input("시작 날짜(YYYY-MM-DD)")
+    days = int(get_input("일수"))
+    schedules = load_schedules()
+
+    if fill_gaps:
+        seed = get_optional_int("시드(비우면 무작위)")
+        result, tiled = plan_with_rotations(employees, schedules, rotations, start_date, days,
+                                            seed=seed)
+        result.apply(schedules)
+        save_schedules(schedules)
+        append_generation(result.generation_record())
+        print(tiled.summary())
+        print(result.summary())
+        print(result.stats.report())
+    else:
+        overwrite = get_input("기존 배정보다 템플릿 우선(Y/N)", allow_empty=True, default="N").upper().startswith("Y")
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        tiled = tile_rotations(rotations, employees, schedules, start, start + timedelta(days=days - 1),
+                               overwrite=overwrite)
+        if tiled.changes:
+            tiled.changes.apply(schedules)
+            save_schedules(schedules)
+        print(tiled.summary())
+
+    for c in tiled.conflicts[:MAX_CONFLICTS_SHOWN]:
+        print(f"  충돌: {c}")
+    if len(tiled.conflicts) > MAX_CONFLICTS_SHOWN:
+        print(f"  ... 외 {len(tiled.conflicts) - MAX_CONFLICTS_SHOWN}칸")
@@ -4,8 +4,11 @@ from schedule_manager.models.schedule import DailySchedule
 from schedule_manager.utils.input_handler import get_input
 from schedule_manager.utils.parse_utils import parse_id_list
 from schedule_manager.exceptions import CancelAction, GoBackAction
+from schedule_manager.utils.hangul import NameIndex
 from datetime import datetime
 
+MAX_LISTED = 30   # 직원이 이보다 많으면 전체 목록 대신 검색으로 고른다
+
 def schedule_menu():
     while True:
         print("\n[일정 관리]")
@@ -224,25 +227,53 @@ def _print_employee_rows(rows: list[dict]):
         memo = r['memo'] or ""
         print(f"{date}  {status:<8}  {memo}")
 
+def _print_employee(e):
+    print(f"{e.id} | {e.name} | {e.role} | {e.skill_level} | {e.home_branch}")
+
+
+def _pick_employee(employees, query: str):
+    """ID면 그 직원, 아니면 이름 검색(접두/부분/초성). 여럿 걸리면 목록을 보여 주고 ID를 다시 묻는다."""
+    by_id = {e.id: e for e in employees}
+    query = query.strip()
+    if query.isdigit():
+        emp = by_id.get(int(query))
+        if not emp:
+            print("해당 ID의 직원이 없습니다.")
+        return emp
+    hits = [by_id[i] for i in NameIndex.build(employees).search(query)]
+    if not hits:
+        print("일치하는 직원이 없습니다.")
+        return None
+    if len(hits) == 1:
+        return hits[0]
+    print(f"\n['{query}' 검색 결과 {len(hits)}명]")
+    for e in hits[:MAX_LISTED]:
+        _print_employee(e)
+    if len(hits) > MAX_LISTED:
+        print(f"... 외 {len(hits) - MAX_LISTED}명")
+    emp = by_id.get(int(get_input("직원 ID")))
+    if not emp:
+        print("해당 ID의 직원이 없습니다.")
+    return emp
+
+
 def _select_employee_and_range():
     employees = load_employees()
     if not employees:
         print("직원이 없습니다. 먼저 직원을 추가해주세요.")
         return (None, None, None)   # ← 항상 3-튜플
 
-    print("\n[직원 목록]")
-    for e in employees:
-        print(f"{e.id} | {e.name} | {e.role} | {e.skill_level} | {e.home_branch}")
+    if len(employees) <= MAX_LISTED:
+        print("\n[직원 목록]")
+        for e in employees:
+            _print_employee(e)
 
     try:
-        emp_id = int(get_input("\n조회할 직원 ID"))
+        emp = _pick_employee(employees, get_input("\n조회할 직원(ID/이름/초성)"))
     except (ValueError, GoBackAction, CancelAction):
         # 입력 실수/취소/뒤로 → 상위에서 판단하도록 None 튜플
         return (None, None, None)
-
-    emp = next((x for x in employees if x.id == emp_id), None)
     if not emp:
-        print("해당 ID의 직원이 없습니다.")
         return (None, None, None)
 
     schedules = load_schedules()
@@ -1,11 +1,13 @@
 # data/data_manager.py
 from __future__ import annotations
 import json
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
 from schedule_manager.models.employee import Employee
 from schedule_manager.models.schedule import DailySchedule
+from schedule_manager.models.rotation import Rotation
 
 # 프로젝트 루트 = .../schedule_manager
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -14,6 +16,13 @@ EMP_FILE = DATA_DIR / "employees.json"
 SCH_FILE = DATA_DIR / "schedules.json"
 NOTES_FILE = DATA_DIR / "notes.txt"
 ATT_FILE = DATA_DIR / "attendance.json"
+GEN_FILE = DATA_DIR / "generations.json"
+ROT_FILE = DATA_DIR / "rotations.json"
+TOMB_FILE = DATA_DIR / "tombstones.json"   # 삭제했지만 아직 스케줄에서 정리하지 않은 직원 ID
+AGG_FILE = DATA_DIR / "month_aggregates.json"   # 월별 집계(연간 보기용, data/month_agg.py)
+
+# 파일 이름별 JSON 파싱 횟수(성능 점검용: benchmarks가 '새로고침당 파싱 수'를 센다)
+PARSE_COUNTS: Counter = Counter()
 
 def _ensure_data_dir():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -25,6 +34,7 @@ def _safe_json_load(path: Path, default):
         raw = path.read_text(encoding="utf-8").strip()
         if not raw:
             return default
+        PARSE_COUNTS[path.name] += 1
         return json.loads(raw)
     except Exception:
         return default
@@ -76,6 +86,13 @@ def save_employees(employees: List[Employee]):
     payload = [_emp_to_dict(e) for e in employees]
     _safe_json_save(EMP_FILE, payload)
 
+def load_tombstones() -> List[int]:
+    data = _safe_json_load(TOMB_FILE, default=[])
+    return [int(i) for i in data] if isinstance(data, list) else []
+
+def save_tombstones(emp_ids) -> None:
+    _safe_json_save(TOMB_FILE, sorted(emp_ids))
+
 # ---------- 스케줄 ----------
 def load_schedules() -> Dict[str, DailySchedule]:
     data = _safe_json_load(SCH_FILE, default={})
@@ -98,6 +115,54 @@ def save_schedules(schedules: Dict[str, DailySchedule]):
     payload = {date: sch.to_dict() for date, sch in schedules.items()}
     _safe_json_save(SCH_FILE, payload)
 
+def write_snapshot(kind: str, payload) -> None:
+    """
+    저장 형태 그대로 만들어 둔 스냅샷("employees"/"tombstones": list, "schedules"/"aggregates": dict)을 쓴다.
+    작업 스레드에서 호출 가능. 집계는 방금 쓴 schedules.json의 스탬프를 붙여 쓴다(schedules 다음에 써야 함).
+    """
+    if kind == "aggregates":
+        payload = {**payload, "stamp": schedules_stamp()}
+    path = {"employees": EMP_FILE, "schedules": SCH_FILE, "tombstones": TOMB_FILE, "aggregates": AGG_FILE}[kind]
+    _safe_json_save(path, payload)
+
+# ---------- 월별 집계 ----------
+def schedules_stamp():
+    """schedules.json의 [수정 시각(ns), 크기]. 파일이 없으면 None."""
+    try:
+        st = SCH_FILE.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def load_month_aggregates() -> Dict[str, Any] | None:
+    """저장된 월별 집계. 없거나 schedules.json이 그 뒤에 바뀌었으면(스탬프 불일치) None."""
+    data = _safe_json_load(AGG_FILE, default=None)
+    if not isinstance(data, dict) or data.get("stamp") is None or data.get("stamp") != schedules_stamp():
+        return None
+    return data
+
+# ---------- 자동 배정 기록 ----------
+def load_generations() -> List[Dict[str, Any]]:
+    """자동 배정 실행 기록(기간/시드 등) 목록. 오래된 것부터."""
+    data = _safe_json_load(GEN_FILE, default=[])
+    return data if isinstance(data, list) else []
+
+def append_generation(record: Dict[str, Any]) -> None:
+    """자동 배정 1회분 기록을 추가. 같은 입력+시드로 결과를 재현할 때 사용."""
+    data = load_generations()
+    rec = dict(record)
+    rec.setdefault("created_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    data.append(rec)
+    _safe_json_save(GEN_FILE, data)
+
+# ---------- 로테이션 템플릿 ----------
+def load_rotations() -> List[Rotation]:
+    data = _safe_json_load(ROT_FILE, default=[])
+    return [Rotation.from_dict(d) for d in data] if isinstance(data, list) else []
+
+def save_rotations(rotations: List[Rotation]) -> None:
+    _safe_json_save(ROT_FILE, [r.to_dict() for r in rotations])
+
 # ---------- 노트 ----------
 def load_notes() -> str:
     """노트 텍스트를 로드. 없으면 빈 문자열 반환."""
@@ -147,29 +212,18 @@ def save_attendance(att: Dict[str, Dict[str, Dict[str, str]]]) -> None:
 def _now_hhmm() -> str:
     return datetime.now().strftime("%H:%M")
 
-def punch_in(date_key: str, emp_id: int, hhmm: str | None = None) -> None:
-    """최초 한 번만 기록. 이후 호출해도 덮어쓰지 않음."""
-    hhmm = hhmm or _now_hhmm()
-    att = load_attendance()
-    day = att.setdefault(date_key, {})
-    rec = day.setdefault(str(emp_id), {})
-    if "in" not in rec or not rec["in"]:
-        rec["in"] = hhmm
-        save_attendance(att)
-
-def punch_out(date_key: str, emp_id: int, hhmm: str | None = None) -> None:
-    """최초 한 번만 기록. 이후 호출해도 덮어쓰지 않음."""
-    hhmm = hhmm or _now_hhmm()
-    att = load_attendance()
+def apply_punch(att: Dict, date_key: str, emp_id: int, field: str, hhmm: str) -> bool:
+    """메모리상 근태에 출근('in')/퇴근('out') 기록. 최초 한 번만 기록하며, 기록했으면 True."""
     day = att.setdefault(date_key, {})
     rec = day.setdefault(str(emp_id), {})
-    if "out" not in rec or not rec["out"]:
-        rec["out"] = hhmm
-        save_attendance(att)
+    if field not in rec or not rec[field]:
+        rec[field] = hhmm
+        return True
+    return False
 
-def adjust_attendance(date_key: str, emp_id: int, in_time: str | None = None, out_time: str | None = None) -> None:
-    """관리자 조정: 전달된 값만 반영. None이면 해당 필드 제거(초기화)."""
-    att = load_attendance()
+def apply_adjust(att: Dict, date_key: str, emp_id: int,
+                 in_time: str | None = None, out_time: str | None = None) -> None:
+    """메모리상 근태 조정. 전달된 값만 반영, ""이면 해당 필드 제거. 빈 레코드/빈 날짜는 삭제."""
     day = att.setdefault(date_key, {})
     rec = day.setdefault(str(emp_id), {})
     if in_time is not None:
@@ -188,4 +242,21 @@ def adjust_attendance(date_key: str, emp_id: int, in_time: str | None = None, ou
     # 그 날도 비면 날짜 삭제
     if not day:
         att.pop(date_key, None)
-    save_attendance(att)
\ No newline at end of file
+
+def punch_in(date_key: str, emp_id: int, hhmm: str | None = None) -> None:
+    """최초 한 번만 기록. 이후 호출해도 덮어쓰지 않음."""
+    att = load_attendance()
+    if apply_punch(att, date_key, emp_id, "in", hhmm or _now_hhmm()):
+        save_attendance(att)
+
+def punch_out(date_key: str, emp_id: int, hhmm: str | None = None) -> None:
+    """최초 한 번만 기록. 이후 호출해도 덮어쓰지 않음."""
+    att = load_attendance()
+    if apply_punch(att, date_key, emp_id, "out", hhmm or _now_hhmm()):
+        save_attendance(att)
+
+def adjust_attendance(date_key: str, emp_id: int, in_time: str | None = None, out_time: str | None = None) -> None:
+    """관리자 조정: 전달된 값만 반영. None이면 해당 필드 제거(초기화)."""
+    att = load_attendance()
+    apply_adjust(att, date_key, emp_id, in_time, out_time)
+    save_attendance(att)
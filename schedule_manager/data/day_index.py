@@ -0,0 +1,82 @@
+# data/day_index.py
+"""
+직원 ID → 그 직원이 들어 있는(OS/HC/휴무) 날짜 키 색인.
+
+저장소가 commit 때마다 바뀐 날짜의 전/후 스냅샷으로 갱신한다(update_day).
+삭제된 직원 정리(compact_tombstones)는 전체 스케줄을 훑지 않고 이 색인으로 해당 날짜만 찾는다.
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Dict, Optional, Set, Tuple
+
+
+def snap_ids(d: Optional[dict]) -> Set[int]:
+    """날짜 스냅샷(dict, None = 없음)에 들어 있는 직원 ID."""
+    if d is None:
+        return set()
+    working = d.get("working") or {}
+    return set(working.get("OS") or []) | set(working.get("HC") or []) | set(d.get("holidays") or [])
+
+
+def slot_of(sch, emp_id) -> Optional[Tuple[str, int]]:
+    """DailySchedule에서 emp_id가 있는 (칸, 위치). 칸 = "OS"/"HC"/"OFF". 없으면 None."""
+    for slot, ids in (("OS", sch.working.get("OS")), ("HC", sch.working.get("HC")), ("OFF", sch.holidays)):
+        if ids and emp_id in ids:
+            return slot, ids.index(emp_id)
+    return None
+
+
+def put_slot(sch, emp_id, slot: str, pos: int) -> bool:
+    """slot_of()로 얻은 자리에 emp_id를 다시 넣는다(이미 어딘가 있으면 그대로). 넣었으면 True."""
+    if slot_of(sch, emp_id) is not None:
+        return False
+    if slot == "OFF":
+        sch.holidays = list(sch.holidays or [])
+        ids = sch.holidays
+    else:
+        ids = sch.working[slot] = list(sch.working.get(slot) or [])
+    ids.insert(min(pos, len(ids)), emp_id)
+    return True
+
+
+def scrub_day(sch, emp_ids: Set[int]) -> bool:
+    """DailySchedule에서 emp_ids를 뺀다(제자리). 뺐으면 True."""
+    os = sch.working.get("OS", []) or []
+    hc = sch.working.get("HC", []) or []
+    h = sch.holidays or []
+    if not any(i in emp_ids for i in os + hc + h):
+        return False
+    sch.working["OS"] = [i for i in os if i not in emp_ids]
+    sch.working["HC"] = [i for i in hc if i not in emp_ids]
+    sch.holidays = [i for i in h if i not in emp_ids]
+    return True
+
+
+class EmployeeDayIndex:
+    def __init__(self):
+        self._days: Dict[int, Set[str]] = defaultdict(set)
+
+    @classmethod
+    def build(cls, snaps: Dict[str, dict]) -> "EmployeeDayIndex":
+        index = cls()
+        for key, d in snaps.items():
+            for emp_id in snap_ids(d):
+                index._days[emp_id].add(key)
+        return index
+
+    def update_day(self, key: str, before: Optional[dict], after: Optional[dict]) -> None:
+        old, new = snap_ids(before), snap_ids(after)
+        for emp_id in old - new:
+            self.discard(emp_id, key)
+        for emp_id in new - old:
+            self._days[emp_id].add(key)
+
+    def discard(self, emp_id, key: str) -> None:
+        keys = self._days.get(emp_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._days[emp_id]
+
+    def days_of(self, emp_id) -> Set[str]:
+        return set(self._days.get(emp_id, ()))
@@ -0,0 +1,132 @@
+# data/history.py
+"""
+편집 기록(실행 취소/다시 실행).
+
+저장소(DataStore)는 commit_* 할 때마다 바뀐 날짜/직원의 '전/후' 스냅샷을 명령(Command)으로 남긴다.
+역연산(inverse)은 전/후를 맞바꾼 명령이므로, 실행 취소 = 역명령 적용, 다시 실행 = 명령 적용.
+스냅샷은 JSON으로 저장되는 형태 그대로의 dict(None = 없음/삭제됨).
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+from schedule_manager.data.data_manager import _emp_to_dict
+
+
+def snap_day(sch) -> dict:
+    """DailySchedule(또는 같은 속성의 객체) → 목록까지 복사한 dict(이후 원본을 고쳐도 안전)."""
+    d = sch.to_dict()
+    working = d.get("working") or {}
+    return {
+        "date": d.get("date"),
+        "working": {"OS": list(working.get("OS") or []), "HC": list(working.get("HC") or [])},
+        "holidays": list(d.get("holidays") or []),
+        "memo": d.get("memo") or "",
+        "closed": bool(d.get("closed", False)),
+    }
+
+
+def copy_day(d: dict) -> dict:
+    """스냅샷을 다시 꺼내 쓸 때(복원한 객체를 고쳐도 스냅샷은 그대로)."""
+    return {
+        "date": d["date"],
+        "working": {"OS": list(d["working"]["OS"]), "HC": list(d["working"]["HC"])},
+        "holidays": list(d["holidays"]),
+        "memo": d["memo"],
+        "closed": d["closed"],
+    }
+
+
+def snap_employee(e) -> dict:
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in _emp_to_dict(e).items()}
+
+
+@dataclass
+class DayChange:
+    before: Dict[str, Optional[dict]]
+    after: Dict[str, Optional[dict]]
+
+    def inverse(self) -> "DayChange":
+        return DayChange(self.after, self.before)
+
+
+@dataclass
+class EmployeeChange:
+    emp_id: int
+    before: Optional[dict]
+    after: Optional[dict]
+    index: int                 # 목록 위치(삭제를 되돌릴 때 제자리에)
+
+    def inverse(self) -> "EmployeeChange":
+        return EmployeeChange(self.emp_id, self.after, self.before, self.index)
+
+
+@dataclass
+class ScrubChange:
+    """
+    삭제 직원 정리: emp_id를 날짜마다 있던 자리({날짜 키: (칸, 위치)}, 칸 = "OS"/"HC"/"OFF")에서 뺀다.
+    날짜 전체를 스냅샷으로 되돌리지 않고 그 ID만 빼고/다시 넣으므로, 정리 뒤의 다른 편집(메모 등)을
+    먼저 실행 취소했어도 삭제를 실행 취소할 때 그 편집이 되살아나지 않는다.
+    """
+    emp_id: int
+    slots: Dict[str, Tuple[str, int]]
+    restore: bool = False      # True = 역연산(제자리에 다시 넣기)
+
+    def inverse(self) -> "ScrubChange":
+        return ScrubChange(self.emp_id, self.slots, not self.restore)
+
+
+Change = Union[DayChange, EmployeeChange, ScrubChange]
+
+
+@dataclass
+class Command:
+    label: str
+    parts: List[Change] = field(default_factory=list)
+
+    def inverse(self) -> "Command":
+        # 뒤에 한 것부터 되돌린다
+        return Command(self.label, [p.inverse() for p in reversed(self.parts)])
+
+
+class UndoStack:
+    def __init__(self, limit: int = 200):
+        self.limit = limit
+        self._undo: List[Command] = []
+        self._redo: List[Command] = []
+
+    def push(self, cmd: Command) -> None:
+        self._undo.append(cmd)
+        self._redo.clear()
+        if len(self._undo) > self.limit:
+            del self._undo[0]
+
+    def pop_undo(self) -> Optional[Command]:
+        if not self._undo:
+            return None
+        cmd = self._undo.pop()
+        self._redo.append(cmd)
+        return cmd
+
+    def pop_redo(self) -> Optional[Command]:
+        if not self._redo:
+            return None
+        cmd = self._redo.pop()
+        self._undo.append(cmd)
+        return cmd
+
+    def find_undo(self, pred) -> Optional[Command]:
+        """실행 취소 목록에서 pred를 만족하는 가장 최근 명령(없으면 None)."""
+        return next((cmd for cmd in reversed(self._undo) if pred(cmd)), None)
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    @property
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1].label if self._undo else None
+
+    @property
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1].label if self._redo else None
@@ -0,0 +1,133 @@
+# data/month_agg.py
+"""
+월별 집계(연간 보기용): 날짜마다 (OS 인원, HC 인원, 휴무 인원, 휴업) 한 줄 + 달 합계.
+
+저장소가 commit 때마다 바뀐 날짜의 전/후 스냅샷으로 그 날짜 한 줄만 고치고(update_day),
+합계는 그 날짜의 옛 값을 빼고 새 값을 더한다. 연간 보기는 이 집계만 읽는다(날짜 기록을 훑지 않음).
+파일(month_aggregates.json)에는 저장 당시 schedules.json의 스탬프를 같이 남겨서,
+CLI 등이 스케줄 파일을 직접 고친 뒤에는 맞지 않는 집계를 버리고 다시 만든다.
+
+충원 기준: 휴업이 아닌 날은 지점마다 REQUIRED_PER_BRANCH명(기록이 없는 날도 0명 충원으로 센다).
+"""
+from __future__ import annotations
+import calendar
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+REQUIRED_PER_BRANCH = 2
+BRANCHES = ("OS", "HC")
+AGG_VERSION = 1
+
+DayStats = Tuple[int, int, int, bool]   # (OS 인원, HC 인원, 휴무 인원, 휴업)
+
+
+def day_stats(d: Optional[dict]) -> Optional[DayStats]:
+    """날짜 스냅샷(dict, None = 없음) → 집계 한 줄."""
+    if d is None:
+        return None
+    working = d.get("working") or {}
+    return (len(working.get("OS") or []), len(working.get("HC") or []),
+            len(d.get("holidays") or []), bool(d.get("closed")))
+
+
+def filled(stats: DayStats) -> int:
+    """지점별 필요 인원까지만 센 충원 수(초과 인원은 다른 지점 빈자리를 메우지 않음)."""
+    return sum(min(n, REQUIRED_PER_BRANCH) for n in stats[:2])
+
+
+@dataclass
+class MonthAgg:
+    year: int
+    month: int
+    days: Dict[int, DayStats] = field(default_factory=dict)   # 일 → 집계(기록 있는 날만)
+    filled: int = 0            # 휴업 아닌 날의 충원 합(지점별 필요 인원까지만)
+    closed_days: int = 0
+    off_total: int = 0         # 휴무 인원 합(휴업일 제외)
+    full_days: int = 0         # 두 지점 모두 다 채운 날
+
+    @property
+    def days_in_month(self) -> int:
+        return calendar.monthrange(self.year, self.month)[1]
+
+    @property
+    def required(self) -> int:
+        return (self.days_in_month - self.closed_days) * REQUIRED_PER_BRANCH * len(BRANCHES)
+
+    @property
+    def short_days(self) -> int:
+        """휴업 아닌데 덜 채운 날(기록 없는 날 포함)."""
+        return self.days_in_month - self.closed_days - self.full_days
+
+    def get(self, day: int) -> Optional[DayStats]:
+        return self.days.get(day)
+
+    def set_day(self, day: int, stats: Optional[DayStats]) -> None:
+        self._account(self.days.get(day), -1)
+        if stats is None:
+            self.days.pop(day, None)
+        else:
+            self.days[day] = stats
+        self._account(stats, 1)
+
+    def _account(self, stats: Optional[DayStats], sign: int) -> None:
+        if stats is None:
+            return
+        if stats[3]:
+            self.closed_days += sign
+            return
+        n = filled(stats)
+        self.filled += sign * n
+        self.off_total += sign * stats[2]
+        if n == REQUIRED_PER_BRANCH * len(BRANCHES):
+            self.full_days += sign
+
+    def to_dict(self) -> Dict:
+        return {str(day): list(stats) for day, stats in sorted(self.days.items())}
+
+
+class MonthAggregates:
+    def __init__(self):
+        self._months: Dict[Tuple[int, int], MonthAgg] = {}
+
+    @classmethod
+    def build(cls, snaps: Dict[str, dict]) -> "MonthAggregates":
+        aggs = cls()
+        for key, d in snaps.items():
+            aggs.update_day(key, None, d)
+        return aggs
+
+    def update_day(self, key: str, before: Optional[dict], after: Optional[dict]) -> None:
+        stats = day_stats(after)
+        if stats == day_stats(before):
+            return
+        try:
+            y, m, day = int(key[:4]), int(key[5:7]), int(key[8:10])
+        except ValueError:
+            return
+        agg = self._months.get((y, m))
+        if agg is None:
+            if stats is None:
+                return
+            agg = self._months[(y, m)] = MonthAgg(y, m)
+        agg.set_day(day, stats)
+
+    def month(self, year: int, month: int) -> MonthAgg:
+        """기록이 없는 달은 빈 집계(전부 미충원)."""
+        return self._months.get((year, month)) or MonthAgg(year, month)
+
+    def to_dict(self, stamp=None) -> Dict:
+        return {
+            "version": AGG_VERSION,
+            "stamp": stamp,
+            "months": {f"{y:04d}-{m:02d}": agg.to_dict() for (y, m), agg in sorted(self._months.items())
+                       if agg.days},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MonthAggregates":
+        aggs = cls()
+        for ym, days in (data.get("months") or {}).items():
+            agg = aggs._months[(int(ym[:4]), int(ym[5:7]))] = MonthAgg(int(ym[:4]), int(ym[5:7]))
+            for day, (os_n, hc_n, off_n, closed) in days.items():
+                agg.set_day(int(day), (int(os_n), int(hc_n), int(off_n), bool(closed)))
+        return aggs
@@ -3,6 +3,7 @@ import sqlite3
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from .models import Employee, Shift
+from .text_index import grams, make_snippet, normalize, query_words
 
 class Repo:
     def __init__(self, db_path: str = "schedule.sqlite3"):
@@ -37,7 +38,77 @@ class Repo:
         """)
         cur.execute("CREATE INDEX IF NOT EXISTS ix_shifts_emp_date ON shifts(employee_id, date);")
         cur.execute("CREATE INDEX IF NOT EXISTS ix_shifts_date ON shifts(date);")
+        # 메모 전문 검색: 글자 2-gram을 공백으로 이어 넣은 FTS5 표(토크나이저는 공백으로만 자르면 됨).
+        # FTS5 없이 빌드된 SQLite면 LIKE로 대신 찾는다.
+        try:
+            cur.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS memo_fts USING fts5(
+                kind UNINDEXED,              -- 'shift' | 'employee'
+                ref UNINDEXED,               -- shifts.id | employees.id
+                grams
+            );
+            """)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
         self.conn.commit()
+        if self.has_fts:
+            cur.execute("SELECT 1 FROM memo_fts LIMIT 1")
+            if cur.fetchone() is None:
+                self._rebuild_fts()
+
+    # --- 메모 검색 ---
+    def _fts_set(self, kind: str, ref: int, text: Optional[str]):
+        """한 문서만 다시 색인(커밋은 호출한 쪽에서)."""
+        if not self.has_fts:
+            return
+        cur = self.conn.cursor()
+        cur.execute("DELETE FROM memo_fts WHERE kind=? AND ref=?", (kind, ref))
+        if text and text.strip():
+            cur.execute("INSERT INTO memo_fts(kind, ref, grams) VALUES(?,?,?)",
+                        (kind, ref, " ".join(sorted(grams(normalize(text))))))
+
+    def _rebuild_fts(self):
+        cur = self.conn.cursor()
+        cur.execute("DELETE FROM memo_fts")
+        for r in cur.execute("SELECT id, memo FROM shifts WHERE memo IS NOT NULL AND memo != ''").fetchall():
+            self._fts_set("shift", r["id"], r["memo"])
+        for r in cur.execute("SELECT id, notes FROM employees WHERE notes IS NOT NULL AND notes != ''").fetchall():
+            self._fts_set("employee", r["id"], r["notes"])
+        self.conn.commit()
+
+    def search_memos(self, query: str, limit: int = 200) -> List[Dict]:
+        """
+        근무 메모 + 직원 노트 검색. [{"kind", "date", "employee_id", "snippet"}, ...] (최근 날짜부터, 노트는 뒤).
+        FTS5로 2-gram을 모두 가진 행만 고른 뒤 원문에 질의 단어가 실제로 있는지 확인한다.
+        """
+        words = query_words(query)
+        if not words:
+            return []
+        cur = self.conn.cursor()
+        if self.has_fts and all(len(w) > 1 for w in words):
+            match = " AND ".join(f'"{g}"' for g in sorted(set().union(*(grams(w) for w in words))))
+            cur.execute("""
+                SELECT f.kind, s.date, COALESCE(s.employee_id, e.id) AS employee_id,
+                       COALESCE(s.memo, e.notes) AS text
+                FROM memo_fts f
+                LEFT JOIN shifts s ON f.kind='shift' AND s.id=f.ref
+                LEFT JOIN employees e ON f.kind='employee' AND e.id=f.ref
+                WHERE memo_fts MATCH ?
+            """, (f"grams : ({match})",))
+        else:
+            # FTS5가 없거나 한 글자 질의: 첫 단어로 LIKE 후 아래에서 나머지 확인
+            like = f"%{words[0]}%"
+            cur.execute("""
+                SELECT 'shift' AS kind, date, employee_id, memo AS text FROM shifts WHERE memo LIKE ?
+                UNION ALL
+                SELECT 'employee', NULL, id, notes FROM employees WHERE notes LIKE ?
+            """, (like, like))
+        rows = [r for r in cur.fetchall() if r["text"] and all(w in normalize(r["text"]) for w in words)]
+        rows = sorted((r for r in rows if r["kind"] == "shift"), key=lambda r: r["date"], reverse=True) + \
+            [r for r in rows if r["kind"] != "shift"]
+        return [{"kind": r["kind"], "date": r["date"], "employee_id": r["employee_id"],
+                 "snippet": make_snippet(r["text"], words)} for r in rows[:limit]]
 
     # --- Employees ---
     def upsert_employee(self, name: str, store_pref: Optional[str]=None,
@@ -46,8 +117,10 @@ class Repo:
         # 단순: 이름 unique 가정 안 함(동명이인 허용). 필요시 UNIQUE(name) 추가.
         cur.execute("INSERT INTO employees(name, store_pref, fixed_off, notes) VALUES(?,?,?,?)",
                     (name, store_pref, fixed_off, notes))
+        emp_id = cur.lastrowid
+        self._fts_set("employee", emp_id, notes)
         self.conn.commit()
-        return cur.lastrowid
+        return emp_id
 
     def get_employees(self) -> List[Employee]:
         cur = self.conn.cursor()
@@ -67,10 +140,13 @@ class Repo:
             store_id=excluded.store_id,
             memo=COALESCE(excluded.memo, shifts.memo);
         """, (date, employee_id, type_, store_id, memo))
-        self.conn.commit()
         # id 반환 위해 다시 조회
-        cur.execute("SELECT id FROM shifts WHERE date=? AND employee_id=?", (date, employee_id))
-        return cur.fetchone()["id"]
+        cur.execute("SELECT id, memo FROM shifts WHERE date=? AND employee_id=?", (date, employee_id))
+        row = cur.fetchone()
+        if memo is not None:   # 메모를 안 넘기면 기존 메모 유지(COALESCE) → 색인도 그대로
+            self._fts_set("shift", row["id"], row["memo"])
+        self.conn.commit()
+        return row["id"]
 
     def get_employee_month(self, employee_id: int, year: int, month: int) -> Dict[int, Dict]:
         """
@@ -0,0 +1,614 @@
+# data/store.py
+"""
+메모리 데이터 저장소 + 변경 알림.
+
+앱 전체가 get_store()로 같은 저장소 하나를 쓴다(창/다이얼로그마다 파일을 다시 읽지 않음).
+화면들은 디스크를 다시 읽는 대신 이 저장소의 이벤트를 구독해서 바뀐 칸/행만 갱신한다.
+  - day_changed(key)               : 해당 날짜 스케줄이 바뀜(삭제 포함, 삭제면 schedules에 키 없음)
+  - employee_changed(emp_id)       : 해당 직원이 추가/수정/삭제됨(삭제면 employees에 없음)
+  - attendance_changed(key, emp_id): 해당 날짜/직원 근태가 바뀜
+  - reloaded()                     : 디스크에서 전체를 다시 읽음(전체 갱신 필요)
+  - history_changed()              : 실행 취소/다시 실행 목록이 바뀜
+  - dirty()                        : 저장을 미뤄 둔 변경이 생김(defer_saves일 때, flush() 예약용)
+  - compaction_pending()           : 스케줄에서 정리할 삭제 직원(묘비)이 생김(compact_tombstones() 예약용)
+
+편집 흐름: schedules를 직접 수정한 뒤 commit_days(keys) → 저장 + 날짜별 알림 + 실행 취소 기록.
+commit 때 직전 스냅샷과 비교해서 바뀐 날짜/직원만 명령(history.Command)으로 남긴다.
+defer_saves=True(GUI)면 저장은 모아 두었다가 flush() 한 번으로 쓴다(근태 기록은 항상 즉시 저장).
+직원 삭제는 목록에서 빼고 ID를 묘비(tombstones)에 남기는 것까지만 즉시 한다(스케줄은 그대로).
+스케줄 속 그 ID는 읽는 쪽이 직원 목록에 없는 ID로 보고 걸러 내고, compact_tombstones()가 나중에
+직원→날짜 색인(day_index)으로 해당 날짜만 골라 정리한다.
+연간 보기용 월별 집계(month_aggregates())도 commit마다 바뀐 날짜만 고치고, 스케줄을 저장할 때 같이 쓴다.
+GUI는 take_dirty_snapshot()으로 저장할 내용만 받아 작업 스레드에서 쓴다(gui/save_writer.py).
+저장 내용은 commit 때 만든 스냅샷(고치지 않는 dict)이라 다른 스레드에서 읽어도 안전하다.
+쓰기(수정+저장)는 잠금으로 직렬화되고, 알림은 잠금을 푼 뒤 호출한 스레드에서 보낸다
+(화면 구독자는 메인 스레드에서 쓰기를 호출한다는 전제).
+"""
+from __future__ import annotations
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from schedule_manager.data.data_manager import (
+    load_employees, load_schedules, load_tombstones, load_notes, save_notes,
+    load_attendance, save_attendance, apply_punch, apply_adjust, _now_hhmm, write_snapshot,
+    load_month_aggregates
+)
+from schedule_manager.data.day_index import EmployeeDayIndex, scrub_day, slot_of, put_slot, snap_ids
+from schedule_manager.data.month_agg import AGG_VERSION, MonthAggregates
+from schedule_manager.data.text_index import SearchHit, TextIndex
+from schedule_manager.data.history import (
+    Command, DayChange, EmployeeChange, ScrubChange, UndoStack, snap_day, copy_day, snap_employee
+)
+from schedule_manager.models.employee import Employee
+from schedule_manager.utils.hangul import NameIndex
+from schedule_manager.models.schedule import DailySchedule
+
+Listener = Callable[..., None]
+
+
+class DataStore:
+    def __init__(self, employees: Optional[List] = None, schedules: Optional[Dict] = None):
+        self.employees: List = employees if employees is not None else load_employees()
+        self.schedules: Dict = schedules if schedules is not None else load_schedules()
+        self._attendance: Optional[Dict] = None   # 처음 쓸 때 로드
+        self._lock = threading.RLock()
+        self._listeners: Dict[str, List[Listener]] = {
+            "day_changed": [], "employee_changed": [], "attendance_changed": [], "reloaded": [],
+            "history_changed": [], "dirty": [], "compaction_pending": [],
+        }
+        self.history = UndoStack()
+        self._recording: Optional[List] = None   # group() 중이면 여기에 모았다가 명령 하나로
+        self.defer_saves = False
+        self._dirty: set = set()                 # 미뤄 둔 저장: "employees" / "schedules" / "tombstones" / "aggregates"
+        self.tombstones: set = set()             # 삭제했지만 스케줄에서 아직 정리하지 않은 직원 ID
+        self._day_index: Optional[EmployeeDayIndex] = None   # 정리할 때 처음 만들고 이후 commit마다 갱신
+        self._text_index: Optional[TextIndex] = None         # 처음 검색할 때 만들고 이후 commit마다 갱신
+        self._name_index: Optional[NameIndex] = None         # 직원 선택 검색창이 처음 쓸 때 만들고 이후 직원 편집마다 갱신
+        self._aggregates: Optional[MonthAggregates] = None   # 연간 보기가 처음 쓸 때 파일에서 읽거나 만들고 이후 commit마다 갱신
+        self._disk_matches = schedules is None               # schedules가 디스크 내용 그대로(아직 편집 없음)
+        self._load_tombstones()
+        self._take_snapshots()
+
+    # ---- 구독 ----
+    def subscribe(self, event: str, fn: Listener) -> Callable[[], None]:
+        """이벤트 구독. 반환값을 호출하면 구독 해제."""
+        self._listeners[event].append(fn)
+
+        def unsubscribe():
+            try:
+                self._listeners[event].remove(fn)
+            except ValueError:
+                pass
+        return unsubscribe
+
+    def _emit(self, event: str, *args) -> None:
+        for fn in list(self._listeners[event]):
+            fn(*args)
+
+    # ---- 조회 ----
+    def employee(self, emp_id) -> Optional[object]:
+        return next((e for e in self.employees if e.id == emp_id), None)
+
+    def next_employee_id(self) -> int:
+        """새 직원 ID(정리 전인 묘비 ID와도 겹치지 않게)."""
+        return max([e.id for e in self.employees] + list(self.tombstones), default=0) + 1
+
+    @property
+    def attendance(self) -> Dict:
+        if self._attendance is None:
+            with self._lock:
+                if self._attendance is None:
+                    self._attendance = load_attendance()
+        return self._attendance
+
+    # ---- 저장(즉시/미룸) ----
+    def _persist(self, *kinds: str) -> None:
+        """잠금 밖에서 호출. defer_saves면 표시만 하고 dirty 알림, 아니면 바로 저장."""
+        if self.defer_saves:
+            with self._lock:
+                self._dirty.update(kinds)
+            self._emit("dirty")
+            return
+        with self._lock:
+            self._write(kinds)
+
+    def _write(self, kinds: Iterable[str]) -> None:
+        for kind, payload in self._snapshot(kinds).items():
+            write_snapshot(kind, payload)
+
+    def _snapshot(self, kinds: Iterable[str]) -> Dict[str, object]:
+        """잠금 안에서 호출: 마지막 commit 기준 저장 형태(얕은 복사, 값 dict는 고치지 않으므로 공유)."""
+        out: Dict[str, object] = {}
+        if "employees" in kinds:
+            out["employees"] = [self._emp_snap.get(e.id) or snap_employee(e) for e in self.employees]
+        if "schedules" in kinds:
+            out["schedules"] = dict(self._day_snap)
+        if ("schedules" in kinds or "aggregates" in kinds) and self._aggregates is not None:
+            out["aggregates"] = self._aggregates.to_dict()   # schedules 다음에 써야 스탬프가 맞다
+        if "tombstones" in kinds:
+            out["tombstones"] = sorted(self.tombstones)
+        return out
+
+    def take_dirty_snapshot(self) -> Dict[str, object]:
+        """미뤄 둔 저장 내용을 꺼내 간다(dirty 비움). 쓰는 건 받는 쪽 몫."""
+        with self._lock:
+            snap = self._snapshot(self._dirty)
+            self._dirty.clear()
+        return snap
+
+    def mark_dirty(self, *kinds: str) -> None:
+        """저장 실패 등으로 다시 써야 할 때."""
+        self._persist(*kinds)
+
+    def flush(self) -> List[str]:
+        """미뤄 둔 저장을 지금 이 스레드에서 한 번에. 저장한 종류 목록 반환."""
+        with self._lock:
+            kinds = sorted(self._dirty)
+            self._dirty.clear()
+            self._write(kinds)
+        return kinds
+
+    @property
+    def has_unsaved(self) -> bool:
+        return bool(self._dirty)
+
+    # ---- 실행 취소 ----
+    def _take_snapshots(self) -> None:
+        self._day_snap: Dict[str, dict] = {k: snap_day(s) for k, s in self.schedules.items()}
+        self._emp_snap: Dict[int, dict] = {e.id: snap_employee(e) for e in self.employees}
+
+    def _record(self, change, label: str) -> None:
+        if self._recording is not None:
+            self._recording.append(change)
+            return
+        self.history.push(Command(label, [change]))
+        self._emit("history_changed")
+
+    @contextmanager
+    def group(self, label: str):
+        """안에서 일어난 commit들을 실행 취소 한 번(명령 하나)으로 묶는다."""
+        if self._recording is not None:   # 이미 묶는 중이면 바깥 묶음에 합류
+            yield
+            return
+        self._recording = []
+        try:
+            yield
+        finally:
+            parts, self._recording = self._recording, None
+            if parts:
+                self.history.push(Command(label, parts))
+                self._emit("history_changed")
+
+    def undo(self) -> Optional[Command]:
+        cmd = self.history.pop_undo()
+        if cmd is not None:
+            self._apply_command(cmd.inverse())
+            self._emit("history_changed")
+        return cmd
+
+    def redo(self) -> Optional[Command]:
+        cmd = self.history.pop_redo()
+        if cmd is not None:
+            self._apply_command(cmd)
+            self._emit("history_changed")
+        return cmd
+
+    def _apply_command(self, cmd: Command) -> None:
+        """명령의 after 상태로 되돌려 놓고(기록은 남기지 않음) 저장 + 알림."""
+        days: List[str] = []
+        emps: List[int] = []
+        with self._lock:
+            for part in cmd.parts:
+                if isinstance(part, EmployeeChange):
+                    self._restore_employee(part)
+                    self._update_name(part.emp_id)
+                    emps.append(part.emp_id)
+                elif isinstance(part, ScrubChange):
+                    for key, (slot, pos) in part.slots.items():
+                        sch = self.schedules.get(key)
+                        if sch is None:
+                            continue
+                        if (put_slot(sch, part.emp_id, slot, pos) if part.restore
+                                else scrub_day(sch, {part.emp_id})):
+                            self._resnap_day(key)
+                            days.append(key)
+                else:
+                    for key, d in part.after.items():
+                        self._update_indexes(key, self._day_snap.get(key), d)
+                        if d is None:
+                            self.schedules.pop(key, None)
+                            self._day_snap.pop(key, None)
+                        else:
+                            self.schedules[key] = DailySchedule.from_dict(copy_day(d))
+                            self._day_snap[key] = d
+                        days.append(key)
+            ghosts = self._retombstone(days)
+        kinds = ((["employees"] if emps else []) + (["tombstones"] if emps or ghosts else [])
+                 + (["schedules"] if days else []))
+        if kinds:
+            self._persist(*kinds)
+        for emp_id in dict.fromkeys(emps):
+            self._emit("employee_changed", emp_id)
+        for key in dict.fromkeys(days):
+            self._emit("day_changed", key)
+        if (emps or ghosts) and self.tombstones:
+            self._emit("compaction_pending")
+
+    def _resnap_day(self, key: str) -> None:
+        """잠금 안에서 호출: schedules[key]를 제자리에서 고친 뒤 스냅샷/색인만 맞춘다(기록은 남기지 않음)."""
+        new = snap_day(self.schedules[key])
+        self._update_indexes(key, self._day_snap.get(key), new)
+        self._day_snap[key] = new
+
+    def _retombstone(self, keys: Iterable[str]) -> bool:
+        """
+        잠금 안에서 호출: 되돌린 날짜에 직원 목록에 없는 ID가 다시 들어왔으면 묘비에 올린다
+        (이미 정리한 삭제 직원이 그 전 편집의 실행 취소로 돌아온 경우 등). 새로 올렸으면 True.
+        """
+        known = {e.id for e in self.employees}
+        found = set()
+        for key in dict.fromkeys(keys):
+            found |= snap_ids(self._day_snap.get(key))
+        found -= known | self.tombstones
+        self.tombstones |= found
+        return bool(found)
+
+    def _restore_employee(self, change: EmployeeChange) -> None:
+        self.employees[:] = [e for e in self.employees if e.id != change.emp_id]
+        if change.after is None:
+            self._emp_snap.pop(change.emp_id, None)
+            self.tombstones.add(change.emp_id)   # 다시 실행된 삭제: 남은 참조는 정리 대상
+            return
+        self.tombstones.discard(change.emp_id)   # 삭제 취소: 아직 정리 안 된 참조는 그대로 되살아남
+        self.employees.insert(min(change.index, len(self.employees)), Employee(**change.after))
+        self._emp_snap[change.emp_id] = change.after
+
+    def _index_of(self, emp_id) -> int:
+        return next((i for i, e in enumerate(self.employees) if e.id == emp_id), len(self.employees))
+
+    def _record_employee(self, emp_id, label: str) -> None:
+        """잠금 안에서 호출: 스냅샷과 비교해 바뀌었으면 기록하고 스냅샷 갱신."""
+        e = self.employee(emp_id)
+        before = self._emp_snap.get(emp_id)
+        after = snap_employee(e) if e is not None else None
+        self._update_name(emp_id)
+        if before == after:
+            return
+        if after is None:
+            self._emp_snap.pop(emp_id, None)
+        else:
+            self._emp_snap[emp_id] = after
+        self._record(EmployeeChange(emp_id, before, after, self._index_of(emp_id)), label)
+
+    def _load_tombstones(self) -> None:
+        """묘비 목록을 읽고, 직원 파일에 남아 있으면(저장 도중 중단 등) 읽을 때 걸러 낸다."""
+        self.tombstones = set(load_tombstones())
+        if self.tombstones and any(e.id in self.tombstones for e in self.employees):
+            self.employees[:] = [e for e in self.employees if e.id not in self.tombstones]
+
+    def _index(self) -> EmployeeDayIndex:
+        if self._day_index is None:
+            self._day_index = EmployeeDayIndex.build(self._day_snap)
+        return self._day_index
+
+    def _update_indexes(self, key: str, old: Optional[dict], new: Optional[dict]) -> None:
+        """잠금 안에서 호출: 만들어 둔 색인만 이 날짜 변경분으로 고친다."""
+        self._disk_matches = False
+        if self._aggregates is not None:
+            self._aggregates.update_day(key, old, new)
+        if self._day_index is not None:
+            self._day_index.update_day(key, old, new)
+        if self._text_index is not None:
+            memo = (new or {}).get("memo") or ""
+            if memo != ((old or {}).get("memo") or ""):
+                self._text_index.set(("memo", key), memo)
+
+    def _update_name(self, emp_id) -> None:
+        """잠금 안에서 호출: 이름 색인을 만들어 뒀으면 이 직원만 고친다."""
+        if self._name_index is None:
+            return
+        e = self.employee(emp_id)
+        if e is None:
+            self._name_index.remove(emp_id)
+        else:
+            self._name_index.set(emp_id, e.name)
+
+    # ---- 월별 집계 ----
+    def month_aggregates(self) -> MonthAggregates:
+        """
+        연간 보기용 월별 집계. 편집 전이고 저장된 집계가 스케줄 파일과 맞으면 그걸 읽고,
+        아니면 스냅샷으로 한 번 만든 뒤 저장해 둔다(다음 실행부터는 파일에서).
+        """
+        rebuilt = False
+        with self._lock:
+            if self._aggregates is None:
+                data = load_month_aggregates() if self._disk_matches else None
+                if data is not None and data.get("version") == AGG_VERSION:
+                    self._aggregates = MonthAggregates.from_dict(data)
+                else:
+                    self._aggregates = MonthAggregates.build(self._day_snap)
+                    rebuilt = "schedules" not in self._dirty   # 미뤄 둔 스케줄 저장이 있으면 그때 같이 쓴다
+            aggs = self._aggregates
+        if rebuilt:
+            self._persist("aggregates")
+        return aggs
+
+    # ---- 검색 ----
+    def name_index(self) -> NameIndex:
+        """직원 이름 검색 색인(접두/부분/초성). 직원 편집마다 그 직원만 갱신된다."""
+        with self._lock:
+            if self._name_index is None:
+                self._name_index = NameIndex.build(self.employees)
+            return self._name_index
+
+    def search_employees(self, query: str, limit: Optional[int] = None) -> List:
+        """이름 검색 결과 직원 객체(앞에서 걸린 순)."""
+        with self._lock:
+            by_id = {e.id: e for e in self.employees}
+            return [by_id[i] for i in self.name_index().search(query, limit) if i in by_id]
+
+    def search_text(self, query: str, limit: Optional[int] = 200) -> List[SearchHit]:
+        """날짜 메모 + 노트 전문 검색(글자 2-gram 역색인)."""
+        with self._lock:
+            if self._text_index is None:
+                index = TextIndex()
+                for key, d in self._day_snap.items():
+                    if d.get("memo"):
+                        index.set(("memo", key), d["memo"])
+                self._index_notes(index, load_notes())
+                self._text_index = index
+            return self._text_index.search(query, limit)
+
+    @staticmethod
+    def _index_notes(index: TextIndex, text: str) -> None:
+        """노트는 줄 단위 문서. 내용이 같은 줄은 그대로 두고 바뀐 줄/남는 줄만 고친다."""
+        lines = (text or "").splitlines()
+        for i, line in enumerate(lines):
+            index.set(("notes", i), line)
+        for doc in index.docs_of_kind("notes"):
+            if doc[1] >= len(lines):
+                index.remove(doc)
+
+    def save_notes(self, text: str) -> None:
+        save_notes(text)
+        with self._lock:
+            if self._text_index is not None:
+                self._index_notes(self._text_index, text)
+
+    # ---- 전체 ----
+    def reload(self) -> None:
+        """디스크에서 다시 읽되, 목록/딕셔너리 객체는 그대로 두고 내용만 바꾼다(화면이 참조를 들고 있음)."""
+        self.flush()   # 미뤄 둔 편집부터 저장
+        with self._lock:
+            self.employees[:] = load_employees()
+            schedules = load_schedules()
+            self.schedules.clear()
+            self.schedules.update(schedules)
+            if self._attendance is not None:
+                attendance = load_attendance()
+                self._attendance.clear()
+                self._attendance.update(attendance)
+            self._load_tombstones()
+            # 디스크 내용이 기준이 되므로 이전 편집 기록은 버린다
+            self._take_snapshots()
+            self._day_index = None
+            self._text_index = None
+            self._name_index = None
+            self._aggregates = None
+            self._disk_matches = True
+            self.history.clear()
+        self._emit("reloaded")
+        self._emit("history_changed")
+        if self.tombstones:
+            self._emit("compaction_pending")
+
+    def reload_attendance(self) -> List[Tuple[str, int]]:
+        """
+        근태만 디스크에서 다시 읽기(다른 프로그램/터미널이 기록했을 때).
+        이전 내용과 비교해서 바뀐 (날짜, 직원)마다 attendance_changed를 보내고 그 목록을 반환.
+        """
+        with self._lock:
+            changed = self._sync_attendance()
+        for day, emp_id in changed:
+            self._emit("attendance_changed", day, emp_id)
+        return changed
+
+    def _sync_attendance(self) -> List[Tuple[str, int]]:
+        """잠금 안에서 호출: 디스크 근태로 메모리 근태를 맞추고(객체는 그대로) 바뀐 (날짜, 직원) 목록을 돌려준다."""
+        new = load_attendance()
+        old = self.attendance
+        changed = []
+        for day in set(old) | set(new):
+            a, b = old.get(day, {}), new.get(day, {})
+            if a == b:
+                continue
+            for emp in set(a) | set(b):
+                if a.get(emp) != b.get(emp):
+                    changed.append((day, int(emp) if str(emp).isdigit() else emp))
+        old.clear()
+        old.update(new)
+        return changed
+
+    # ---- 스케줄 ----
+    def commit_days(self, keys: Iterable[str], label: str = "일정 편집") -> List[str]:
+        """schedules를 직접 고친 뒤 호출: 실행 취소 기록 + 한 번 저장 + 날짜별 day_changed."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return keys
+        with self._lock:
+            before, after = {}, {}
+            for key in keys:
+                old = self._day_snap.get(key)
+                sch = self.schedules.get(key)
+                new = snap_day(sch) if sch is not None else None
+                if old == new:
+                    continue
+                before[key], after[key] = old, new
+                self._update_indexes(key, old, new)
+                if new is None:
+                    self._day_snap.pop(key, None)
+                else:
+                    self._day_snap[key] = new
+            if after:
+                self._record(DayChange(before, after), label)
+        self._persist("schedules")
+        for key in keys:
+            self._emit("day_changed", key)
+        return keys
+
+    def commit_day(self, key: str, label: str = "일정 편집") -> None:
+        self.commit_days([key], label)
+
+    def delete_day(self, key: str) -> bool:
+        with self._lock:
+            if key not in self.schedules:
+                return False
+            self.schedules.pop(key, None)
+        self.commit_day(key, "일정 삭제")
+        return True
+
+    # ---- 직원 ----
+    def upsert_employee(self, emp) -> None:
+        """같은 ID가 있으면 교체, 없으면 추가. 저장 후 employee_changed."""
+        if emp.id in self.tombstones:
+            self._compact_one(emp.id)   # 같은 ID를 다시 쓰기 전에 옛 참조부터 정리
+        with self._lock:
+            label = "직원 수정" if emp.id in self._emp_snap else "직원 추가"
+            for i, e in enumerate(self.employees):
+                if e.id == emp.id:
+                    self.employees[i] = emp
+                    break
+            else:
+                self.employees.append(emp)
+            self._record_employee(emp.id, label)
+        self._persist("employees")
+        self._emit("employee_changed", emp.id)
+
+    def commit_employee(self, emp_id) -> None:
+        """employees 안의 객체를 직접 고친 뒤 호출."""
+        with self._lock:
+            self._record_employee(emp_id, "직원 수정")
+        self._persist("employees")
+        self._emit("employee_changed", emp_id)
+
+    def remove_employee(self, emp_id) -> bool:
+        """
+        직원 삭제(즉시): 목록에서 빼고 묘비에 남긴다. 스케줄 속 ID는 compact_tombstones()가 나중에 정리.
+        삭제했으면 True.
+        """
+        with self._lock:
+            if self.employee(emp_id) is None:
+                return False
+            index = self._index_of(emp_id)
+            self.employees[:] = [e for e in self.employees if e.id != emp_id]
+            self.tombstones.add(emp_id)
+            self._update_name(emp_id)
+            before = self._emp_snap.pop(emp_id, None)
+            if before is not None:
+                self._record(EmployeeChange(emp_id, before, None, index), "직원 삭제")
+        self._persist("employees", "tombstones")
+        self._emit("employee_changed", emp_id)
+        self._emit("compaction_pending")
+        return True
+
+    def compact_tombstones(self, limit: Optional[int] = None) -> List[str]:
+        """
+        묘비 ID를 스케줄(OS/HC/휴무)에서 정리. 직원→날짜 색인으로 그 ID가 들어 있는 날짜만 고친다.
+        limit이 있으면 그 일수까지만(남으면 묘비 유지 → 다음 호출에서 이어서). 바뀐 날짜 키 반환.
+        """
+        changed: List[str] = []
+        for emp_id in sorted(self.tombstones):
+            budget = None if limit is None else limit - len(changed)
+            if budget is not None and budget <= 0:
+                break
+            changed += self._compact_one(emp_id, budget)
+        return changed
+
+    def _compact_one(self, emp_id, limit: Optional[int] = None) -> List[str]:
+        """
+        묘비 하나 정리. 정리는 날짜마다 그 ID가 있던 자리만 남긴 ScrubChange로 그 직원의 '직원 삭제' 명령에 덧붙인다
+        → 삭제를 실행 취소하면 스케줄 속 ID까지 제자리에 복원(정리 전이든 후든 같은 결과).
+        날짜 스냅샷 전체를 덧붙이지 않으므로 정리 뒤에 한 다른 편집/실행 취소와 순서가 엉키지 않는다.
+        정리 전 상태로 되돌아간 날짜가 다시 그 ID를 가지면 _apply_command가 묘비에 다시 올린다.
+        """
+        with self._lock:
+            index = self._index()
+            keys = sorted(index.days_of(emp_id))
+            done = limit is None or len(keys) <= limit
+            slots = {}
+            for k in (keys if done else keys[:limit]):
+                sch = self.schedules.get(k)
+                slot = slot_of(sch, emp_id) if sch is not None else None
+                if slot is None:
+                    index.discard(emp_id, k)
+                    continue
+                scrub_day(sch, {emp_id})
+                slots[k] = slot
+                self._resnap_day(k)
+            if done:
+                self.tombstones.discard(emp_id)
+            if slots:
+                change = ScrubChange(emp_id, slots)
+                target = self.history.find_undo(
+                    lambda cmd: any(isinstance(p, EmployeeChange) and p.emp_id == emp_id and p.after is None
+                                    for p in cmd.parts))
+                if target is not None:
+                    target.parts.append(change)
+                elif self._recording is not None:
+                    self._recording.append(change)   # 묶는 중이면 그 묶음에
+        kinds = (["schedules"] if slots else []) + (["tombstones"] if done else [])
+        if kinds:
+            self._persist(*kinds)
+        for k in slots:
+            self._emit("day_changed", k)
+        return list(slots)
+
+    # ---- 근태 ----
+    def punch(self, date_key: str, emp_id: int, field: str, hhmm: Optional[str] = None) -> bool:
+        """
+        출근('in')/퇴근('out') 최초 기록. 기록했으면 저장 + attendance_changed.
+        다른 프로그램(CLI 등)이 그사이 쓴 기록을 지우지 않도록 디스크 근태를 다시 읽은 뒤 기록·저장한다.
+        """
+        with self._lock:
+            external = self._sync_attendance()
+            changed = apply_punch(self.attendance, date_key, emp_id, field, hhmm or _now_hhmm())
+            if changed:
+                save_attendance(self.attendance)
+        for day, other in external:
+            self._emit("attendance_changed", day, other)
+        if changed:
+            self._emit("attendance_changed", date_key, emp_id)
+        return changed
+
+    def adjust_attendance(self, date_key: str, emp_id: int,
+                          in_time: Optional[str] = None, out_time: Optional[str] = None) -> None:
+        """관리자 조정(punch와 같이 디스크 근태를 다시 읽은 뒤 반영·저장)."""
+        with self._lock:
+            external = self._sync_attendance()
+            apply_adjust(self.attendance, date_key, emp_id, in_time, out_time)
+            save_attendance(self.attendance)
+        for day, other in external:
+            self._emit("attendance_changed", day, other)
+        self._emit("attendance_changed", date_key, emp_id)
+
+
+_store: Optional[DataStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> DataStore:
+    """앱 전역 저장소(처음 부를 때 디스크에서 한 번 로드)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = DataStore()
+    return _store
+
+
+def reset_store() -> None:
+    """전역 저장소를 버린다(데이터 경로를 바꾼 벤치마크 등에서 다음 get_store()가 새로 로드하도록)."""
+    global _store
+    with _store_lock:
+        _store = None
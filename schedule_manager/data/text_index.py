@@ -0,0 +1,141 @@
+# data/text_index.py
+"""
+날짜 메모/노트 전문 검색용 역색인(글자 2-gram).
+
+한국어는 띄어쓰기/조사 때문에 단어 단위로 자르면 '휴무신청' 안의 '신청'을 못 찾으므로,
+단어(\\w+)마다 글자 2-gram(한 글자 단어는 그 글자)을 토큰으로 쓴다.
+검색: 질의 단어들의 2-gram을 모두 가진 문서만 후보로 뽑고(집합 교집합),
+후보 원문에 질의 단어가 실제로 들어 있는지 확인한 뒤 스니펫을 만든다.
+
+문서 ID는 ("memo", "YYYY-MM-DD") / ("notes", 줄 번호) 처럼 (종류, 키) 튜플.
+set()/remove()는 바뀐 토큰만 고친다(저장 때마다 전체 재색인하지 않음).
+"""
+from __future__ import annotations
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Set
+
+_WORD = re.compile(r"\w+")
+SNIPPET_RADIUS = 20
+
+
+def normalize(text: str) -> str:
+    return (text or "").casefold()
+
+
+def query_words(query: str) -> List[str]:
+    return _WORD.findall(normalize(query))
+
+
+def grams(text: str) -> Set[str]:
+    """정규화된 텍스트 → 토큰 집합(단어별 2-gram, 한 글자 단어는 그대로)."""
+    out: Set[str] = set()
+    for word in _WORD.findall(text):
+        if len(word) == 1:
+            out.add(word)
+        else:
+            out.update(word[i:i + 2] for i in range(len(word) - 1))
+    return out
+
+
+def make_snippet(text: str, words: List[str], radius: int = SNIPPET_RADIUS) -> str:
+    """첫 일치 위치 앞뒤 radius 글자(한 줄로)."""
+    flat = " ".join((text or "").split())
+    low = flat.casefold()
+    pos = min((p for p in (low.find(w) for w in words) if p >= 0), default=0)
+    start = max(0, pos - radius)
+    end = min(len(flat), pos + radius + max((len(w) for w in words), default=0))
+    return ("…" if start > 0 else "") + flat[start:end] + ("…" if end < len(flat) else "")
+
+
+@dataclass
+class SearchHit:
+    kind: str          # "memo" | "notes"
+    key: object        # 날짜 키 / 노트 줄 번호(0부터)
+    snippet: str
+
+    @property
+    def label(self) -> str:
+        return self.key if self.kind == "memo" else f"노트 {self.key + 1}행"
+
+
+class TextIndex:
+    def __init__(self):
+        self._text: Dict[Hashable, str] = {}        # 문서 → 정규화된 원문
+        self._raw: Dict[Hashable, str] = {}         # 문서 → 원문(스니펫용)
+        self._grams: Dict[Hashable, Set[str]] = {}  # 문서 → 토큰
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    def set(self, doc: Hashable, text: str) -> None:
+        """문서 추가/교체(빈 문자열이면 삭제)."""
+        if not (text or "").strip():
+            self.remove(doc)
+            return
+        if self._raw.get(doc) == text:
+            return
+        norm = normalize(text)
+        new = grams(norm)
+        old = self._grams.get(doc, set())
+        for g in old - new:
+            self._drop(g, doc)
+        for g in new - old:
+            self._postings[g].add(doc)
+        self._text[doc], self._raw[doc], self._grams[doc] = norm, text, new
+
+    def remove(self, doc: Hashable) -> None:
+        for g in self._grams.pop(doc, ()):
+            self._drop(g, doc)
+        self._text.pop(doc, None)
+        self._raw.pop(doc, None)
+
+    def _drop(self, g: str, doc: Hashable) -> None:
+        docs = self._postings.get(g)
+        if docs is not None:
+            docs.discard(doc)
+            if not docs:
+                del self._postings[g]
+
+    def docs_of_kind(self, kind: str) -> List[Hashable]:
+        return [d for d in self._text if d[0] == kind]
+
+    def _candidates(self, word: str) -> Set[Hashable]:
+        if len(word) == 1:
+            # 한 글자: 그 글자가 든 토큰 전부(토큰 종류 수만큼만 훑음)
+            out: Set[Hashable] = set()
+            for g, docs in self._postings.items():
+                if word in g:
+                    out |= docs
+            return out
+        sets = [self._postings.get(g) for g in grams(word)]
+        if not sets or any(s is None for s in sets):
+            return set()
+        sets.sort(key=len)
+        out = set(sets[0])
+        for s in sets[1:]:
+            out &= s
+            if not out:
+                break
+        return out
+
+    def search(self, query: str, limit: Optional[int] = 200) -> List[SearchHit]:
+        """모든 질의 단어가 들어 있는 문서. 노트 먼저(줄 순), 메모는 최근 날짜부터."""
+        words = query_words(query)
+        if not words:
+            return []
+        cand: Optional[Set[Hashable]] = None
+        for w in sorted(words, key=len, reverse=True):   # 긴 단어가 보통 더 좁다
+            c = self._candidates(w)
+            cand = c if cand is None else cand & c
+            if not cand:
+                return []
+        hits = [d for d in cand if all(w in self._text[d] for w in words)]
+        hits = (sorted(d for d in hits if d[0] == "notes")
+                + sorted((d for d in hits if d[0] != "notes"), reverse=True))
+        if limit is not None:
+            hits = hits[:limit]
+        return [SearchHit(d[0], d[1], make_snippet(self._raw[d], words)) for d in hits]
+
@@ -1,12 +1,12 @@
 # gui/bulk_editor.py
 import calendar
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QDateEdit, QLineEdit, QCheckBox,
-    QRadioButton, QPushButton, QMessageBox, QButtonGroup
+    QRadioButton, QPushButton, QMessageBox, QButtonGroup, QSpinBox
 )
 from PySide6.QtCore import QDate
-from schedule_manager.models.schedule import DailySchedule
+from schedule_manager.logic.range_ops import RangeEditor
 
 class BulkEditorDialog(QDialog):
     """
@@ -15,13 +15,17 @@ class BulkEditorDialog(QDialog):
       - 내용 비우기(근무/휴무/메모 초기화, 휴업 해제)
       - 휴업 설정
       - 휴업 해제
+      - 주 배정 복사(시작일부터 7일의 근무/휴무/휴업 → 이후 N주)
+      - 기간 이동(기간 전체를 K일 뒤/앞으로)
       - 메모 일괄 설정(선택)
+    작업은 RangeEditor로 한 번에 계산하고, 실제로 바뀐 날짜만 반영한다(저장/실행 취소 1회).
     """
     def __init__(self, parent, year: int, month: int, schedules: dict):
         super().__init__(parent)
         self.setWindowTitle("일정 일괄 편집")
         self.schedules = schedules
         self.changed = False
+        self.changed_keys = []  # 실제로 바뀐 날짜 키(저장소 알림용)
 
         v = QVBoxLayout(self)
 
@@ -55,11 +59,29 @@ class BulkEditorDialog(QDialog):
         self.rb_clear  = QRadioButton("내용 비우기(근무/휴무/메모 초기화, 휴업 해제)")
         self.rb_close  = QRadioButton("휴업 설정")
         self.rb_open   = QRadioButton("휴업 해제")
+        self.rb_copy   = QRadioButton("주 배정 복사(시작일부터 7일 → 이후 N주)")
+        self.rb_shift  = QRadioButton("기간 이동(기간 전체를 K일 옮김, 음수면 앞으로)")
         self.rb_clear.setChecked(True)
         for rb in (self.rb_delete, self.rb_clear, self.rb_close, self.rb_open):
             self.grp.addButton(rb)
             v.addWidget(rb)
 
+        row_copy = QHBoxLayout()
+        self.grp.addButton(self.rb_copy)
+        row_copy.addWidget(self.rb_copy)
+        self.spin_weeks = QSpinBox(); self.spin_weeks.setRange(1, 52); self.spin_weeks.setValue(4)
+        self.spin_weeks.setSuffix("주")
+        row_copy.addWidget(self.spin_weeks); row_copy.addStretch(1)
+        v.addLayout(row_copy)
+
+        row_shift = QHBoxLayout()
+        self.grp.addButton(self.rb_shift)
+        row_shift.addWidget(self.rb_shift)
+        self.spin_shift = QSpinBox(); self.spin_shift.setRange(-366, 366); self.spin_shift.setValue(7)
+        self.spin_shift.setSuffix("일")
+        row_shift.addWidget(self.spin_shift); row_shift.addStretch(1)
+        v.addLayout(row_shift)
+
         # 메모 일괄 설정(선택)
         self.memo_input = QLineEdit()
         self.memo_input.setPlaceholderText("선택 입력: 모든 날짜에 동일 메모 설정")
@@ -80,12 +102,6 @@ class BulkEditorDialog(QDialog):
     def qd_to_py(self, qd: QDate) -> date:
         return date(qd.year(), qd.month(), qd.day())
 
-    def iter_range(self, start: date, end: date):
-        d = start
-        while d <= end:
-            yield d
-            d = d + timedelta(days=1)
-
     def set_week_range(self):
         # start_edit의 주(일~토)로 잡기
         base = self.qd_to_py(self.start_edit.date())
@@ -111,37 +127,24 @@ class BulkEditorDialog(QDialog):
             return
 
         memo = self.memo_input.text().strip()
-        do_delete = self.rb_delete.isChecked()
-        do_clear = self.rb_clear.isChecked()
-        do_close = self.rb_close.isChecked()
-        do_open  = self.rb_open.isChecked()
-
-        count = 0
-        for d in self.iter_range(sd, ed):
-            key = d.strftime("%Y-%m-%d")
-            if do_delete:
-                if key in self.schedules:
-                    self.schedules.pop(key, None)
-                    count += 1
-                continue
-
-            sch = self.schedules.get(key) or DailySchedule(key)
-            if do_clear:
-                sch.working["OS"] = []
-                sch.working["HC"] = []
-                sch.holidays = []
-                sch.memo = ""
-                sch.closed = False
-            if do_close:
-                sch.closed = True
-            if do_open:
-                sch.closed = False
-            if memo:
-                sch.memo = memo
-
-            self.schedules[key] = sch
-            count += 1
-
-        self.changed = True
-        QMessageBox.information(self, "완료", f"{count}건 처리되었습니다.")
+        ops = RangeEditor(self.schedules)
+        if self.rb_delete.isChecked():
+            ops.delete(sd, ed)
+        elif self.rb_clear.isChecked():
+            ops.clear(sd, ed)
+        elif self.rb_close.isChecked():
+            ops.set_closed(sd, ed, True)
+        elif self.rb_open.isChecked():
+            ops.set_closed(sd, ed, False)
+        elif self.rb_copy.isChecked():
+            ops.copy_week(sd, self.spin_weeks.value())
+        elif self.rb_shift.isChecked():
+            ops.shift(sd, ed, self.spin_shift.value())
+        if memo and not self.rb_delete.isChecked():
+            ops.set_memo(sd, ed, memo)
+
+        changes = ops.result()
+        self.changed_keys = changes.apply(self.schedules)
+        self.changed = bool(self.changed_keys)
+        QMessageBox.information(self, "완료", f"{len(changes)}건 처리되었습니다.")
         self.accept()
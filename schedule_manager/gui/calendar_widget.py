@@ -1,8 +1,227 @@
 # gui/calendar_widget.py
 import calendar
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel, QTextEdit, QFrame, QMenu, QHBoxLayout
-from PySide6.QtCore import Qt, QPoint
-from PySide6.QtGui import QTextCursor, QTextBlockFormat, QCursor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QTableView, QStyledItemDelegate, QStyle, QMenu,
+    QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QCursor
+
+COLS = 7
+WEEKDAYS = ("일", "월", "화", "수", "목", "금", "토")
+CellRole = Qt.UserRole + 1      # DayCell 또는 None(빈 칸)
+LINE_HEIGHT = 1.35              # 줄간격 135%
+PAD = 4
+
+
+@dataclass
+class DayCell:
+    """달력 한 칸에 그릴 내용(이미 이름으로 풀어 둔 줄 목록)."""
+    day: int
+    key: str
+    lines: List[str] = field(default_factory=list)
+    memo: str = ""
+    # (폭, 말줄임 적용된 줄) — 크기가 그대로면 다시 계산하지 않음
+    elided: Optional[Tuple[int, List[str]]] = field(default=None, repr=False, compare=False)
+
+
+def day_lines(sch, id_to_name: Dict) -> Tuple[List[str], str]:
+    """스케줄 하루 → (표시 줄 목록, 메모). 기존 셀 텍스트와 같은 형식."""
+    if not sch:
+        return [], ""
+
+    def ids_to_names(id_list):
+        if not id_list:
+            return []
+        # 직원 목록에 없는 ID(삭제 후 아직 정리되지 않은 참조)는 보여 주지 않는다
+        return [id_to_name[i] for i in id_list if i in id_to_name]
+
+    content = []
+    if getattr(sch, "closed", False):
+        content.append("[휴업]")
+    a = ids_to_names(sch.working.get('OS', []))
+    b = ids_to_names(sch.working.get('HC', []))
+    h = ids_to_names(getattr(sch, "holidays", []))
+    if a: content.append("OS: " + ", ".join(a))
+    if b: content.append("HC: " + ", ".join(b))
+    if h: content.append("휴: " + ", ".join(h))
+    memo = getattr(sch, "memo", "") or ""
+    if memo:
+        content.append(f"메모: {memo}")
+    return content, memo
+
+
+@dataclass
+class MonthView:
+    """
+    한 달치 미리 계산된 화면 데이터(위젯 무관, 작업 스레드에서 만들어도 됨).
+      cells : 주 x 요일 평탄 리스트(DayCell / 빈 칸 None)
+      pos   : 날짜 키 → (행, 열)
+      status: 직원 ID → {일: 'OS'|'HC'|'OFF'} (직원별 달력용)
+    """
+    year: int
+    month: int
+    cells: List[Optional[DayCell]]
+    pos: Dict[str, Tuple[int, int]]
+    id_to_name: Dict
+    status: Dict[int, Dict[int, str]]
+    version: int = 0
+
+
+def prepare_month(year, month, employees, schedules, version: int = 0) -> MonthView:
+    id_to_name = {getattr(e, "id"): getattr(e, "name") for e in (employees or [])}
+    weeks = calendar.Calendar(firstweekday=6).monthdayscalendar(year, month)  # Sunday
+    cells, pos = [], {}
+    status: Dict[int, Dict[int, str]] = {}
+    for r, week in enumerate(weeks):
+        for c, day in enumerate(week):
+            if day == 0:
+                cells.append(None)
+                continue
+            key = f"{year:04d}-{month:02d}-{day:02d}"
+            sch = schedules.get(key)
+            lines, memo = day_lines(sch, id_to_name)
+            cells.append(DayCell(day, key, lines, memo))
+            pos[key] = (r, c)
+            if sch:
+                # 휴무가 근무보다 우선(get_emp_status와 같은 규칙)
+                for b in ("HC", "OS"):
+                    for i in sch.working.get(b, []) or []:
+                        status.setdefault(i, {})[day] = b
+                for i in getattr(sch, "holidays", None) or []:
+                    status.setdefault(i, {})[day] = "OFF"
+    return MonthView(year, month, cells, pos, id_to_name, status, version)
+
+
+class MonthModel(QAbstractTableModel):
+    """주(행) x 요일(열). 칸 데이터는 DayCell(해당 월이 아닌 칸은 None)."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.year = 0
+        self.month = 0
+        self._cells: List[Optional[DayCell]] = []
+        self._pos: Dict[str, Tuple[int, int]] = {}
+        self._id_to_name: Dict = {}
+
+    # ---- Qt 모델 ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cells) // COLS
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else COLS
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return WEEKDAYS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cell = self._cells[index.row() * COLS + index.column()]
+        if role == CellRole:
+            return cell
+        if cell is None:
+            return None
+        if role == Qt.DisplayRole:
+            return "\n".join(cell.lines)
+        if role == Qt.ToolTipRole:
+            # 칸이 좁아 잘린 줄도 툴팁으로 전부 볼 수 있게
+            return "\n".join(cell.lines) or None
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+    # ---- 갱신 ----
+    def set_month(self, year, month, employees, schedules):
+        self.set_view(prepare_month(year, month, employees, schedules))
+
+    def set_view(self, view: MonthView):
+        """미리 계산된 MonthView로 교체(칸 리스트는 복사해서 캐시 원본과 분리)."""
+        cells = list(view.cells)
+        same_shape = len(cells) == len(self._cells)
+        if not same_shape:
+            self.beginResetModel()
+        self.year, self.month = view.year, view.month
+        self._cells, self._pos = cells, dict(view.pos)
+        self._id_to_name = view.id_to_name
+        if same_shape:
+            # 행 수가 같으면 리셋 없이 전체 dataChanged(뷰 지오메트리 유지)
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, COLS - 1))
+        else:
+            self.endResetModel()
+
+    def update_day(self, key: str, sch) -> bool:
+        """한 날짜만 다시 계산하고 그 칸만 dataChanged. 현재 달이 아니면 False."""
+        rc = self._pos.get(key)
+        if rc is None:
+            return False
+        r, c = rc
+        lines, memo = day_lines(sch, self._id_to_name)
+        self._cells[r * COLS + c] = DayCell(int(key[-2:]), key, lines, memo)
+        idx = self.index(r, c)
+        self.dataChanged.emit(idx, idx)
+        return True
+
+    def update_employee(self, emp_id, employees, schedules) -> int:
+        """직원 이름이 바뀌었을 때 그 직원이 들어간 칸만 다시 계산. 갱신한 칸 수 반환."""
+        self._id_to_name = {getattr(e, "id"): getattr(e, "name") for e in (employees or [])}
+        n = 0
+        for key in self._pos:
+            sch = schedules.get(key)
+            if not sch:
+                continue
+            if (emp_id in (sch.working.get("OS") or []) or emp_id in (sch.working.get("HC") or [])
+                    or emp_id in (getattr(sch, "holidays", None) or [])):
+                self.update_day(key, sch)
+                n += 1
+        return n
+
+    def index_for_key(self, key: str) -> QModelIndex:
+        rc = self._pos.get(key)
+        return self.index(*rc) if rc else QModelIndex()
+
+
+class DayDelegate(QStyledItemDelegate):
+    """날짜/메모 아이콘 헤더 + 본문 줄들을 직접 그린다(칸마다 위젯 없음)."""
+    def paint(self, painter, option, index):
+        cell = index.data(CellRole)
+        painter.save()
+        if option.state & QStyle.State_MouseOver and cell is not None:
+            painter.fillRect(option.rect, option.palette.alternateBase())
+        if cell is None:
+            painter.restore()
+            return
+
+        rect = option.rect.adjusted(PAD, PAD, -PAD, -PAD)
+        fm = option.fontMetrics
+        painter.setPen(option.palette.color(option.palette.ColorRole.Text))
+
+        # ------- 헤더(우측 정렬: 메모 아이콘 + 날짜) -------
+        header = str(cell.day)
+        if cell.memo:
+            header = "📝 " + header
+        painter.drawText(rect, Qt.AlignTop | Qt.AlignRight, header)
+
+        # ------- 내용 -------
+        width = rect.width()
+        if cell.elided is None or cell.elided[0] != width:
+            cell.elided = (width, [fm.elidedText(line, Qt.ElideRight, width) for line in cell.lines])
+        step = int(fm.lineSpacing() * LINE_HEIGHT)
+        x = rect.left()
+        top = rect.top() + step + PAD
+        bottom = rect.bottom() + 1 - fm.descent()
+        for i, text in enumerate(cell.elided[1]):
+            baseline = top + i * step + fm.ascent()
+            if baseline > bottom:
+                break
+            painter.drawText(x, baseline, text)
+        painter.restore()
+
 
 class CalendarWidget(QWidget):
     def __init__(self, on_day_open, on_day_delete=None):
@@ -10,131 +229,59 @@ class CalendarWidget(QWidget):
         self.on_day_open = on_day_open
         self.on_day_delete = on_day_delete
         self.vbox = QVBoxLayout(self)
+        self.vbox.setContentsMargins(0, 0, 0, 0)
 
-        header = QGridLayout()
-        self.vbox.addLayout(header)
-        weekdays = ("일","월","화","수","목","금","토")
-        for c, w in enumerate(weekdays):
-            lbl = QLabel(w); lbl.setAlignment(Qt.AlignCenter)
-            header.addWidget(lbl, 0, c)
+        self.model = MonthModel(self)
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(DayDelegate(self.view))
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.view.setFocusPolicy(Qt.NoFocus)
+        self.view.setMouseTracking(True)
+        self.view.setWordWrap(False)
+        self.view.verticalHeader().setVisible(False)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.vbox.addWidget(self.view)
 
-        self.grid = QGridLayout()
-        self.vbox.addLayout(self.grid)
-
-    def clear_grid(self):
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
+        # 더블클릭 → 편집
+        self.view.doubleClicked.connect(self._open_index)
+        # 우클릭 → 해당 일정 삭제
+        self.view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.view.customContextMenuRequested.connect(self._ctx_menu)
 
     def render_month(self, year, month, employees, schedules):
-        self.clear_grid()
-        cal = calendar.Calendar(firstweekday=6)  # Sunday
-        weeks = cal.monthdayscalendar(year, month)
-
-        # ID → 이름 매핑
-        id_to_name = {getattr(e, "id"): getattr(e, "name") for e in (employees or [])}
-
-        def ids_to_names(id_list):
-            if not id_list:
-                return []
-            return [id_to_name.get(i, str(i)) for i in id_list]
-
-        for r, week in enumerate(weeks):
-            for c, day in enumerate(week):
-                cell = QFrame()
-                cell.setFrameShape(QFrame.StyledPanel)
-                v = QVBoxLayout(cell)
-                v.setSpacing(6)
-
-                if day == 0:
-                    self.grid.addWidget(cell, r, c)
-                    continue
-
-                # ------- 헤더(날짜 + 메모 아이콘) -------
-                hdr = QHBoxLayout()
-                hdr.setContentsMargins(0, 0, 0, 0)
-                hdr.setSpacing(4)
-
-                # 메모 아이콘(기본 숨김)
-                memo_icon = QLabel("📝")
-                memo_icon.setVisible(False)
-                memo_icon.setAlignment(Qt.AlignTop | Qt.AlignRight)
-
-                day_lbl = QLabel(str(day))
-                day_lbl.setAlignment(Qt.AlignTop | Qt.AlignRight)
-
-                # 우측 정렬: 스트레치 먼저, 그 다음 아이콘/날짜
-                hdr.addStretch(1)
-                hdr.addWidget(memo_icon)
-                hdr.addWidget(day_lbl)
-                v.addLayout(hdr)
-
-                # ------- 내용 -------
-                key = f"{year:04d}-{month:02d}-{day:02d}"
-                sch = schedules.get(key)
-                text = QTextEdit()
-                text.setReadOnly(True)
-                text.setTextInteractionFlags(Qt.NoTextInteraction)  # 마우스로 선택 불가
-                text.setFocusPolicy(Qt.NoFocus)                     # 포커스 안 받게
-                text.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-                text.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-                text.setContextMenuPolicy(Qt.NoContextMenu)
-
-                content = []
-                memo = ""
-                if sch:
-                    if getattr(sch, "closed", False):
-                        content.append("[휴업]")
-                    a = ids_to_names(sch.working.get('OS', []))
-                    b = ids_to_names(sch.working.get('HC', []))
-                    h = ids_to_names(getattr(sch, "holidays", []))
-                    if a: content.append("OS: " + ", ".join(a))
-                    if b: content.append("HC: " + ", ".join(b))
-                    if h: content.append("휴: " + ", ".join(h))
-                    memo = getattr(sch, "memo", "") or ""
-                    if memo:
-                        content.append(f"메모: {memo}")
-
-                # 메모가 있으면 아이콘 표시 + 툴팁에 메모 노출
-                if memo:
-                    memo_icon.setVisible(True)
-                    memo_icon.setToolTip(memo)
-
-                text.setPlainText("\n".join(content))
-                v.addWidget(text)
-
-                # 줄간격 135%
-                cur = text.textCursor()
-                cur.select(QTextCursor.Document)
-                fmt = QTextBlockFormat()
-                try:
-                    fmt.setLineHeight(135.0, QTextBlockFormat.LineHeightTypes.ProportionalHeight)
-                except TypeError:
-                    fmt.setLineHeight(135.0, QTextBlockFormat.LineHeightTypes.ProportionalHeight.value)
-                cur.mergeBlockFormat(fmt)
-                cur.clearSelection()
-                cur.movePosition(QTextCursor.Start)
-                text.setTextCursor(cur)
-
-                # 더블클릭 → 편집
-                def open_editor(_=None, y=year, m=month, d=day):
-                    self.on_day_open(y, m, d)
-                cell.mouseDoubleClickEvent = lambda ev, fn=open_editor: fn()
-
-                # 우클릭 → 해당 일정 삭제
-                def ctx_menu(point: QPoint, y=year, m=month, d=day):
-                    if not self.on_day_delete:
-                        return
-                    menu = QMenu(self)
-                    act_del = menu.addAction("해당 일정 삭제")
-                    # 마우스 현재 위치에 표시
-                    act = menu.exec(QCursor.pos())
-                    if act == act_del:
-                        self.on_day_delete(f"{y:04d}-{m:02d}-{d:02d}")
-
-                cell.setContextMenuPolicy(Qt.CustomContextMenu)
-                cell.customContextMenuRequested.connect(ctx_menu)
-
-                self.grid.addWidget(cell, r, c)
+        self.model.set_month(year, month, employees, schedules)
+
+    def show_view(self, view: MonthView):
+        """prepare_month로 미리 만든 달 데이터를 그대로 표시(월 이동 캐시용)."""
+        self.model.set_view(view)
+
+    def update_day(self, key: str, sch) -> bool:
+        """한 날짜 칸만 갱신(삭제된 날이면 sch=None)."""
+        return self.model.update_day(key, sch)
+
+    def update_employee(self, emp_id, employees, schedules) -> int:
+        """직원 정보가 바뀌면 그 직원이 보이는 칸만 갱신."""
+        return self.model.update_employee(emp_id, employees, schedules)
+
+    def _open_index(self, index):
+        cell = index.data(CellRole)
+        if cell is not None:
+            self.on_day_open(self.model.year, self.model.month, cell.day)
+
+    def _ctx_menu(self, point):
+        if not self.on_day_delete:
+            return
+        cell = self.view.indexAt(point).data(CellRole)
+        if cell is None:
+            return
+        menu = QMenu(self)
+        act_del = menu.addAction("해당 일정 삭제")
+        # 마우스 현재 위치에 표시
+        act = menu.exec(QCursor.pos())
+        if act == act_del:
+            self.on_day_delete(cell.key)
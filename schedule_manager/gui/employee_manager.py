@@ -1,12 +1,13 @@
 # gui/employee_manager.py
 from PySide6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
-    QPushButton, QTableWidget, QTableWidgetItem, QMessageBox, QCheckBox, QSpinBox,
+    QPushButton, QMessageBox, QCheckBox, QSpinBox,
     QSizePolicy, QGroupBox, QGridLayout
 )
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QAbstractItemView
-from schedule_manager.data.data_manager import load_employees, save_employees
+from schedule_manager.data.store import get_store
+from schedule_manager.gui.employee_table import (
+    Column, EmployeeTableModel, EmpIdRole, make_employee_view, current_emp_id, is_cook
+)
 
 ROLE_OPTIONS = ["사장", "매니저", "직원"]
 BRANCH_OPTIONS = ["OS", "HC"]
@@ -19,17 +20,32 @@ class EmployeeManagerDialog(QDialog):
     좌측: 직원 테이블
     우측: 편집 패널(이름/직급/숙련/지점/고정휴무/주간최소·최대근무)
     """
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store=None):
         super().__init__(parent)
         self.setWindowTitle("직원 관리")
         self.resize(980, 620)
 
-        self._employees = load_employees()
+        # 앱 저장소의 직원 목록을 그대로 쓴다(저장/알림도 저장소를 거침)
+        self.store = store or get_store()
         self._editing_id = None
         self._build_ui()
         self._load_table()
 
         self.changed = False
+        self._unsubs = [
+            self.store.subscribe("employee_changed", self.model.employee_changed),
+            self.store.subscribe("reloaded", self._load_table),
+        ]
+        self.finished.connect(self._detach_store)
+
+    @property
+    def _employees(self):
+        return self.store.employees
+
+    def _detach_store(self, *_):
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
 
     # ---------- UI ----------
     def _build_ui(self):
@@ -37,13 +53,25 @@ class EmployeeManagerDialog(QDialog):
 
         # 좌: 직원 표
         left = QVBoxLayout()
-        left.addWidget(QLabel("직원 목록"))
-
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["ID", "이름", "직급", "숙련", "지점", "고정휴무"])
+        head = QHBoxLayout()
+        head.addWidget(QLabel("직원 목록"))
+        head.addStretch(1)
+        self.txt_search = QLineEdit()
+        self.txt_search.setPlaceholderText("검색(이름/직급/지점…)")
+        self.txt_search.setClearButtonEnabled(True)
+        head.addWidget(self.txt_search)
+        left.addLayout(head)
+
+        self.model = EmployeeTableModel(self._employees, [
+            Column("ID", lambda e: str(e.id), sort=lambda e: e.id),
+            Column("이름", lambda e: e.name),
+            Column("직급", lambda e: e.role),
+            Column("숙련", lambda e: "조리" if is_cook(e) else "비조리"),
+            Column("지점", lambda e: e.home_branch),
+            Column("고정휴무", lambda e: ",".join(str(x) for x in (e.fixed_holidays or []))),
+        ], self)
+        self.table, self.proxy = make_employee_view(self.model, self)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         left.addWidget(self.table)
 
         btn_row = QHBoxLayout()
@@ -127,8 +155,9 @@ class EmployeeManagerDialog(QDialog):
         root.addLayout(right, 4)
 
         # 시그널
-        self.table.cellDoubleClicked.connect(self._on_edit_from_table)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.doubleClicked.connect(self._on_edit_from_table)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.txt_search.textChanged.connect(self.proxy.setFilterFixedString)
         self.btn_add.clicked.connect(self._on_new_clicked)
         self.btn_edit.clicked.connect(self._on_edit_clicked)
         self.btn_del.clicked.connect(self._on_delete_clicked)
@@ -138,29 +167,16 @@ class EmployeeManagerDialog(QDialog):
 
     # ---------- 데이터 로드/표시 ----------
     def _load_table(self):
-        self.table.setRowCount(0)
-        for e in self._employees:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            fixed = ",".join(str(x) for x in (e.fixed_holidays or []))
-            skill_label = "조리" if getattr(e, "skill_level", "") in ("C", "cook") else "비조리"
-            self.table.setItem(r, 0, QTableWidgetItem(str(e.id)))
-            self.table.setItem(r, 1, QTableWidgetItem(e.name))
-            self.table.setItem(r, 2, QTableWidgetItem(e.role))
-            self.table.setItem(r, 3, QTableWidgetItem(skill_label))
-            self.table.setItem(r, 4, QTableWidgetItem(e.home_branch))
-            self.table.setItem(r, 5, QTableWidgetItem(fixed))
-
-        self.table.resizeColumnsToContents()
-
-    def _on_selection_changed(self):
-        row = self.table.currentRow()
-        if row < 0:
-            return
-        self._bind_form_from_row(row)
+        """전체 다시 읽기(reloaded) 때만. 직원 한 명 변경은 model.employee_changed가 그 행만 갱신."""
+        self.model.reset()
+        self.table.resizeColumnsToContents()  # 보이는 행 기준으로만 잰다
+
+    def _on_selection_changed(self, *_):
+        eid = current_emp_id(self.table)
+        if eid is not None:
+            self._bind_form(eid)
 
-    def _bind_form_from_row(self, row: int):
-        eid = int(self.table.item(row, 0).text())
+    def _bind_form(self, eid: int):
         e = next((x for x in self._employees if x.id == eid), None)
         if not e:
             return
@@ -204,27 +220,25 @@ class EmployeeManagerDialog(QDialog):
         self.txt_name.setFocus()
 
     def _on_edit_clicked(self):
-        row = self.table.currentRow()
-        if row < 0:
+        eid = current_emp_id(self.table)
+        if eid is None:
             QMessageBox.information(self, "안내", "수정할 직원을 선택해주세요.")
             return
-        self._bind_form_from_row(row)
+        self._bind_form(eid)
 
-    def _on_edit_from_table(self, row, _col):
-        self._bind_form_from_row(row)
+    def _on_edit_from_table(self, index):
+        self._bind_form(index.data(EmpIdRole))
 
     def _on_delete_clicked(self):
-        row = self.table.currentRow()
-        if row < 0:
+        eid = current_emp_id(self.table)
+        e = self.store.employee(eid) if eid is not None else None
+        if e is None:
             QMessageBox.information(self, "안내", "삭제할 직원을 선택해주세요.")
             return
-        eid = int(self.table.item(row, 0).text())
-        name = self.table.item(row, 1).text()
+        name = e.name
         if QMessageBox.question(self, "확인", f"직원 [{name}]을(를) 삭제하시겠습니까?") != QMessageBox.Yes:
             return
-        self._employees = [e for e in self._employees if e.id != eid]
-        save_employees(self._employees)
-        self._load_table()
+        self.store.remove_employee(eid)  # 스케줄 속 ID는 메인 창이 나중에 정리, 표는 알림으로 갱신
         self._clear_form()
         self.changed = True
 
@@ -247,13 +261,13 @@ class EmployeeManagerDialog(QDialog):
 
         # 새로 추가 or 수정
         if self._editing_id is None:
-            new_id = (max([e.id for e in self._employees], default=0) + 1)
+            new_id = self.store.next_employee_id()
             emp = _mk_employee(
                 id=new_id, name=name, role=role, skill_level=skill_val,
                 home_branch=branch, fixed_holidays=fixed,
                 min_shifts_per_week=min_w, max_shifts_per_week=max_w
             )
-            self._employees.append(emp)
+            self.store.upsert_employee(emp)
             msg = "추가 완료."
         else:
             emp = next((x for x in self._employees if x.id == self._editing_id), None)
@@ -268,10 +282,9 @@ class EmployeeManagerDialog(QDialog):
             emp.fixed_holidays = fixed
             emp.min_shifts_per_week = min_w
             emp.max_shifts_per_week = max_w
+            self.store.commit_employee(emp.id)
             msg = "수정 완료."
 
-        save_employees(self._employees)
-        self._load_table()
         self.changed = True
         QMessageBox.information(self, "완료", msg)
 
@@ -0,0 +1,125 @@
+# gui/employee_table.py
+"""
+직원 표(모델/뷰): 메인 창 좌측 목록과 직원 관리 다이얼로그가 같이 쓴다.
+
+- EmployeeTableModel: 저장소의 직원 목록을 그대로 보여줌(셀 아이템을 만들지 않음).
+  직원 한 명이 바뀌면 employee_changed(emp_id)로 그 행만 dataChanged/삽입/삭제.
+- 정렬/검색은 QSortFilterProxyModel(make_employee_view가 연결)이 맡는다.
+- 어느 열이든 EmpIdRole로 직원 ID를 돌려준다(선택 행 → 직원 찾기).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PySide6.QtWidgets import QTableView, QAbstractItemView, QHeaderView
+
+EmpIdRole = Qt.UserRole
+SortRole = Qt.UserRole + 1
+
+
+@dataclass
+class Column:
+    header: str
+    text: Callable[[object], str]
+    sort: Optional[Callable[[object], object]] = None   # 없으면 표시 문자열로 정렬
+
+
+def is_cook(e) -> bool:
+    return getattr(e, "skill_level", "") in ("C", "cook")
+
+
+class EmployeeTableModel(QAbstractTableModel):
+    def __init__(self, employees: List, columns: Sequence[Column], parent=None):
+        super().__init__(parent)
+        self._source = employees          # 저장소 목록(참조)
+        self._columns = list(columns)
+        self._rows: List = list(employees)  # 모델이 알고 있는 행 순서(알림 사이의 스냅샷)
+        self._row_of: Dict[int, int] = {e.id: r for r, e in enumerate(self._rows)}
+
+    # ---- Qt 모델 ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section].header
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        e = self._rows[index.row()]
+        col = self._columns[index.column()]
+        if role == Qt.DisplayRole:
+            return col.text(e)
+        if role == EmpIdRole:
+            return e.id
+        if role == SortRole:
+            return col.sort(e) if col.sort else col.text(e)
+        return None
+
+    # ---- 갱신 ----
+    def reset(self):
+        """전체 재로딩 때만."""
+        self.beginResetModel()
+        self._rows = list(self._source)
+        self._row_of = {e.id: r for r, e in enumerate(self._rows)}
+        self.endResetModel()
+
+    def employee_changed(self, emp_id):
+        """직원 한 명(추가/수정/삭제)만 반영."""
+        e = next((x for x in self._source if x.id == emp_id), None)
+        r = self._row_of.get(emp_id)
+        if e is None:
+            if r is None:
+                return
+            self.beginRemoveRows(QModelIndex(), r, r)
+            del self._rows[r]
+            self._row_of = {x.id: i for i, x in enumerate(self._rows)}
+            self.endRemoveRows()
+            return
+        if r is None:
+            # 저장소 목록에서의 위치에(보통 맨 끝, 삭제 취소면 원래 자리)
+            r = min(next(i for i, x in enumerate(self._source) if x is e), len(self._rows))
+            self.beginInsertRows(QModelIndex(), r, r)
+            self._rows.insert(r, e)
+            self._row_of = {x.id: i for i, x in enumerate(self._rows)}
+            self.endInsertRows()
+            return
+        self._rows[r] = e   # upsert는 객체를 통째로 바꿀 수 있음
+        self.dataChanged.emit(self.index(r, 0), self.index(r, len(self._columns) - 1))
+
+
+def make_employee_view(model: EmployeeTableModel, parent=None) -> Tuple[QTableView, QSortFilterProxyModel]:
+    """정렬/검색 프록시를 끼운 읽기 전용 직원 표."""
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    proxy.setSortRole(SortRole)
+    proxy.setFilterKeyColumn(-1)               # 모든 열에서 검색
+    proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+    view = QTableView(parent)
+    view.setModel(proxy)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)    # 셀 직접 편집 금지
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)   # 행 단위 선택
+    view.setSelectionMode(QAbstractItemView.SingleSelection)  # 단일 행 선택
+    view.verticalHeader().setVisible(False)
+    # 행 높이 고정: 수천 명이어도 스크롤/갱신 때 행마다 크기를 재지 않음
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    view.verticalHeader().setDefaultSectionSize(view.fontMetrics().height() + 8)
+    # 처음엔 저장소 순서 그대로, 헤더를 누르면 정렬
+    view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+    view.setSortingEnabled(True)
+    return view, proxy
+
+
+def current_emp_id(view: QTableView):
+    """선택된 행의 직원 ID(없으면 None)."""
+    index = view.currentIndex()
+    if not index.isValid() or not view.selectionModel().isRowSelected(index.row(), index.parent()):
+        return None
+    return index.data(EmpIdRole)
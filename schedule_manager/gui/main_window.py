@@ -1,30 +1,44 @@
 # gui/main_window.py
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QToolBar, QPushButton,
-    QLabel, QTableWidget, QTableWidgetItem, QSizePolicy, QMessageBox,
-    QLineEdit, QComboBox, QGroupBox, QGridLayout, QHeaderView, QAbstractItemView,
-    QSplitter, QTextEdit
+    QLabel, QSizePolicy, QMessageBox,
+    QLineEdit, QComboBox, QGroupBox, QGridLayout, QHeaderView,
+    QSplitter, QTextEdit, QProgressDialog, QPlainTextEdit
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+from PySide6.QtGui import QAction, QKeySequence, QTextCursor
 from datetime import date
 import calendar
 
-from schedule_manager.data.data_manager import (
-    load_employees, load_schedules, save_schedules, save_employees,
-    load_notes, save_notes
+from schedule_manager.data.data_manager import load_notes, append_generation, load_rotations
+from schedule_manager.data.store import get_store
+from schedule_manager.gui.workers import AutoAssignWorker, MonthPrefetchWorker
+from schedule_manager.logic.local_search import DEFAULT_ITERATIONS
+from schedule_manager.gui.month_cache import MonthCache, shift_month
+from schedule_manager.gui.save_writer import SaveWriter
+from schedule_manager.gui.views.assign_preview import AssignPreviewDialog
+from schedule_manager.gui.calendar_widget import CalendarWidget, prepare_month
+from schedule_manager.gui.employee_table import (
+    Column, EmployeeTableModel, EmpIdRole, make_employee_view, current_emp_id, is_cook
 )
-from schedule_manager.logic.scheduler import auto_assign
-from schedule_manager.gui.calendar_widget import CalendarWidget
 from schedule_manager.gui.views.day_editor import open_day_editor
 from schedule_manager.gui.bulk_editor import BulkEditorDialog
 from schedule_manager.gui.views.employee_inspector import EmployeeInspectorDialog
 from schedule_manager.gui.views.attendance_dialog import AttendanceDialog
+from schedule_manager.gui.views.roster_heatmap import RosterHeatmapDialog
+from schedule_manager.gui.views.memo_search import MemoSearchDialog
+from schedule_manager.gui.views.year_overview import YearOverviewDialog
 
 
 ROLE_OPTIONS = ["사장", "매니저", "직원"]
 BRANCH_OPTIONS = ["OS", "HC"]                # 지점 코드
 SKILL_OPTIONS = [("○", "C"), ("X", "N")]     # (표시, 저장값)
+IMPROVE_ITERATIONS = DEFAULT_ITERATIONS       # 자동 배정 후 공정성 개선 이동 횟수(시간이 아니라 횟수 → 시드로 재현)
+PREFETCH_IDLE_MS = 150                        # 화면 갱신 후 이만큼 조용하면 앞뒤 달 미리 계산
+SAVE_IDLE_MS = 800                            # 편집 후 이만큼 조용하면 모아 둔 변경을 한 번에 저장
+SAVE_MAX_DELAY_MS = 5000                      # 편집이 계속돼도 이 이상은 미루지 않음
+COMPACT_IDLE_MS = 1500                        # 직원 삭제 후 이만큼 조용하면 스케줄 속 ID 정리 시작
+COMPACT_CHUNK_DAYS = 60                       # 정리 한 번에 고치는 최대 일수(나머지는 다음 틱)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -36,14 +50,58 @@ class MainWindow(QMainWindow):
         self.year = today.year
         self.month = today.month
 
-        self.employees = load_employees()
-        self.schedules = load_schedules()
+        self.store = get_store()  # 앱 전역 저장소(다른 다이얼로그와 공유)
+        self.store.subscribe("day_changed", self._on_day_changed)
+        self.store.subscribe("employee_changed", self._on_employee_changed)
+        self.store.subscribe("reloaded", self._on_reloaded)
+        self.store.subscribe("history_changed", self._update_undo_actions)
+        self.store.subscribe("dirty", self._schedule_save)
+        self.store.subscribe("compaction_pending", self._schedule_compaction)
+        # 편집마다 파일 전체를 쓰지 않고, 잠잠해지면(또는 최대 지연 후) 한 번에 작업 스레드에서 저장
+        self.store.defer_saves = True
+        self.writer = SaveWriter(self)
+        self.writer.failed.connect(self._on_save_failed)
+        self._save_idle_timer = QTimer(self)
+        self._save_idle_timer.setSingleShot(True)
+        self._save_idle_timer.setInterval(SAVE_IDLE_MS)
+        self._save_idle_timer.timeout.connect(self._flush_saves)
+        self._save_max_timer = QTimer(self)
+        self._save_max_timer.setSingleShot(True)
+        self._save_max_timer.setInterval(SAVE_MAX_DELAY_MS)
+        self._save_max_timer.timeout.connect(self._flush_saves)
+        self.month_cache = MonthCache()
+        self._prefetch_worker = None
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(PREFETCH_IDLE_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch_neighbors)
+        # 삭제한 직원의 스케줄 속 ID는 잠잠할 때 조금씩 정리(삭제 자체는 즉시)
+        self._compact_timer = QTimer(self)
+        self._compact_timer.setSingleShot(True)
+        self._compact_timer.setInterval(COMPACT_IDLE_MS)
+        self._compact_timer.timeout.connect(self._compact_step)
         self._editing_emp_id = None  # 현재 편집 중인 직원 ID
         self._dlg_emp_inspector = None  # 직원별 보기
         self._dlg_attendance = None  # 근태
+        self._dlg_roster = None  # 전체 근무표
+        self._dlg_search = None  # 메모 검색
+        self._dlg_year = None  # 연간 보기
+        self._assign_worker = None  # 실행 중인 자동 배정 작업
+        self._assign_progress = None
 
         self._build_ui()
-        self.refresh()
+        self._render()
+        if self.store.tombstones:   # 지난 실행에서 정리 못 한 삭제 직원
+            self._compact_timer.start()
+
+    # 화면은 저장소의 목록/딕셔너리를 그대로 본다(복사본 없음)
+    @property
+    def employees(self):
+        return self.store.employees
+
+    @property
+    def schedules(self):
+        return self.store.schedules
 
     # ---------------- UI ----------------
     def _build_ui(self):
@@ -65,10 +123,20 @@ class MainWindow(QMainWindow):
 
         tb.addSeparator()
 
-        btn_auto = QPushButton("현재 달 자동 배정")
-        btn_auto.setToolTip("보이는 달의 1일부터 말일까지 자동 배정")
-        btn_auto.clicked.connect(self.run_auto_assign_current_month)
-        tb.addWidget(btn_auto)
+        self.btn_auto = QPushButton("현재 달 자동 배정")
+        self.btn_auto.setToolTip("보이는 달의 1일부터 말일까지 자동 배정")
+        self.btn_auto.clicked.connect(self.run_auto_assign_current_month)
+        tb.addWidget(self.btn_auto)
+
+        self.act_undo = QAction("↶ 실행 취소", self)
+        self.act_undo.setShortcut(QKeySequence.Undo)
+        self.act_undo.triggered.connect(self.undo)
+        tb.addAction(self.act_undo)
+        self.act_redo = QAction("↷ 다시 실행", self)
+        self.act_redo.setShortcuts([QKeySequence.Redo, QKeySequence("Ctrl+Y")])
+        self.act_redo.triggered.connect(self.redo)
+        tb.addAction(self.act_redo)
+        self._update_undo_actions()
 
         btn_refresh = QPushButton("새로고침")
         btn_refresh.clicked.connect(self.refresh)
@@ -89,6 +157,22 @@ class MainWindow(QMainWindow):
         btn_emp.clicked.connect(self.open_employee_inspector)
         tb.addWidget(btn_emp)
 
+        btn_roster = QPushButton("전체 근무표")
+        btn_roster.setToolTip("전체 직원 × 한 달 근무/휴무를 한눈에")
+        btn_roster.clicked.connect(self.open_roster_heatmap)
+        tb.addWidget(btn_roster)
+
+        btn_year = QPushButton("연간 보기")
+        btn_year.setToolTip("12개월 날짜별 충원/휴업/휴무를 한눈에")
+        btn_year.clicked.connect(self.open_year_overview)
+        tb.addWidget(btn_year)
+
+        self.act_search = QAction("메모 검색", self)
+        self.act_search.setShortcut(QKeySequence.Find)
+        self.act_search.setToolTip("날짜 메모/노트 전체에서 찾기 (Ctrl+F)")
+        self.act_search.triggered.connect(self.open_memo_search)
+        tb.addAction(self.act_search)
+
         btn_att = QPushButton("근태")
         btn_att.clicked.connect(self.open_attendance_dialog)
         tb.addWidget(btn_att)
@@ -148,18 +232,26 @@ class MainWindow(QMainWindow):
         title_row = QHBoxLayout()
         title_row.addWidget(QLabel("직원 목록"))
         title_row.addStretch(1)
+        self.emp_search = QLineEdit()
+        self.emp_search.setPlaceholderText("검색")
+        self.emp_search.setClearButtonEnabled(True)
+        self.emp_search.setMaximumWidth(140)
+        title_row.addWidget(self.emp_search)
         left.addLayout(title_row)
 
-        self.emp_table = QTableWidget(0, 4)
-        self.emp_table.setEditTriggers(QAbstractItemView.NoEditTriggers)    # 셀 직접 편집 금지
-        self.emp_table.setSelectionBehavior(QAbstractItemView.SelectRows)   # 행 단위 선택
-        self.emp_table.setSelectionMode(QAbstractItemView.SingleSelection)  # 단일 행 선택
-        self.emp_table.setHorizontalHeaderLabels(["이름", "직급", "조리", "지점"])
+        # 직원 표: 저장소 목록을 직접 보는 모델 + 정렬/검색 프록시
+        self.emp_model = EmployeeTableModel(self.employees, [
+            Column("이름", lambda e: e.name),
+            Column("직급", lambda e: e.role),
+            Column("조리", lambda e: "○" if is_cook(e) else "X"),
+            Column("지점", lambda e: e.home_branch),
+        ], self)
+        self.emp_table, self.emp_proxy = make_employee_view(self.emp_model, self)
         self.emp_table.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
 
         header = self.emp_table.horizontalHeader()
         header.setStretchLastSection(False)
-        for i in range(self.emp_table.columnCount()):
+        for i in range(self.emp_model.columnCount()):
             header.setSectionResizeMode(i, QHeaderView.Fixed)
             self.emp_table.setColumnWidth(i, 65)
 
@@ -184,6 +276,17 @@ class MainWindow(QMainWindow):
         left.addWidget(self.notes_box)
         # ▲▲▲ 노트 박스 추가 끝 ▲▲▲
 
+        # 자동 배정 통계(마지막 실행)
+        self.stats_box = QGroupBox("자동 배정 통계")
+        sb = QVBoxLayout(self.stats_box)
+        self.stats_view = QPlainTextEdit()
+        self.stats_view.setReadOnly(True)
+        self.stats_view.setPlaceholderText("자동 배정을 실행하면 단계별 시간과 완화 규칙 사용 횟수가 표시됩니다.")
+        self.stats_view.setMaximumHeight(130)
+        self.stats_view.setStyleSheet("font-size:11px;")
+        sb.addWidget(self.stats_view)
+        left.addWidget(self.stats_box)
+
         self.notes_edit.setPlainText(load_notes())
 
         # 좌측 폭 정책: 최소만 보장, 최대는 제한해서 달력 넓게
@@ -211,8 +314,9 @@ class MainWindow(QMainWindow):
         self._left_last_width = left_min  # 이후 토글 복원도 최소폭
 
         # 시그널
-        self.emp_table.itemSelectionChanged.connect(self._on_emp_selected)
-        self.emp_table.cellDoubleClicked.connect(self._on_emp_double)
+        self.emp_table.selectionModel().selectionChanged.connect(self._on_emp_selected)
+        self.emp_table.doubleClicked.connect(self._on_emp_double)
+        self.emp_search.textChanged.connect(self.emp_proxy.setFilterFixedString)
         self.btn_new_emp.clicked.connect(self._clear_emp_form)
         self.btn_save_emp.clicked.connect(self._save_emp_form)
         self.btn_del_emp.clicked.connect(self._delete_selected_emp)
@@ -222,33 +326,13 @@ class MainWindow(QMainWindow):
         self.status = self.statusBar()
 
     # ---------------- 데이터/바인딩 ----------------
-    def _fill_emp_table(self):
-        self.emp_table.setRowCount(0)
-        for e in self.employees:
-            r = self.emp_table.rowCount()
-            self.emp_table.insertRow(r)
-            skill = "○" if getattr(e, "skill_level", "") in ("C", "cook") else "X"
-            self.emp_table.setItem(r, 0, QTableWidgetItem(e.name))
-            self.emp_table.setItem(r, 1, QTableWidgetItem(e.role))
-            self.emp_table.setItem(r, 2, QTableWidgetItem(skill))
-            self.emp_table.setItem(r, 3, QTableWidgetItem(e.home_branch))
-            # 행 히든 데이터로 ID 저장
-            for c in range(4):
-                self.emp_table.item(r, c).setData(Qt.UserRole, e.id)
-
-    def _on_emp_selected(self):
-        row = self.emp_table.currentRow()
-        if row < 0:
-            return
-        item = self.emp_table.item(row, 0)
-        emp_id = item.data(Qt.UserRole)
-        self._bind_emp_form(emp_id)
+    def _on_emp_selected(self, *_):
+        emp_id = current_emp_id(self.emp_table)
+        if emp_id is not None:
+            self._bind_emp_form(emp_id)
 
-    def _on_emp_double(self, row, _col):
-        item = self.emp_table.item(row, 0)
-        if not item:
-            return
-        self._bind_emp_form(item.data(Qt.UserRole))
+    def _on_emp_double(self, index):
+        self._bind_emp_form(index.data(EmpIdRole))
 
     def _bind_emp_form(self, emp_id: int):
         e = next((x for x in self.employees if x.id == emp_id), None)
@@ -294,8 +378,8 @@ class MainWindow(QMainWindow):
 
         if self._editing_emp_id is None:
             # 신규: 내부 기본값 포함(비공개 필드)
-            new_id = (max([e.id for e in self.employees], default=0) + 1)
-            self.employees.append(self._mk_emp(
+            new_id = self.store.next_employee_id()
+            self.store.upsert_employee(self._mk_emp(
                 id=new_id, name=name, role=role, skill_level=skill_val,
                 home_branch=branch,
                 fixed_holidays=[],     # 기본값
@@ -313,77 +397,223 @@ class MainWindow(QMainWindow):
             e.role = role
             e.skill_level = skill_val
             e.home_branch = branch
+            self.store.commit_employee(e.id)
             msg = "수정 완료."
 
-        save_employees(self.employees)
-        self.refresh()
         QMessageBox.information(self, "완료", msg)
 
     def _delete_selected_emp(self):
-        row = self.emp_table.currentRow()
-        if row < 0:
+        emp_id = current_emp_id(self.emp_table)
+        e = self.store.employee(emp_id) if emp_id is not None else None
+        if e is None:
             QMessageBox.information(self, "안내", "삭제할 직원을 선택해주세요.")
             return
-
-        emp_id = self.emp_table.item(row, 0).data(Qt.UserRole)
-        name = self.emp_table.item(row, 0).text()
+        name = e.name
 
         if QMessageBox.question(self, "확인", f"[{name}]을(를) 삭제하시겠습니까?") != QMessageBox.Yes:
             return
 
-        # 1) 직원 목록에서 제거
-        self.employees = [e for e in self.employees if e.id != emp_id]
-        save_employees(self.employees)
-
-        # 2) 모든 스케줄에서 해당 ID 제거 (OS/HC/휴무)
-        changed = False
-        for key, sch in list(self.schedules.items()):
-            os = sch.working.get("OS", []) or []
-            hc = sch.working.get("HC", []) or []
-            nos = [i for i in os if i != emp_id]
-            nhc = [i for i in hc if i != emp_id]
-            h = sch.holidays or []
-            nh = [i for i in h if i != emp_id]
-
-            if nos != os or nhc != hc or nh != h:
-                sch.working["OS"] = nos
-                sch.working["HC"] = nhc
-                sch.holidays = nh
-                self.schedules[key] = sch
-                changed = True
-
-        if changed:
-            save_schedules(self.schedules)
+        # 직원 목록에서만 즉시 제거(묘비). 스케줄 속 ID는 _compact_step이 나중에 정리
+        self.store.remove_employee(emp_id)
 
         self._clear_emp_form()
-        self.refresh()
-        QMessageBox.information(self, "완료", f"[{name}] 삭제 및 과거 스케줄 정리 완료.")
+        self.status.showMessage(f"[{name}] 삭제 완료.", 3000)
 
     # ---------------- 동작 ----------------
     def refresh(self):
-        self.employees = load_employees()
-        self.schedules = load_schedules()
-        self._fill_emp_table()
-        self.calendar.render_month(self.year, self.month, self.employees, self.schedules)
+        """디스크에서 다시 읽기(저장소 reloaded → _render). 미뤄 둔/쓰는 중인 저장을 먼저 끝낸다."""
+        self._flush_saves()
+        self.writer.flush()
+        self.store.reload()
+
+    def _render(self):
+        """메모리에 있는 self.employees/self.schedules로 화면만 다시 그린다(디스크 재로딩 없음)."""
+        self.emp_model.reset()
+        self._render_month()
+
+    def _render_month(self):
+        # 미리 계산된 달이 있으면 그대로 표시, 없으면 여기서 계산해서 캐시에 넣는다
+        view = self.month_cache.get(self.year, self.month)
+        if view is None:
+            view = prepare_month(self.year, self.month, self.employees, self.schedules,
+                                 version=self.month_cache.version)
+            self.month_cache.put(view)
+        self.calendar.show_view(view)
+        self._prefetch_timer.start()
 
         # 상단 상태
         month_days = calendar.monthrange(self.year, self.month)[1]
         self.month_label.setText(f"{self.year}-{self.month:02d}  (일수: {month_days}일)")
+        self._update_status()
+
+    def _update_status(self):
         self.statusBar().showMessage(f"직원 {len(self.employees)}명, 일정 {len(self.schedules)}건")
 
+    # ---------------- 앞뒤 달 미리 계산 ----------------
+    def _prefetch_neighbors(self):
+        if self._prefetch_worker is not None:
+            self._prefetch_timer.start()  # 이전 작업이 끝난 뒤 다시 시도
+            return
+        months = self.month_cache.missing(
+            [shift_month(self.year, self.month, -1), shift_month(self.year, self.month, 1)])
+        if not months:
+            return
+        worker = MonthPrefetchWorker(months, self.employees, self.schedules, self.month_cache.version)
+        worker.signals.ready.connect(self._on_month_prefetched)
+        worker.signals.done.connect(self._on_prefetch_done)
+        self._prefetch_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_month_prefetched(self, view):
+        # 작업 중 데이터가 바뀌었으면(version 불일치) put이 알아서 버린다
+        self.month_cache.put(view)
+
+    def _on_prefetch_done(self):
+        self._prefetch_worker = None
+
+    # ---------------- 저장소 알림 ----------------
+    def _on_day_changed(self, key: str):
+        self.month_cache.invalidate_days([key])
+        self.calendar.update_day(key, self.schedules.get(key))
+        self._update_status()
+        self._prefetch_timer.start()
+
+    def _on_employee_changed(self, emp_id):
+        self.month_cache.clear()
+        self.emp_model.employee_changed(emp_id)
+        self.calendar.update_employee(emp_id, self.employees, self.schedules)
+        self._update_status()
+        self._prefetch_timer.start()
+
+    def _update_undo_actions(self):
+        undo, redo = self.store.history.undo_label, self.store.history.redo_label
+        self.act_undo.setEnabled(undo is not None)
+        self.act_undo.setToolTip(f"실행 취소: {undo}" if undo else "실행 취소")
+        self.act_redo.setEnabled(redo is not None)
+        self.act_redo.setToolTip(f"다시 실행: {redo}" if redo else "다시 실행")
+
+    def _schedule_save(self):
+        self._save_idle_timer.start()
+        if not self._save_max_timer.isActive():
+            self._save_max_timer.start()
+
+    def _flush_saves(self):
+        self._save_idle_timer.stop()
+        self._save_max_timer.stop()
+        snapshot = self.store.take_dirty_snapshot()
+        if snapshot:
+            self.writer.submit(snapshot)
+
+    def _schedule_compaction(self):
+        self._compact_timer.start()
+
+    def _compact_step(self):
+        self.store.compact_tombstones(COMPACT_CHUNK_DAYS)
+        if self.store.tombstones:
+            QTimer.singleShot(0, self._compact_step)
+
+    def _on_save_failed(self, kind: str, message: str):
+        # 다시 dirty로 표시 → 저장 타이머가 재시도
+        self.status.showMessage(f"저장 실패({kind}): {message} — 잠시 후 다시 시도합니다.", 5000)
+        self.store.mark_dirty(kind)
+
+    def undo(self):
+        cmd = self.store.undo()
+        if cmd is not None:
+            self.status.showMessage(f"실행 취소: {cmd.label}", 3000)
+
+    def redo(self):
+        cmd = self.store.redo()
+        if cmd is not None:
+            self.status.showMessage(f"다시 실행: {cmd.label}", 3000)
+
+    def _on_reloaded(self):
+        self.month_cache.clear()
+        self._render()
+
     def open_day(self, y: int, m: int, d: int):
         key = f"{y:04d}-{m:02d}-{d:02d}"
-        changed = open_day_editor(self, key, self.employees, self.schedules)
+        changed = open_day_editor(self, key, self.employees, self.schedules, self.store.name_index())
         if changed:
-            save_schedules(self.schedules)
-            self.refresh()
+            self.store.commit_day(key)
 
     def run_auto_assign_current_month(self):
+        """백그라운드에서 자동 배정 → 미리보기 → '적용' 시에만 self.schedules에 반영."""
+        if self._assign_worker is not None:
+            return
+        if not self.employees:
+            QMessageBox.information(self, "안내", "직원 데이터가 없습니다. 먼저 직원을 등록해주세요.")
+            return
         start = f"{self.year:04d}-{self.month:02d}-01"
         days = calendar.monthrange(self.year, self.month)[1]
-        auto_assign(start_date=start, days=days, overwrite=False)
-        self.refresh()
-        QMessageBox.information(self, "완료", f"{self.year}-{self.month:02d} ({days}일) 자동 배정이 완료되었습니다.")
+
+        worker = AutoAssignWorker(self.employees, self.schedules, start, days,
+                                  overwrite=False, improve_iterations=IMPROVE_ITERATIONS,
+                                  rotations=load_rotations())
+        prog = QProgressDialog("자동 배정 중...", "취소", 0, 100, self)
+        prog.setWindowTitle("자동 배정")
+        prog.setWindowModality(Qt.WindowModal)
+        prog.setMinimumDuration(300)
+        prog.setAutoClose(False)
+        prog.setAutoReset(False)
+        prog.canceled.connect(worker.cancel)
+
+        worker.signals.progress.connect(self._on_assign_progress)
+        worker.signals.finished.connect(self._on_assign_finished)
+        worker.signals.failed.connect(self._on_assign_failed)
+        worker.signals.cancelled.connect(self._on_assign_cancelled)
+
+        self._assign_worker = worker
+        self._assign_progress = prog
+        self.btn_auto.setEnabled(False)
+        self.status.showMessage(f"{self.year}-{self.month:02d} 자동 배정 중...")
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_assign_progress(self, phase: str, done: int, total: int):
+        if not self._assign_progress:
+            return
+        # 배정 0~50%, 공정성 개선 50~100%
+        frac = (done / total) if total else 1.0
+        base = 0 if phase == "배정" else 50
+        self._assign_progress.setLabelText(f"{phase} 중... ({done}/{total})")
+        self._assign_progress.setValue(base + int(min(1.0, frac) * 50))
+
+    def _end_assign_job(self):
+        if self._assign_progress:
+            self._assign_progress.close()
+            self._assign_progress.deleteLater()
+        self._assign_progress = None
+        self._assign_worker = None
+        self.btn_auto.setEnabled(True)
+
+    def _on_assign_cancelled(self):
+        self._end_assign_job()
+        self.status.showMessage("자동 배정이 취소되었습니다.", 3000)
+
+    def _on_assign_failed(self, message: str):
+        self._end_assign_job()
+        QMessageBox.warning(self, "오류", f"자동 배정 중 오류가 발생했습니다.\n\n{message}")
+
+    def _on_assign_finished(self, result):
+        tiled = self._assign_worker.tiled if self._assign_worker else None
+        self._end_assign_job()
+        text = f"{result.summary()}\n{result.stats.report()}"
+        if tiled is not None:
+            text = f"로테이션 템플릿: {tiled.summary()}\n" + "".join(f"  충돌: {c}\n" for c in tiled.conflicts[:20]) + text
+        self.stats_view.setPlainText(text)
+        dlg = AssignPreviewDialog(self, result, self.employees)
+        if dlg.exec() != AssignPreviewDialog.Accepted:
+            self.status.showMessage("자동 배정 결과를 적용하지 않았습니다.", 3000)
+            return
+        keys = result.apply(self.schedules)
+        self.store.commit_days(keys, "자동 배정")
+        append_generation(result.generation_record())
+        if result.skipped:
+            QMessageBox.warning(
+                self, "일부 미적용",
+                f"배정 계산 중 바뀐 날짜 {len(result.skipped)}일은 덮어쓰지 않았습니다.\n"
+                + ", ".join(result.skipped[:10]) + (" 외" if len(result.skipped) > 10 else ""))
+        QMessageBox.information(self, "완료", f"{result.start_date[:7]} ({result.days_count}일) 자동 배정이 완료되었습니다.")
 
     def prev_month(self):
         if self.month == 1:
@@ -391,7 +621,7 @@ class MainWindow(QMainWindow):
             self.month = 12
         else:
             self.month -= 1
-        self.refresh()
+        self._render_month()
 
     def next_month(self):
         if self.month == 12:
@@ -399,15 +629,13 @@ class MainWindow(QMainWindow):
             self.month = 1
         else:
             self.month += 1
-        self.refresh()
+        self._render_month()
 
     def delete_day(self, date_key: str):
         if date_key in self.schedules:
             if QMessageBox.question(self, "확인", f"{date_key} 일정을 삭제하시겠습니까?") != QMessageBox.Yes:
                 return
-            self.schedules.pop(date_key, None)
-            save_schedules(self.schedules)
-            self.refresh()
+            self.store.delete_day(date_key)
             QMessageBox.information(self, "삭제", f"{date_key} 삭제 완료.")
         else:
             QMessageBox.information(self, "안내", "삭제할 일정이 없습니다.")
@@ -416,12 +644,22 @@ class MainWindow(QMainWindow):
         dlg = BulkEditorDialog(self, self.year, self.month, self.schedules)
         if dlg.exec():
             if dlg.changed:
-                save_schedules(self.schedules)
-                self.refresh()
+                self.store.commit_days(dlg.changed_keys, "일괄 편집")
+
+    def closeEvent(self, event):
+        self._prefetch_timer.stop()
+        self._compact_timer.stop()   # 남은 묘비는 다음 실행에서 이어서 정리
+        self._flush_saves()  # 미뤄 둔 편집 저장
+        self.writer.flush()  # 쓰는 중인 것까지 끝내고 종료
+        # 실행 중인 자동 배정은 취소하고 끝날 때까지 잠시 기다린다
+        if self._assign_worker is not None:
+            self._assign_worker.cancel()
+            QThreadPool.globalInstance().waitForDone(3000)
+        super().closeEvent(event)
 
     # ---------------- 노트 I/O ----------------
     def _save_notes_ui(self):
-        save_notes(self.notes_edit.toPlainText())
+        self.store.save_notes(self.notes_edit.toPlainText())   # 검색 색인도 바뀐 줄만 갱신
         self.status.showMessage("노트 저장 완료.", 2000)
 
     # 간단 Employee 객체 생성 헬퍼(모델 클래스로 대체 가능)
@@ -454,13 +692,82 @@ class MainWindow(QMainWindow):
         except RuntimeError:
             self._dlg_emp_inspector = None
 
-        dlg = EmployeeInspectorDialog(self.year, self.month, self, on_changed=self.refresh)
+        dlg = EmployeeInspectorDialog(self.year, self.month, self, store=self.store,
+                                      month_cache=self.month_cache)
         dlg.setModal(False)
         dlg.setAttribute(Qt.WA_DeleteOnClose, True)
         dlg.destroyed.connect(lambda _=None: setattr(self, "_dlg_emp_inspector", None))
         dlg.show()
         self._dlg_emp_inspector = dlg
 
+    def open_roster_heatmap(self):
+        try:
+            if self._dlg_roster and self._dlg_roster.isVisible():
+                self._dlg_roster.raise_()
+                self._dlg_roster.activateWindow()
+                return
+        except RuntimeError:
+            self._dlg_roster = None
+
+        dlg = RosterHeatmapDialog(self.year, self.month, self, store=self.store)
+        dlg.setModal(False)
+        dlg.setAttribute(Qt.WA_DeleteOnClose, True)
+        dlg.destroyed.connect(lambda _=None: setattr(self, "_dlg_roster", None))
+        dlg.show()
+        self._dlg_roster = dlg
+
+    def open_year_overview(self):
+        try:
+            if self._dlg_year and self._dlg_year.isVisible():
+                self._dlg_year.raise_()
+                self._dlg_year.activateWindow()
+                return
+        except RuntimeError:
+            self._dlg_year = None
+
+        dlg = YearOverviewDialog(self.year, self, store=self.store)
+        dlg.date_activated.connect(self._go_to_day)
+        dlg.setModal(False)
+        dlg.setAttribute(Qt.WA_DeleteOnClose, True)
+        dlg.destroyed.connect(lambda _=None: setattr(self, "_dlg_year", None))
+        dlg.show()
+        self._dlg_year = dlg
+
+    def open_memo_search(self):
+        try:
+            if self._dlg_search and self._dlg_search.isVisible():
+                self._dlg_search.raise_()
+                self._dlg_search.activateWindow()
+                self._dlg_search.txt_query.setFocus()
+                return
+        except RuntimeError:
+            self._dlg_search = None
+
+        dlg = MemoSearchDialog(self, store=self.store)
+        dlg.date_activated.connect(self._go_to_day)
+        dlg.notes_line_activated.connect(self._go_to_notes_line)
+        dlg.setModal(False)
+        dlg.setAttribute(Qt.WA_DeleteOnClose, True)
+        dlg.destroyed.connect(lambda _=None: setattr(self, "_dlg_search", None))
+        dlg.show()
+        self._dlg_search = dlg
+
+    def _go_to_day(self, key: str):
+        """검색 결과/연간 보기 → 그 달로 이동 후 날짜 편집."""
+        y, m, d = (int(x) for x in key.split("-"))
+        if (y, m) != (self.year, self.month):
+            self.year, self.month = y, m
+            self._render_month()
+        self.open_day(y, m, d)
+
+    def _go_to_notes_line(self, line: int):
+        if not self.act_toggle_left.isChecked():
+            self.act_toggle_left.setChecked(True)
+        cursor = QTextCursor(self.notes_edit.document().findBlockByNumber(line))
+        cursor.select(QTextCursor.LineUnderCursor)
+        self.notes_edit.setTextCursor(cursor)
+        self.notes_edit.setFocus()
+
     def open_attendance_dialog(self):
         from PySide6.QtCore import QDate
         try:
@@ -471,7 +778,7 @@ class MainWindow(QMainWindow):
         except RuntimeError:
             self._dlg_attendance = None
 
-        dlg = AttendanceDialog(self, QDate.currentDate())
+        dlg = AttendanceDialog(self, QDate.currentDate(), store=self.store)
         dlg.setModal(False)
         dlg.setAttribute(Qt.WA_DeleteOnClose, True)
         dlg.destroyed.connect(lambda _=None: setattr(self, "_dlg_attendance", None))
@@ -0,0 +1,65 @@
+# gui/month_cache.py
+"""
+월 이동용 MonthView LRU 캐시.
+
+- 메인 스레드에서만 get/put/invalidate 한다(작업 스레드는 MonthView를 만들어 시그널로 넘길 뿐).
+- version: 무효화할 때마다 증가. 작업 시작 시점의 version과 다르면 그 결과는 버린다(중간에 데이터가 바뀜).
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from schedule_manager.gui.calendar_widget import MonthView
+
+MonthKey = Tuple[int, int]
+
+
+def shift_month(year: int, month: int, delta: int) -> MonthKey:
+    idx = year * 12 + (month - 1) + delta
+    return idx // 12, idx % 12 + 1
+
+
+class MonthCache:
+    def __init__(self, capacity: int = 6):
+        self.capacity = capacity
+        self.version = 0
+        self._views: "OrderedDict[MonthKey, MonthView]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, ym: MonthKey) -> bool:
+        return ym in self._views
+
+    def get(self, year: int, month: int) -> Optional[MonthView]:
+        view = self._views.get((year, month))
+        if view is None:
+            self.misses += 1
+            return None
+        self._views.move_to_end((year, month))
+        self.hits += 1
+        return view
+
+    def put(self, view: MonthView) -> bool:
+        """현재 version에서 만든 것만 저장. 저장했으면 True."""
+        if view.version != self.version:
+            return False
+        self._views[(view.year, view.month)] = view
+        self._views.move_to_end((view.year, view.month))
+        while len(self._views) > self.capacity:
+            self._views.popitem(last=False)
+        return True
+
+    def missing(self, months: Iterable[MonthKey]) -> List[MonthKey]:
+        return [ym for ym in months if ym not in self._views]
+
+    # ---- 무효화 ----
+    def invalidate_days(self, keys: Iterable[str]) -> None:
+        """해당 날짜가 속한 달만 버린다."""
+        self.version += 1
+        for key in keys:
+            self._views.pop((int(key[:4]), int(key[5:7])), None)
+
+    def clear(self) -> None:
+        """직원 변경/전체 재로딩: 이름·상태가 모든 달에 걸리므로 전부 버린다."""
+        self.version += 1
+        self._views.clear()
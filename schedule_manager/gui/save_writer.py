@@ -0,0 +1,84 @@
+# gui/save_writer.py
+"""
+메인 스레드 밖에서 저장하는 서비스.
+
+- submit(payloads): 저장소가 넘긴 스냅샷을 작업 스레드(전용 풀, 스레드 1개)에서 쓴다.
+- 한 번에 하나만 쓰고, 쓰는 중에 들어온 것은 종류별로 최신 것만 남겨 다음 차례에 쓴다
+  → 순서 보장(나중 스냅샷이 먼저 쓴 것을 덮음) + 연속 저장 합치기.
+- 결과는 saved(kind)/failed(kind, message) 시그널로(메인 스레드에서 받음).
+- 한 번에 쓰는 묶음은 WRITE_ORDER 순서로 쓴다(집계는 schedules.json을 쓴 뒤에 그 스탬프를 붙임).
+- flush(): 종료 직전 호출. 쓰는 중인 것을 기다리고, 남은 것은 이 스레드에서 바로 쓴다.
+"""
+from __future__ import annotations
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from schedule_manager.data.data_manager import write_snapshot
+from schedule_manager.gui.workers import SaveWorker
+
+WRITE_ORDER = ("employees", "tombstones", "schedules", "aggregates")
+
+
+def _ordered(payloads: Dict[str, object]) -> Dict[str, object]:
+    """종류별 스냅샷을 쓰는 순서대로(들어온 순서와 무관)."""
+    return {kind: payloads[kind] for kind in sorted(payloads, key=WRITE_ORDER.index)}
+
+
+class SaveWriter(QObject):
+    saved = Signal(str)
+    failed = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pending: Dict[str, object] = {}
+        self._running: Optional[SaveWorker] = None
+        self.writes = 0       # 실제로 파일을 쓴 횟수(종류별 1회씩 셈)
+        self.coalesced = 0    # 쓰기 전에 더 새 스냅샷으로 대체된 횟수
+
+    @property
+    def busy(self) -> bool:
+        return self._running is not None or bool(self._pending)
+
+    def submit(self, payloads: Dict[str, object]) -> None:
+        for kind, payload in payloads.items():
+            if kind in self._pending:
+                self.coalesced += 1
+            self._pending[kind] = payload
+        if self._running is None:
+            self._start_next()
+
+    def _start_next(self) -> None:
+        if not self._pending:
+            return
+        payloads, self._pending = self._pending, {}
+        worker = SaveWorker(_ordered(payloads))
+        worker.signals.saved.connect(self._on_saved)
+        worker.signals.failed.connect(self.failed)
+        worker.signals.done.connect(self._on_done)
+        self._running = worker
+        self._pool.start(worker)
+
+    def _on_saved(self, kind: str) -> None:
+        self.writes += 1
+        self.saved.emit(kind)
+
+    def _on_done(self) -> None:
+        self._running = None
+        self._start_next()
+
+    def flush(self, timeout_ms: int = 10_000) -> None:
+        """종료용: 진행 중인 쓰기를 기다린 뒤 남은 스냅샷을 동기로 쓴다."""
+        self._pool.waitForDone(timeout_ms)
+        self._running = None
+        payloads, self._pending = self._pending, {}
+        for kind, payload in _ordered(payloads).items():
+            try:
+                write_snapshot(kind, payload)
+            except Exception as e:
+                self.failed.emit(kind, f"{type(e).__name__}: {e}")
+                continue
+            self.writes += 1
+            self.saved.emit(kind)
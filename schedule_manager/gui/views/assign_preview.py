@@ -0,0 +1,74 @@
+# schedule_manager/gui/views/assign_preview.py
+from __future__ import annotations
+from PySide6.QtGui import QBrush, QColor
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+    QTableWidgetItem, QAbstractItemView, QHeaderView
+)
+
+COLUMNS = ["날짜", "OS", "HC", "휴무"]
+ADDED_BG = QColor("#e6f4ea")   # 이번 배정으로 바뀐 칸
+
+
+class AssignPreviewDialog(QDialog):
+    """
+    자동 배정 결과 미리보기. '적용'을 눌러야 스케줄에 반영된다.
+    바뀐 날짜만 보여주며, 새로 들어간 사람이 있는 칸은 배경색으로 표시.
+    """
+    def __init__(self, parent, result, employees):
+        super().__init__(parent)
+        self.setWindowTitle("자동 배정 미리보기")
+        self.resize(760, 560)
+        id_to_name = {e.id: e.name for e in (employees or [])}
+
+        def names(ids):
+            return ", ".join(id_to_name.get(i, str(i)) for i in ids)
+
+        v = QVBoxLayout(self)
+        stats = result.stats
+        v.addWidget(QLabel(
+            f"{result.start_date}부터 {result.days_count}일 · 변경 {len(result.diff)}일 · "
+            f"충원 {stats.slots_filled}/{stats.slots_required}칸 · 시드 {result.seed}"
+        ))
+        detail = QLabel(stats.report())
+        detail.setStyleSheet("color:#555; font-size:11px;")
+        detail.setWordWrap(True)
+        v.addWidget(detail)
+
+        keys = result.changed_keys
+        table = QTableWidget(len(keys), len(COLUMNS))
+        table.setHorizontalHeaderLabels(COLUMNS)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+
+        for r, key in enumerate(keys):
+            daily = result.days[key]
+            diff = result.diff[key]
+            cells = [
+                (key, False),
+                (names(daily.working.get("OS", [])), bool(diff.added["OS"] or diff.removed["OS"])),
+                (names(daily.working.get("HC", [])), bool(diff.added["HC"] or diff.removed["HC"])),
+                (names(daily.holidays or []), bool(diff.added["OFF"] or diff.removed["OFF"])),
+            ]
+            for c, (text, changed) in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if changed:
+                    item.setBackground(QBrush(ADDED_BG))
+                table.setItem(r, c, item)
+        v.addWidget(table, 1)
+
+        btns = QHBoxLayout()
+        btns.addStretch(1)
+        btn_cancel = QPushButton("취소")
+        btn_apply = QPushButton("적용")
+        btn_apply.setDefault(True)
+        btn_apply.setEnabled(bool(keys))
+        btns.addWidget(btn_cancel)
+        btns.addWidget(btn_apply)
+        v.addLayout(btns)
+
+        btn_cancel.clicked.connect(self.reject)
+        btn_apply.clicked.connect(self.accept)
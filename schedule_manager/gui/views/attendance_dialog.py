@@ -1,38 +1,42 @@
 # schedule_manager/gui/views/attendance_dialog.py
 from __future__ import annotations
-from typing import Optional
-from PySide6.QtCore import Qt, QDate
+from typing import Dict, List, Optional, Tuple
+from PySide6.QtCore import Qt, QDate, QFileSystemWatcher, QTimer
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QDateEdit,
     QTableWidget, QTableWidgetItem, QMessageBox, QFormLayout, QDialogButtonBox,
-    QLineEdit, QWidget, QAbstractItemView, QHeaderView, QSizePolicy
+    QLineEdit, QWidget, QAbstractItemView, QHeaderView, QSizePolicy, QCheckBox
 )
 
-from schedule_manager.data.data_manager import (
-    load_employees, load_schedules,
-    load_attendance, punch_in, punch_out, adjust_attendance
-)
+from schedule_manager.data import data_manager as dm
+from schedule_manager.data.store import get_store
 
 BRANCHES = ("OS", "HC")
+LIVE_DEBOUNCE_MS = 300   # 파일 변경이 몰려 와도 이만큼 모아서 한 번만 다시 읽는다
 
 def _date_key(qd: QDate) -> str:
     return f"{qd.year():04d}-{qd.month():02d}-{qd.day():02d}"
 
-def _get_status_for(emp_id: int, date_key: str) -> str:
-    """스케줄 기준 상태 텍스트(OS/HC/휴무/—)"""
-    schedules = load_schedules()
-    sch = schedules.get(date_key)
+def _day_status_map(sch) -> Dict[int, str]:
+    """그 날 스케줄 → {직원 ID: 'OS'|'HC'|'휴무'}. 표에 없는 직원은 '—'로 표시."""
+    status: Dict[int, str] = {}
     if not sch:
-        return "—"
-    holidays = getattr(sch, "holidays", []) or []
-    if emp_id in holidays:
-        return "휴무"
+        return status
     working = getattr(sch, "working", {}) or {}
-    for b in BRANCHES:
+    # 뒤에 쓴 값이 우선: HC < OS < 휴무 (기존 조회 순서와 같음)
+    for b in reversed(BRANCHES):
         ids = working.get(b, []) if isinstance(working, dict) else []
-        if emp_id in (ids or []):
-            return b
-    return "—"
+        for i in ids or []:
+            status[i] = b
+    for i in getattr(sch, "holidays", []) or []:
+        status[i] = "휴무"
+    return status
+
+def _get_status_for(emp_id: int, date_key: str, schedules=None) -> str:
+    """스케줄 기준 상태 텍스트(OS/HC/휴무/—). schedules를 안 주면 저장소의 메모리 스케줄을 본다(파일은 읽지 않음)."""
+    if schedules is None:
+        schedules = get_store().schedules
+    return _day_status_map(schedules.get(date_key)).get(emp_id, "—")
 
 class AdjustDialog(QDialog):
     def __init__(self, parent: QWidget, name: str, in_time: str, out_time: str):
@@ -63,12 +67,13 @@ class AttendanceDialog(QDialog):
     가운데 표에서 직원 선택 → 출근/퇴근/조정
     표 컬럼: 이름 / 출근 / 퇴근 / 상태 (모두 동일 폭)
     """
-    def __init__(self, parent=None, date_qd: Optional[QDate] = None):
+    def __init__(self, parent=None, date_qd: Optional[QDate] = None, store=None):
         super().__init__(parent)
         self.setWindowTitle("근태 기록")
 
-        # 데이터
-        self.employees = load_employees()
+        # 데이터: 앱 저장소를 그대로 본다(열 때 파일을 다시 읽지 않음)
+        self.store = store or get_store()
+        self.employees = self.store.employees
         self.date_edit = QDateEdit(date_qd or QDate.currentDate())
         self.date_edit.setCalendarPopup(True)
 
@@ -79,6 +84,24 @@ class AttendanceDialog(QDialog):
         top.addWidget(QLabel("기록 일자"))
         top.addWidget(self.date_edit)
         top.addStretch(1)
+        self.chk_live = QCheckBox("실시간")
+        self.chk_live.setToolTip("다른 터미널/프로그램의 출퇴근 기록을 자동으로 반영")
+        top.addWidget(self.chk_live)
+
+        # 표 상태: 직원 ID → 행, 직원 ID → 표시 중인 (출근, 퇴근, 상태)
+        self._roster: List[Tuple[int, str]] = []
+        self._rows: Dict[int, int] = {}
+        self._shown: Dict[int, Tuple[str, str, str]] = {}
+
+        # 실시간: 근태 파일 + 폴더 감시(저장이 tmp→replace라 파일 감시만으로는 끊긴다)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_event)
+        self._watcher.directoryChanged.connect(self._on_file_event)
+        self._att_mtime = None
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self._reload_timer.timeout.connect(self._reload_live)
 
         # 테이블 (단일 선택)
         self.table = QTableWidget(0, 4)
@@ -137,10 +160,80 @@ class AttendanceDialog(QDialog):
         btn_in.clicked.connect(self.on_punch_in)
         btn_out.clicked.connect(self.on_punch_out)
         btn_adj.clicked.connect(self.on_adjust)
-        btn_refresh.clicked.connect(self.refresh)
+        btn_refresh.clicked.connect(self._reload_from_disk)
+
+        # 다른 창의 편집/근태 기록도 저장소 알림으로 반영
+        self._unsubs = [
+            self.store.subscribe("attendance_changed", self._on_store_attendance_changed),
+            self.store.subscribe("day_changed", self._on_store_day_changed),
+            self.store.subscribe("employee_changed", lambda _emp_id: self.refresh()),
+            self.store.subscribe("reloaded", self.refresh),
+        ]
+        self.finished.connect(self._detach_store)
+        self.chk_live.toggled.connect(self._set_live)
 
         # 초기 로딩
         self.refresh()
+        self.chk_live.setChecked(True)
+
+    def _reload_from_disk(self):
+        # 새로고침 버튼: 다른 프로그램(CLI 등)이 남긴 근태 기록까지 다시 읽는다
+        self._att_mtime = self._file_mtime()
+        self.store.reload_attendance()
+        self.refresh()
+
+    # --- 저장소 알림 ---
+    def _detach_store(self, *_):
+        self._set_live(False)
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    def _on_store_attendance_changed(self, date_key: str, emp_id):
+        if date_key != _date_key(self.date_edit.date()) or emp_id not in self._rows:
+            return
+        status = _day_status_map(self.store.schedules.get(date_key))
+        self._sync_row(emp_id, self.store.attendance.get(date_key, {}), status)
+
+    def _on_store_day_changed(self, date_key: str):
+        if date_key == _date_key(self.date_edit.date()):
+            self.refresh()  # 상태 칸만 바뀐 만큼 갱신됨
+
+    # --- 실시간(파일 감시) ---
+    def _set_live(self, on: bool):
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+        self._reload_timer.stop()
+        if not on:
+            return
+        self._att_mtime = self._file_mtime()
+        watch = [str(p) for p in (dm.ATT_FILE.parent, dm.ATT_FILE) if p.exists()]
+        if watch:
+            self._watcher.addPaths(watch)
+
+    def _on_file_event(self, _path: str):
+        # 교체 저장 뒤에는 파일 감시가 풀리므로 다시 건다
+        f = str(dm.ATT_FILE)
+        if dm.ATT_FILE.exists() and f not in self._watcher.files():
+            self._watcher.addPath(f)
+        self._reload_timer.start()
+
+    @staticmethod
+    def _file_mtime():
+        try:
+            return dm.ATT_FILE.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _reload_live(self):
+        # 같은 폴더의 다른 파일(스케줄 저장 등) 변경이면 근태 파일은 그대로 → 건너뜀
+        mtime = self._file_mtime()
+        if mtime == self._att_mtime:
+            return
+        self._att_mtime = mtime
+        # 바뀐 (날짜, 직원)마다 attendance_changed → 보이는 날짜면 그 행만 갱신
+        self.store.reload_attendance()
 
     # --- helpers ---
     def _selected_emp_id(self) -> Optional[int]:
@@ -157,35 +250,56 @@ class AttendanceDialog(QDialog):
 
     # --- 동작 ---
     def refresh(self):
+        """보이는 날짜 기준으로 표를 맞춘다. 행은 직원 구성이 바뀔 때만 다시 만들고, 칸은 바뀐 것만 고친다."""
+        roster = [(e.id, e.name) for e in self.employees]
+        if roster != self._roster:
+            self._rebuild_rows(roster)
+
         day_key = _date_key(self.date_edit.date())
-        att = load_attendance().get(day_key, {})
-        self.table.setRowCount(0)
-
-        for e in self.employees:
-            rec = att.get(str(e.id), {})
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            name_item = QTableWidgetItem(e.name)
-            name_item.setData(Qt.UserRole, e.id)  # emp_id 저장
+        att = self.store.attendance.get(day_key, {})
+        status = _day_status_map(self.store.schedules.get(day_key))  # 새로고침당 한 번
+        for emp_id, _name in roster:
+            self._sync_row(emp_id, att, status)
+
+    def _rebuild_rows(self, roster: List[Tuple[int, str]]):
+        self._roster = roster
+        self._rows = {}
+        self._shown = {}
+        self.table.setRowCount(len(roster))
+        for r, (emp_id, name) in enumerate(roster):
+            name_item = QTableWidgetItem(name)
+            name_item.setData(Qt.UserRole, emp_id)  # emp_id 저장
             self.table.setItem(r, 0, name_item)
-            self.table.setItem(r, 1, QTableWidgetItem(rec.get("in", "")))
-            self.table.setItem(r, 2, QTableWidgetItem(rec.get("out", "")))
-            self.table.setItem(r, 3, QTableWidgetItem(_get_status_for(e.id, day_key)))
+            for c in (1, 2, 3):
+                self.table.setItem(r, c, QTableWidgetItem(""))
+            self._rows[emp_id] = r
 
-        # 루프 끝난 뒤 한 번만 적용
+        # 행 구성이 바뀔 때만 크기 재계산
         self._apply_column_widths()
         self._fit_table_width_to_contents()
         self._fit_table_height_to_contents()
         self._sync_dialog_width()
 
+    def _sync_row(self, emp_id: int, att_day: Dict, status: Dict[int, str]):
+        """한 직원 행의 출근/퇴근/상태 중 바뀐 칸만 고친다."""
+        rec = att_day.get(str(emp_id), {})
+        vals = (rec.get("in", ""), rec.get("out", ""), status.get(emp_id, "—"))
+        old = self._shown.get(emp_id)
+        if old == vals:
+            return
+        r = self._rows[emp_id]
+        for c, v in enumerate(vals, start=1):
+            if old is None or old[c - 1] != v:
+                self.table.item(r, c).setText(v)
+        self._shown[emp_id] = vals
+
     def on_punch_in(self):
         emp_id = self._selected_emp_id()
         if not emp_id:
             QMessageBox.information(self, "안내", "출근할 직원을 선택해주세요.")
             return
         day_key = _date_key(self.date_edit.date())
-        punch_in(day_key, emp_id)  # 최초만 기록
-        self.refresh()
+        self.store.punch(day_key, emp_id, "in")  # 최초만 기록(표는 저장소 알림으로 갱신)
 
     def on_punch_out(self):
         emp_id = self._selected_emp_id()
@@ -193,8 +307,7 @@ class AttendanceDialog(QDialog):
             QMessageBox.information(self, "안내", "퇴근할 직원을 선택해주세요.")
             return
         day_key = _date_key(self.date_edit.date())
-        punch_out(day_key, emp_id)  # 최초만 기록
-        self.refresh()
+        self.store.punch(day_key, emp_id, "out")  # 최초만 기록(표는 저장소 알림으로 갱신)
 
     def on_adjust(self):
         r = self.table.currentRow()
@@ -211,10 +324,9 @@ class AttendanceDialog(QDialog):
             return
         new_in, new_out = dlg.values()
         day_key = _date_key(self.date_edit.date())
-        adjust_attendance(day_key, emp_id,
-                          in_time=new_in if new_in != cur_in else new_in,
-                          out_time=new_out if new_out != cur_out else new_out)
-        self.refresh()
+        self.store.adjust_attendance(day_key, emp_id,
+                                     in_time=new_in if new_in != cur_in else new_in,
+                                     out_time=new_out if new_out != cur_out else new_out)
 
     # ---- 폭/높이 계산 & 다이얼로그 동기화 ----
     def _fit_table_width_to_contents(self):
@@ -1,21 +1,165 @@
 # gui/day_editor.py
+from typing import Dict, List, Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
-    QCheckBox, QPushButton, QListWidget, QListWidgetItem, QMessageBox,
-    QGroupBox, QGridLayout, QComboBox
+    QCheckBox, QPushButton, QListView, QMessageBox,
+    QGroupBox, QGridLayout, QComboBox, QAbstractItemView
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
-from PySide6.QtCore import Qt
 from schedule_manager.models.schedule import DailySchedule
+from schedule_manager.utils.hangul import NameIndex
 
 ROLE_LABELS = ["전체", "사장", "매니저", "직원"]
 SKILL_LABELS = ["전체", "조리(○)", "비조리(X)"]
 BRANCH_LABELS = ["전체", "OS", "HC"]
+SLOTS = ("OS", "HC", "OFF")   # 모델 열 순서 = 3열 리스트 순서
 
-def open_day_editor(parent, date_key: str, employees, schedules) -> bool:
-    dlg = DayEditorDialog(parent, date_key, employees, schedules)
+def open_day_editor(parent, date_key: str, employees, schedules, name_index=None) -> bool:
+    dlg = DayEditorDialog(parent, date_key, employees, schedules, name_index)
     ok = dlg.exec()
     return bool(ok)
 
+
+def _is_checked(value) -> bool:
+    # 뷰에 따라 Qt.CheckState 또는 int로 들어온다
+    return value == Qt.Checked or value == Qt.Checked.value
+
+
+class DayAssignModel(QAbstractTableModel):
+    """
+    직원 1명 = 1행, 열 = OS/HC/OFF. 직원마다 상태 하나(None/OS/HC/OFF)만 가진다.
+    - 상호 배제는 상태 하나로 자연히 보장(다른 열은 상태가 None일 때만 활성).
+    - 열별 인원수는 상태가 바뀔 때 같이 갱신(목록을 다시 세지 않음).
+    """
+    counts_changed = Signal()
+
+    def __init__(self, employees, os_ids, hc_ids, off_ids, parent=None):
+        super().__init__(parent)
+        self._emps = list(employees)
+        self._text = [self._format_emp(e) for e in self._emps]
+        os_set, hc_set, off_set = set(os_ids), set(hc_ids), set(off_ids)
+        # 우선순위: OS > HC > 휴무(겹쳐 저장된 데이터는 앞쪽만 남김)
+        self._state: List[Optional[str]] = [
+            "OS" if e.id in os_set else "HC" if e.id in hc_set else "OFF" if e.id in off_set else None
+            for e in self._emps
+        ]
+        self._counts: Dict[str, int] = {k: self._state.count(k) for k in SLOTS}
+
+    @staticmethod
+    def _format_emp(e):
+        cook = "○" if getattr(e, "skill_level", "") in ("C", "cook") else "X"
+        return f"{e.name}    |    {e.role} / {cook} / {e.home_branch}"
+
+    # ---- Qt 모델 ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._emps)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(SLOTS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r = index.row()
+        if role == Qt.DisplayRole:
+            return self._text[r]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._state[r] == SLOTS[index.column()] else Qt.Unchecked
+        if role == Qt.UserRole:
+            return self._emps[r].id
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        state = self._state[index.row()]
+        if state is None or state == SLOTS[index.column()]:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsUserCheckable   # 다른 열에 체크됨 → 비활성
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not (self.flags(index) & Qt.ItemIsEnabled):
+            return False
+        self.set_state(index.row(), SLOTS[index.column()] if _is_checked(value) else None)
+        return True
+
+    # ---- 상태 ----
+    def employee(self, row: int):
+        return self._emps[row]
+
+    def count(self, slot: str) -> int:
+        return self._counts[slot]
+
+    def ids(self, slot: str) -> List[int]:
+        """해당 열에 체크된 직원 ID(직원 목록 순서)."""
+        return [e.id for e, st in zip(self._emps, self._state) if st == slot]
+
+    def set_state(self, row: int, state: Optional[str]):
+        old = self._state[row]
+        if old == state:
+            return
+        if old:
+            self._counts[old] -= 1
+        if state:
+            self._counts[state] += 1
+        self._state[row] = state
+        # 한 행의 세 열(체크 + 활성 여부)만 갱신
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(SLOTS) - 1),
+                              [Qt.CheckStateRole])
+        self.counts_changed.emit()
+
+    def _replace_states(self, states: List[Optional[str]]):
+        self._state = states
+        self._counts = {k: states.count(k) for k in SLOTS}
+        if self._emps:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._emps) - 1, len(SLOTS) - 1),
+                                  [Qt.CheckStateRole])
+        self.counts_changed.emit()
+
+    def clear_all(self):
+        self._replace_states([None] * len(self._emps))
+
+    def swap(self, a: str, b: str):
+        """a↔b 교환(그 외 상태는 유지)."""
+        self._replace_states([b if st == a else a if st == b else st for st in self._state])
+
+
+class DayFilterProxy(QSortFilterProxyModel):
+    """
+    검색/직급/숙련/지점 필터. 세 리스트가 이 프록시 하나를 열만 바꿔 공유 → 키 입력당 직원 수만큼 한 번만 검사.
+    검색어는 이름 색인(접두/부분/초성, "ㅎㄱㄷ" → 홍길동)으로 일치 ID 집합을 한 번 구해 두고 행마다 집합만 본다.
+    """
+    def __init__(self, parent=None, name_index: Optional[NameIndex] = None):
+        super().__init__(parent)
+        self._names = name_index
+        self._match: Optional[set] = None   # 검색어가 있을 때 일치하는 직원 ID
+        self._term = ""
+        self._role = "전체"
+        self._skill = "전체"
+        self._branch = "전체"
+
+    def set_filter(self, term: str, role: str, skill: str, branch: str):
+        if (term, role, skill, branch) == (self._term, self._role, self._skill, self._branch):
+            return
+        if term != self._term:
+            self._match = set(self._names.search(term)) if term and self._names is not None else None
+        self._term, self._role, self._skill, self._branch = term, role, skill, branch
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, row, parent):
+        e = self.sourceModel().employee(row)
+        if self._match is not None and e.id not in self._match: return False
+        if self._role   != "전체" and e.role        != self._role:   return False
+        if self._branch != "전체" and e.home_branch != self._branch: return False
+        if self._skill != "전체":
+            want_cook = self._skill.startswith("조리")
+            is_cook = getattr(e, "skill_level", "") in ("C", "cook")
+            if want_cook != is_cook: return False
+        return True
+
+
 class DayEditorDialog(QDialog):
     """
     클릭 중심 수동 배정:
@@ -25,8 +169,9 @@ class DayEditorDialog(QDialog):
       - OS/HC/휴무는 직원 1명이 동시 체크 불가(상호 배제)
       - 휴업 체크 시 모든 리스트 비우고 잠금
       - 저장 시 중복 제거(우선순위: OS/HC > 휴무)
+    세 리스트는 DayAssignModel 하나를 열만 바꿔 보여준다.
     """
-    def __init__(self, parent, date_key, employees, schedules):
+    def __init__(self, parent, date_key, employees, schedules, name_index: Optional[NameIndex] = None):
         super().__init__(parent)
         self.setWindowTitle(f"{date_key} 일정 편집")
         self.date_key = date_key
@@ -36,9 +181,6 @@ class DayEditorDialog(QDialog):
         self.sch = schedules.get(date_key) or DailySchedule(date_key)
         self.emp_by_id = {e.id: e for e in self.employees}
 
-        # id -> QListWidgetItem 매핑(상호 배제 제어용)
-        self.item_map = {"OS": {}, "HC": {}, "OFF": {}}
-
         v = QVBoxLayout(self)
         v.setContentsMargins(10, 10, 10, 10)
         v.setSpacing(8)
@@ -46,7 +188,7 @@ class DayEditorDialog(QDialog):
         # 상단 필터
         filter_box = QGroupBox("필터")
         grid = QGridLayout(filter_box); r = 0
-        self.ed_search = QLineEdit(); self.ed_search.setPlaceholderText("이름 검색")
+        self.ed_search = QLineEdit(); self.ed_search.setPlaceholderText("이름 검색 (초성 가능: ㅎㄱㄷ)")
         self.cmb_role = QComboBox();  self.cmb_role.addItems(ROLE_LABELS)
         self.cmb_skill = QComboBox(); self.cmb_skill.addItems(SKILL_LABELS)
         self.cmb_branch = QComboBox(); self.cmb_branch.addItems(BRANCH_LABELS)
@@ -65,6 +207,15 @@ class DayEditorDialog(QDialog):
         self.closed_cb.setChecked(bool(self.sch.closed))
         v.addWidget(self.closed_cb)
 
+        # 데이터 모델(직원당 상태 1개) + 공유 필터 프록시
+        self.model = DayAssignModel(
+            self.employees,
+            self.sch.working.get("OS") or [], self.sch.working.get("HC") or [], self.sch.holidays or [],
+            self,
+        )
+        self.proxy = DayFilterProxy(self, name_index or NameIndex.build(self.employees))
+        self.proxy.setSourceModel(self.model)
+
         # 중앙: OS / HC / 휴무 3열
         mid = QHBoxLayout(); mid.setSpacing(8)
         self.list_os  = self._make_list_group("OS",  "OS 근무", limit=2)
@@ -97,10 +248,8 @@ class DayEditorDialog(QDialog):
         btns.addWidget(self.btn_save)
         v.addLayout(btns)
 
-        # 데이터 바인딩
-        self._fill_lists()
-
         # 이벤트
+        self.model.counts_changed.connect(self._update_count_labels)
         self.closed_cb.toggled.connect(self._on_closed_toggled)
         self.btn_clear_all.clicked.connect(self._on_clear_all)
         self.btn_swap.clicked.connect(self._on_swap)
@@ -108,11 +257,10 @@ class DayEditorDialog(QDialog):
         self.btn_cancel.clicked.connect(self.reject)
         self.btn_save.clicked.connect(self._on_save)
 
+        self._update_count_labels()
         self._on_closed_toggled(self.closed_cb.isChecked())
         self.setMinimumWidth(560); self.setMinimumHeight(520)
 
-        self._exclusive_lock = False
-
     # ---------- UI 유틸 ----------
     def _make_list_group(self, key: str, title: str, limit: int | None):
         box = QGroupBox(title)
@@ -122,224 +270,60 @@ class DayEditorDialog(QDialog):
         info.setStyleSheet("color:#666; font-size:11px;")
         lv.addWidget(info)
 
-        listw = QListWidget()
-        listw.setUniformItemSizes(True)
-        listw.setAlternatingRowColors(True)
-        listw.setSelectionMode(QListWidget.NoSelection)
-        lv.addWidget(listw, 1)
+        listv = QListView()
+        listv.setModel(self.proxy)
+        listv.setModelColumn(SLOTS.index(key))
+        listv.setUniformItemSizes(True)
+        listv.setAlternatingRowColors(True)
+        listv.setSelectionMode(QAbstractItemView.NoSelection)
+        listv.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        lv.addWidget(listv, 1)
 
         # 클릭 전 상태 기억용
         last_pressed_state = {"state": None}
 
-        def on_item_pressed(item: QListWidgetItem):
-            # 클릭 직전 상태 저장 (체크박스 직접 클릭 시 Qt가 자동 토글하므로 비교 기준)
-            last_pressed_state["state"] = item.checkState()
+        def on_pressed(index):
+            # 클릭 직전 상태 저장 (체크박스 직접 클릭 시 델리게이트가 먼저 토글하므로 비교 기준)
+            last_pressed_state["state"] = index.data(Qt.CheckStateRole)
 
-        def on_item_clicked(item: QListWidgetItem):
+        def on_clicked(index):
             # 클릭 후 상태가 '변하지 않았다' = 텍스트/여백 클릭 → 수동 토글
-            if item.checkState() == last_pressed_state["state"]:
-                item.setCheckState(Qt.Unchecked if item.checkState() == Qt.Checked else Qt.Checked)
-            # 수동 토글이든 자동 토글이든 최종 처리는 itemChanged에서 한다
-
-        def on_item_changed(item: QListWidgetItem):
-            # 재진입 보호: 상호배제 처리 중이면 무시
-            if getattr(self, "_exclusive_lock", False):
-                return
-            eid = int(item.data(Qt.UserRole))
-            checked = (item.checkState() == Qt.Checked)
-            self._enforce_exclusive_after_toggle(source=key, eid=eid, checked=checked)
-            self._update_count_labels()
+            state = index.data(Qt.CheckStateRole)
+            if state == last_pressed_state["state"]:
+                self.proxy.setData(index, Qt.Unchecked if _is_checked(state) else Qt.Checked,
+                                   Qt.CheckStateRole)
+            # 상호 배제/인원수는 모델이 처리
 
-            # (선택) 제한 안내는 저장 시 검증. 여기서는 막지 않음.
+        listv.pressed.connect(on_pressed)
+        listv.clicked.connect(on_clicked)
 
-        listw.itemPressed.connect(on_item_pressed)
-        listw.itemClicked.connect(on_item_clicked)
-        listw.itemChanged.connect(on_item_changed)
-
-        return {"key": key, "box": box, "list": listw, "info": info, "limit": limit, "title": title}
-
-    def _format_emp(self, e):
-        cook = "○" if getattr(e, "skill_level", "") in ("C", "cook") else "X"
-        return f"{e.name}    |    {e.role} / {cook} / {e.home_branch}"
-
-    def _fill_lists(self):
-        os_ids = list(self.sch.working.get("OS") or [])
-        hc_ids = list(self.sch.working.get("HC") or [])
-        off_ids = list(self.sch.holidays or [])
-
-        # 초기화
-        for panel in (self.list_os, self.list_hc, self.list_off):
-            lw = panel["list"]
-            lw.blockSignals(True); lw.clear(); lw.blockSignals(False)
-        self.item_map = {"OS": {}, "HC": {}, "OFF": {}}
-
-        # 채우기 + 매핑 저장
-        def add_item(panel, e, checked):
-            lw = panel["list"]
-            lw.blockSignals(True)
-            it = QListWidgetItem(self._format_emp(e))
-            it.setData(Qt.UserRole, e.id)
-            it.setFlags(it.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            it.setCheckState(Qt.Checked if checked else Qt.Unchecked)
-            lw.addItem(it)
-            lw.blockSignals(False)
-            self.item_map[panel["key"]][e.id] = it
-
-        for e in self.employees:
-            add_item(self.list_os,  e, e.id in os_ids)
-            add_item(self.list_hc,  e, e.id in hc_ids)
-            add_item(self.list_off, e, e.id in off_ids)
-
-        # 초기 상호 배제 상태 반영
-        for eid in self.emp_by_id.keys():
-            # 우선순위: OS/HC가 체크되어 있으면 OFF는 막힘, 둘 다 해제일 때만 OFF 사용 가능
-            if self.item_map["OS"][eid].checkState() == Qt.Checked:
-                self._set_enabled(self.item_map["HC"][eid],  False)
-                self._set_enabled(self.item_map["OFF"][eid], False)
-            elif self.item_map["HC"][eid].checkState() == Qt.Checked:
-                self._set_enabled(self.item_map["OS"][eid],  False)
-                self._set_enabled(self.item_map["OFF"][eid], False)
-            elif self.item_map["OFF"][eid].checkState() == Qt.Checked:
-                self._set_enabled(self.item_map["OS"][eid],  False)
-                self._set_enabled(self.item_map["HC"][eid],  False)
-
-        self._apply_filter()
-        self._update_count_labels()
+        return {"key": key, "box": box, "list": listv, "info": info, "limit": limit, "title": title}
 
     def _apply_filter(self):
-        term   = self.ed_search.text().strip()
-        role   = self.cmb_role.currentText()
-        skill  = self.cmb_skill.currentText()
-        branch = self.cmb_branch.currentText()
-
-        def visible(e):
-            if term and term not in e.name: return False
-            if role  != "전체" and e.role         != role:   return False
-            if branch!= "전체" and e.home_branch  != branch: return False
-            if skill != "전체":
-                want_cook = skill.startswith("조리")
-                is_cook = getattr(e, "skill_level", "") in ("C", "cook")
-                if want_cook != is_cook: return False
-            return True
-
-        for panel in (self.list_os, self.list_hc, self.list_off):
-            lw = panel["list"]
-            for i in range(lw.count()):
-                it = lw.item(i)
-                e  = self.emp_by_id.get(int(it.data(Qt.UserRole)))
-                lw.setRowHidden(i, not visible(e))
-
-    # ---------- 상호 배제 ----------
-    def _set_enabled(self, item: QListWidgetItem, enabled: bool):
-        lw = item.listWidget()
-        if lw:
-            lw.blockSignals(True)
-        try:
-            flags = item.flags()
-            if enabled:
-                item.setFlags((flags | Qt.ItemIsEnabled | Qt.ItemIsUserCheckable))
-            else:
-                # 비활성화 + 체크 해제(있다면)
-                item.setFlags((flags | Qt.ItemIsUserCheckable) & ~Qt.ItemIsEnabled)
-                if item.checkState() == Qt.Checked:
-                    item.setCheckState(Qt.Unchecked)  # 신호 차단 중이므로 재귀 없음
-        finally:
-            if lw:
-                lw.blockSignals(False)
-
-    def _enforce_exclusive_after_toggle(self, source: str, eid: int, checked: bool):
-        if self._exclusive_lock:
-            return
-        self._exclusive_lock = True
-        try:
-            others = [k for k in ("OS", "HC", "OFF") if k != source]
-            if checked:
-                # source에 체크되면 나머지 두 패널은 비활성화(+체크해제)
-                for k in others:
-                    it = self.item_map[k][eid]
-                    self._set_enabled(it, False)
-            else:
-                # source에서 해제 → 다른 패널들 활성화
-                for k in others:
-                    it = self.item_map[k][eid]
-                    self._set_enabled(it, True)
-                # 단, 다른 한 쪽이 이미 체크였다면(예: OFF가 체크) 반대편은 막는다
-                checked_others = [k for k in others if self.item_map[k][eid].checkState() == Qt.Checked]
-                if checked_others:
-                    for k in others:
-                        if k not in checked_others:
-                            self._set_enabled(self.item_map[k][eid], False)
-        finally:
-            self._exclusive_lock = False
-
-    def _checked_ids(self, listw: QListWidget):
-        ids = []
-        for i in range(listw.count()):
-            it = listw.item(i)
-            if it.checkState() == Qt.Checked:
-                ids.append(int(it.data(Qt.UserRole)))
-        return ids
+        self.proxy.set_filter(
+            self.ed_search.text().strip(),
+            self.cmb_role.currentText(),
+            self.cmb_skill.currentText(),
+            self.cmb_branch.currentText(),
+        )
 
     def _update_count_labels(self):
-        self.list_os["info"].setText(f"({len(self._checked_ids(self.list_os['list']))}명 선택)")
-        self.list_hc["info"].setText(f"({len(self._checked_ids(self.list_hc['list']))}명 선택)")
-        self.list_off["info"].setText(f"({len(self._checked_ids(self.list_off['list']))}명 선택)")
+        for panel in (self.list_os, self.list_hc, self.list_off):
+            panel["info"].setText(f"({self.model.count(panel['key'])}명 선택)")
 
     # ---------- 액션 ----------
     def _on_clear_all(self):
-        for key, panel in (("OS", self.list_os), ("HC", self.list_hc), ("OFF", self.list_off)):
-            lw = panel["list"]
-            lw.blockSignals(True)
-            for i in range(lw.count()):
-                it = lw.item(i); it.setCheckState(Qt.Unchecked)
-            lw.blockSignals(False)
-        # 전체 활성화
-        for eid in self.emp_by_id.keys():
-            self._set_enabled(self.item_map["OS"][eid],  True)
-            self._set_enabled(self.item_map["HC"][eid],  True)
-            self._set_enabled(self.item_map["OFF"][eid], True)
-        self._update_count_labels()
+        self.model.clear_all()
 
     def _on_swap(self):
-        # OS↔HC 체크 상태 교환(휴무는 유지). 상호 배제에 맞춰 다시 enable/disable.
-        os_checked = set(self._checked_ids(self.list_os["list"]))
-        hc_checked = set(self._checked_ids(self.list_hc["list"]))
-
-        # 모두 해제
-        for panel in (self.list_os, self.list_hc):
-            lw = panel["list"]
-            lw.blockSignals(True)
-            for i in range(lw.count()):
-                lw.item(i).setCheckState(Qt.Unchecked)
-            lw.blockSignals(False)
-
-        # 다시 체크
-        def set_checked(panel_key: str, ids):
-            lw = {"OS": self.list_os["list"], "HC": self.list_hc["list"]}[panel_key]
-            lw.blockSignals(True)
-            for i in range(lw.count()):
-                eid = int(lw.item(i).data(Qt.UserRole))
-                if eid in ids:
-                    lw.item(i).setCheckState(Qt.Checked)
-            lw.blockSignals(False)
-
-        set_checked("OS", hc_checked)
-        set_checked("HC", os_checked)
-        # OFF 체크는 유지됨. 이제 전체 enable/disable 상태를
-        # 현재 체크 결과 기준으로 '전면 재계산'하여 잔여 블락을 해제/적용
-        self._refresh_exclusive_states_all()
-
-        self._update_count_labels()
+        # OS↔HC 체크 상태 교환(휴무는 유지). 상태가 하나뿐이라 상호 배제는 그대로 맞는다.
+        self.model.swap("OS", "HC")
 
     def _on_closed_toggled(self, checked: bool):
         for panel in (self.list_os, self.list_hc, self.list_off):
             panel["box"].setDisabled(checked)
-            if checked:
-                lw = panel["list"]
-                lw.blockSignals(True)
-                for i in range(lw.count()):
-                    lw.item(i).setCheckState(Qt.Unchecked)
-                lw.blockSignals(False)
+        if checked:
+            self.model.clear_all()
         self.memo_edit.setDisabled(False)
 
     def _on_delete(self):
@@ -360,12 +344,10 @@ class DayEditorDialog(QDialog):
             self.accept()
             return
 
-        os_ids  = self._checked_ids(self.list_os["list"])
-        hc_ids  = self._checked_ids(self.list_hc["list"])
-        off_ids = self._checked_ids(self.list_off["list"])
-
-        # 상호 배제는 이미 UI에서 강제되지만, 저장 직전에도 한번 더 정리
-        off_ids = [i for i in off_ids if i not in os_ids and i not in hc_ids]
+        # 직원당 상태가 하나라 OS/HC/휴무 중복은 생길 수 없다
+        os_ids  = self.model.ids("OS")
+        hc_ids  = self.model.ids("HC")
+        off_ids = self.model.ids("OFF")
 
         # OS/HC 인원 제한 검증
         over_parts = []
@@ -392,38 +374,3 @@ class DayEditorDialog(QDialog):
         self.schedules[self.date_key] = self.sch
         QMessageBox.information(self, "저장", "일정이 저장되었습니다.")
         self.accept()
-
-    def _refresh_exclusive_states_all(self):
-        """현재 체크 상태(OS/HC/OFF)를 기준으로 각 항목의 enable/disable을 다시 계산한다."""
-        # 재귀 방지 락
-        if getattr(self, "_exclusive_lock", False):
-            return
-        self._exclusive_lock = True
-        try:
-            for eid in self.emp_by_id.keys():
-                it_os = self.item_map["OS"][eid]
-                it_hc = self.item_map["HC"][eid]
-                it_off = self.item_map["OFF"][eid]
-
-                os_checked = (it_os.checkState() == Qt.Checked)
-                hc_checked = (it_hc.checkState() == Qt.Checked)
-                off_checked = (it_off.checkState() == Qt.Checked)
-
-                # 기본은 모두 활성화
-                self._set_enabled(it_os, True)
-                self._set_enabled(it_hc, True)
-                self._set_enabled(it_off, True)
-
-                # 현재 상태에 따른 상호배제 적용
-                if os_checked:
-                    self._set_enabled(it_hc, False)
-                    self._set_enabled(it_off, False)
-                elif hc_checked:
-                    self._set_enabled(it_os, False)
-                    self._set_enabled(it_off, False)
-                elif off_checked:
-                    self._set_enabled(it_os, False)
-                    self._set_enabled(it_hc, False)
-                # 아무 데도 체크 안됐으면 모두 활성화 유지
-        finally:
-            self._exclusive_lock = False
@@ -8,12 +8,10 @@ from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QDate
 from PySide6.QtGui import QAction, QColor, QBrush
 from PySide6.QtWidgets import (
     QDialog, QHBoxLayout, QVBoxLayout, QListWidget, QTableView, QHeaderView,
-    QLabel, QPushButton, QMenu
+    QLabel, QPushButton, QMenu, QLineEdit
 )
 
-from schedule_manager.data.data_manager import (
-    load_employees, load_schedules, save_schedules
-)
+from schedule_manager.data.store import get_store
 
 BRANCHES = ("OS", "HC")
 WEEKDAYS_KR = ["일", "월", "화", "수", "목", "금", "토"]
@@ -116,16 +114,21 @@ def set_emp_status(schedules: Dict, y: int, m: int, d: int, emp_id: int, status:
 
 # ---- 테이블 모델 (달력 그리드) ----
 class EmployeeMonthModel(QAbstractTableModel):
-    def __init__(self, schedules: Dict, year: int, month: int, emp_id: int, parent=None):
+    """
+    status: 미리 계산된 {일: 상태}(월 캐시의 MonthView.status). 없으면 여기서 한 번 계산.
+    data()는 칸마다 여러 role로 불리므로 스케줄을 매번 뒤지지 않고 이 표를 본다.
+    """
+    def __init__(self, schedules: Dict, year: int, month: int, emp_id: int, parent=None,
+                 status: Optional[Dict[int, str]] = None):
         super().__init__(parent)
         self.schedules = schedules
         self.year = year
         self.month = month
         self.emp_id = emp_id
-        self._rebuild_grid()
+        self._rebuild_grid(status)
 
     # 달력 그리드 구성 (주차 x 요일)
-    def _rebuild_grid(self):
+    def _rebuild_grid(self, status: Optional[Dict[int, str]] = None):
         first = QDate(self.year, self.month, 1)
         days = first.daysInMonth()
         # QDate.dayOfWeek(): Mon=1 .. Sun=7 → 일=0, 월=1 ... 토=6
@@ -143,6 +146,15 @@ class EmployeeMonthModel(QAbstractTableModel):
                     self.grid[i][j] = day
                     day += 1
 
+        if status is not None:
+            self._status = dict(status)
+        else:
+            self._status = {}
+            for d in range(1, days + 1):
+                st = get_emp_status(self.schedules, self.year, self.month, d, self.emp_id)
+                if st is not None:
+                    self._status[d] = st
+
     # Qt 모델 필수 구현
     def rowCount(self, _=QModelIndex()):
         return len(self.grid)
@@ -176,7 +188,7 @@ class EmployeeMonthModel(QAbstractTableModel):
                 return QBrush(QColor("#1f2937"))
             return None
 
-        status = get_emp_status(self.schedules, self.year, self.month, day, self.emp_id)
+        status = self._status.get(day)
 
         if role == Qt.DisplayRole:
             label = "—" if status is None else ("휴무" if status == "OFF" else status)
@@ -206,22 +218,37 @@ class EmployeeMonthModel(QAbstractTableModel):
         return None
 
     # 유틸
-    def refresh(self):
+    def refresh(self, status: Optional[Dict[int, str]] = None):
         self.beginResetModel()
-        self._rebuild_grid()
+        self._rebuild_grid(status)
         self.endResetModel()
 
     def day_at(self, row: int, col: int):
         return self.grid[row][col]
 
+    def update_day(self, day: int) -> None:
+        """해당 날짜 상태를 다시 읽고 그 칸만 dataChanged."""
+        st = get_emp_status(self.schedules, self.year, self.month, day, self.emp_id)
+        if st is None:
+            self._status.pop(day, None)
+        else:
+            self._status[day] = st
+        for r, week in enumerate(self.grid):
+            if day in week:
+                idx = self.index(r, week.index(day))
+                self.dataChanged.emit(idx, idx)
+                return
+
 # ---- 다이얼로그 ----
 class EmployeeInspectorDialog(QDialog):
     """
     직원 목록(좌) + 직원별 월 달력(우)
+    목록 위 검색창: 이름 접두/부분/초성("ㅎㄱㄷ") 또는 ID(저장소 이름 색인)
     더블클릭: 휴무 <-> 근무(OS) 토글
     우클릭: OS/HC/휴무/제거 메뉴
     """
-    def __init__(self, year: int, month: int, parent=None, on_changed: Optional[Callable] = None):
+    def __init__(self, year: int, month: int, parent=None, on_changed: Optional[Callable] = None,
+                 store=None, month_cache=None):
         super().__init__(parent)
         self.setWindowTitle("직원별 근무/휴무")
         self.resize(1100, 540)
@@ -229,10 +256,13 @@ class EmployeeInspectorDialog(QDialog):
         self.year = year
         self.month = month
         self.on_changed = on_changed
-
-        self.employees = load_employees()
-        self.schedules = load_schedules()
+        # 앱 저장소의 데이터를 그대로 본다(열 때 파일을 다시 읽지 않음). 저장도 저장소를 거친다.
+        self.store = store or get_store()
+        self.month_cache = month_cache  # 있으면 미리 계산된 달의 직원별 상태를 재사용
+        self.employees = self.store.employees
+        self.schedules = self.store.schedules
         self.current_emp_id: Optional[int] = None
+        self._list_ids: List[int] = []   # 목록 행 → 직원 ID(검색 중이면 걸린 직원만)
 
         # 상단 바(월 이동)
         top = QHBoxLayout()
@@ -244,10 +274,12 @@ class EmployeeInspectorDialog(QDialog):
         top.addWidget(self.btn_next)
         top.addStretch(1)
 
-        # 좌: 직원 리스트
+        # 좌: 검색 + 직원 리스트
+        self.ed_search = QLineEdit()
+        self.ed_search.setPlaceholderText("이름/초성/ID 검색")
+        self.ed_search.setClearButtonEnabled(True)
         self.list = QListWidget()
-        for e in self.employees:
-            self.list.addItem(f"{e.id}: {e.name}")
+        self._fill_list()
 
         # 우: 테이블
         self.table = QTableView()
@@ -271,7 +303,10 @@ class EmployeeInspectorDialog(QDialog):
         root = QVBoxLayout(self)
         root.addLayout(top)
         body = QHBoxLayout()
-        body.addWidget(self.list, 1)
+        left = QVBoxLayout()
+        left.addWidget(self.ed_search)
+        left.addWidget(self.list)
+        body.addLayout(left, 1)
         body.addWidget(self.table, 4)
         root.addLayout(body)
 
@@ -279,13 +314,65 @@ class EmployeeInspectorDialog(QDialog):
         self.btn_prev.clicked.connect(self._prev_month)
         self.btn_next.clicked.connect(self._next_month)
         self.list.currentRowChanged.connect(self._on_select)
+        self.ed_search.textChanged.connect(lambda _t: self._on_store_employees_changed())
+
+        # 다른 창에서의 편집도 저장소 알림으로 반영
+        self._unsubs = [
+            self.store.subscribe("day_changed", self._on_store_day_changed),
+            self.store.subscribe("employee_changed", self._on_store_employees_changed),
+            self.store.subscribe("reloaded", self._on_store_reloaded),
+        ]
+        self.finished.connect(self._detach_store)
 
         # 초기 상태
         self._update_month_label()
         if self.list.count() > 0:
             self.list.setCurrentRow(0)
 
+    # 저장소 알림
+    def _detach_store(self, *_):
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    def _on_store_day_changed(self, key: str):
+        if getattr(self, "model", None) is None or key[:7] != f"{self.year:04d}-{self.month:02d}":
+            return
+        self.model.update_day(int(key[8:10]))
+
+    def _on_store_employees_changed(self, _emp_id=None):
+        prev = self.current_emp_id
+        self._fill_list()
+        row = self._list_ids.index(prev) if prev in self._list_ids else -1
+        if row < 0 and self._list_ids:
+            row = 0
+        self.list.setCurrentRow(row)
+        if row >= 0 and self._list_ids[row] == prev:
+            return  # 같은 직원 유지 → 달력은 그대로
+        self._on_select(row)
+
+    def _on_store_reloaded(self):
+        self._on_store_employees_changed()
+        if getattr(self, "model", None) is not None:
+            self.model.refresh(self._cached_status())
+
     # 내부
+    def _fill_list(self):
+        by_id = {e.id: e for e in self.employees}
+        term = self.ed_search.text().strip()
+        if term:
+            ids = self.store.name_index().search(term)
+            if term.isdigit() and int(term) in by_id:
+                ids = [int(term)] + [i for i in ids if i != int(term)]
+        else:
+            ids = list(by_id)
+        self._list_ids = [i for i in ids if i in by_id]
+        self.list.blockSignals(True)
+        self.list.clear()
+        for emp_id in self._list_ids:
+            self.list.addItem(f"{emp_id}: {by_id[emp_id].name}")
+        self.list.blockSignals(False)
+
     def _update_month_label(self):
         days = calendar.monthrange(self.year, self.month)[1]
         self.lbl_month.setText(f"{self.year}-{self.month:02d}  (일수 {days}일)")
@@ -294,16 +381,25 @@ class EmployeeInspectorDialog(QDialog):
         if self.current_emp_id is None:
             self.table.setModel(None)
             return
-        self.model = EmployeeMonthModel(self.schedules, self.year, self.month, self.current_emp_id, self)
+        self.model = EmployeeMonthModel(self.schedules, self.year, self.month, self.current_emp_id, self,
+                                        status=self._cached_status())
         self.table.setModel(self.model)
 
+    def _cached_status(self) -> Optional[Dict[int, str]]:
+        if self.month_cache is None or self.current_emp_id is None:
+            return None
+        view = self.month_cache.get(self.year, self.month)
+        if view is None:
+            return None
+        return view.status.get(self.current_emp_id, {})
+
     # slots
     def _on_select(self, _row: int):
-        if _row < 0 or _row >= len(self.employees):
+        if _row < 0 or _row >= len(self._list_ids):
             self.current_emp_id = None
             self.table.setModel(None)
             return
-        self.current_emp_id = self.employees[_row].id
+        self.current_emp_id = self._list_ids[_row]
         self._load_model()
 
     def _prev_month(self):
@@ -315,7 +411,7 @@ class EmployeeInspectorDialog(QDialog):
         self._update_month_label()
         if getattr(self, "model", None):
             self.model.year, self.model.month = self.year, self.month
-            self.model.refresh()
+            self.model.refresh(self._cached_status())
 
     def _next_month(self):
         if self.month == 12:
@@ -326,7 +422,7 @@ class EmployeeInspectorDialog(QDialog):
         self._update_month_label()
         if getattr(self, "model", None):
             self.model.year, self.model.month = self.year, self.month
-            self.model.refresh()
+            self.model.refresh(self._cached_status())
 
     def _on_double(self, index: QModelIndex):
         if not index.isValid() or self.current_emp_id is None:
@@ -340,11 +436,7 @@ class EmployeeInspectorDialog(QDialog):
 
         # nxt == None 이면 미배정(완전 제거)
         set_emp_status(self.schedules, self.year, self.month, day, self.current_emp_id, nxt)
-
-        save_schedules(self.schedules)
-        self.model.refresh()
-        if self.on_changed:
-            self.on_changed()
+        self._commit_day(day)
 
     def _ctx_menu(self, pos):
         index = self.table.indexAt(pos)
@@ -378,9 +470,12 @@ class EmployeeInspectorDialog(QDialog):
             set_emp_status(self.schedules, self.year, self.month, day, self.current_emp_id, "OFF")
         elif act == a_clear:
             set_emp_status(self.schedules, self.year, self.month, day, self.current_emp_id, None)
+        self._commit_day(day)
 
-        save_schedules(self.schedules)
-        self.model.refresh()
+    def _commit_day(self, day: int):
+        """하루 편집 저장. 칸 갱신은 저장소 알림(_on_store_day_changed)으로 한다."""
+        key = f"{self.year:04d}-{self.month:02d}-{day:02d}"
+        self.store.commit_day(key)
         if self.on_changed:
             self.on_changed()
 
@@ -0,0 +1,107 @@
+# schedule_manager/gui/views/memo_search.py
+"""
+날짜 메모/노트 검색 창.
+
+입력이 잠잠해지면(SEARCH_IDLE_MS) 저장소 search_text()로 찾는다(글자 2-gram 역색인, 달을 넘겨 가며 찾지 않음).
+결과를 더블클릭하면 메모는 date_activated(날짜 키), 노트는 notes_line_activated(줄 번호)로 알린다.
+"""
+from __future__ import annotations
+import time
+
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLineEdit, QLabel, QTableWidget, QTableWidgetItem,
+    QAbstractItemView, QHeaderView
+)
+
+from schedule_manager.data.store import get_store
+
+SEARCH_IDLE_MS = 150
+MAX_HITS = 500
+COLUMNS = ["위치", "내용"]
+HitRole = Qt.UserRole
+
+
+class MemoSearchDialog(QDialog):
+    date_activated = Signal(str)
+    notes_line_activated = Signal(int)
+
+    def __init__(self, parent=None, store=None):
+        super().__init__(parent)
+        self.setWindowTitle("메모 검색")
+        self.resize(640, 520)
+        self.store = store or get_store()
+
+        self.txt_query = QLineEdit()
+        self.txt_query.setPlaceholderText("날짜 메모/노트에서 찾기 (예: 휴무신청, 회식)")
+        self.txt_query.setClearButtonEnabled(True)
+        self.lbl_info = QLabel("")
+        self.lbl_info.setStyleSheet("color:#555; font-size:11px;")
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.setWordWrap(False)
+
+        v = QVBoxLayout(self)
+        v.addWidget(self.txt_query)
+        v.addWidget(self.lbl_info)
+        v.addWidget(self.table)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SEARCH_IDLE_MS)
+        self._timer.timeout.connect(self._run_search)
+        self.txt_query.textChanged.connect(lambda _t: self._timer.start())
+        self.txt_query.returnPressed.connect(self._run_search)
+        self.table.cellDoubleClicked.connect(self._on_activated)
+
+        # 창이 열려 있는 동안 메모가 바뀌면 같은 질의로 다시 찾기
+        self._unsubs = [
+            self.store.subscribe("day_changed", lambda _key: self._rerun()),
+            self.store.subscribe("reloaded", self._rerun),
+        ]
+        self.finished.connect(self._detach_store)
+
+    def _detach_store(self, *_):
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    def _rerun(self):
+        if self.txt_query.text().strip():
+            self._timer.start()
+
+    def _run_search(self):
+        self._timer.stop()
+        query = self.txt_query.text().strip()
+        t0 = time.perf_counter()
+        hits = self.store.search_text(query, limit=MAX_HITS) if query else []
+        ms = (time.perf_counter() - t0) * 1000
+
+        self.table.setRowCount(len(hits))
+        for r, hit in enumerate(hits):
+            loc = QTableWidgetItem(hit.label)
+            loc.setData(HitRole, (hit.kind, hit.key))
+            self.table.setItem(r, 0, loc)
+            self.table.setItem(r, 1, QTableWidgetItem(hit.snippet))
+        if not query:
+            self.lbl_info.setText("")
+        else:
+            more = " 이상" if len(hits) >= MAX_HITS else ""
+            self.lbl_info.setText(f"{len(hits)}건{more} · {ms:.1f}ms")
+
+    def _on_activated(self, row: int, _col: int):
+        item = self.table.item(row, 0)
+        if item is None:
+            return
+        kind, key = item.data(HitRole)
+        if kind == "memo":
+            self.date_activated.emit(key)
+        else:
+            self.notes_line_activated.emit(key)
@@ -0,0 +1,217 @@
+# schedule_manager/gui/views/roster_heatmap.py
+"""
+전체 직원 × 한 달 근무표(히트맵).
+
+행 = 직원, 열 = 일. 달이 바뀔 때 한 번 RosterGrid(bytearray, 칸당 1바이트 상태 코드)를 만들고,
+data()는 배열 인덱싱 + 미리 만든 브러시/문자열만 돌려준다(칸마다 스케줄을 뒤지지 않음).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List
+import calendar
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QBrush
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QLabel, QPushButton
+)
+
+from schedule_manager.data.store import get_store
+from schedule_manager.gui.month_cache import shift_month
+
+# 상태 코드(칸당 1바이트)
+NONE, OS, HC, OFF, CLOSED = range(5)
+LABELS = ("", "OS", "HC", "휴", "")
+TIPS = ("미배정", "근무(OS)", "근무(HC)", "휴무", "휴업")
+COLORS = ("#ffe0e0", "#cfe8ff", "#cfeee0", "#e9ecef", "#f5f5f7")
+WEEKDAYS_MON = ["월", "화", "수", "목", "금", "토", "일"]   # calendar.weekday() 순서
+
+# data()는 보이는 칸마다 role 7~8개로 불린다. PySide에서 Qt.XxxRole 속성 조회는 호출마다 비싸므로
+# 모듈 상수로 한 번만 꺼내 둔다.
+_DISPLAY = Qt.DisplayRole
+_BACKGROUND = Qt.BackgroundRole
+_ALIGN = Qt.TextAlignmentRole
+_TOOLTIP = Qt.ToolTipRole
+_CENTER = Qt.AlignCenter
+
+
+@dataclass
+class RosterGrid:
+    year: int
+    month: int
+    days: int
+    emp_ids: List[int]
+    names: List[str]
+    cells: bytearray           # 행 우선: cells[row * days + (day - 1)]
+
+    def at(self, row: int, day: int) -> int:
+        return self.cells[row * self.days + day - 1]
+
+
+def _day_codes(sch, row_of: Dict[int, int]) -> Dict[int, int]:
+    """하루 스케줄 → {행: 코드}. 겹치면 휴무 > OS > HC(달력 MonthView.status와 같은 우선순위)."""
+    codes: Dict[int, int] = {}
+    if sch is None:
+        return codes
+    working = getattr(sch, "working", None) or {}
+    for code, ids in ((HC, working.get("HC")), (OS, working.get("OS")),
+                      (OFF, getattr(sch, "holidays", None))):
+        for i in ids or []:
+            r = row_of.get(i)
+            if r is not None:
+                codes[r] = code
+    return codes
+
+
+def build_roster_grid(year: int, month: int, employees, schedules: Dict) -> RosterGrid:
+    days = calendar.monthrange(year, month)[1]
+    emp_ids = [e.id for e in employees]
+    row_of = {emp_id: r for r, emp_id in enumerate(emp_ids)}
+    cells = bytearray(len(emp_ids) * days)
+    for day in range(1, days + 1):
+        _fill_column(cells, days, len(emp_ids), day, schedules.get(f"{year:04d}-{month:02d}-{day:02d}"), row_of)
+    return RosterGrid(year, month, days, emp_ids, [e.name for e in employees], cells)
+
+
+def _fill_column(cells: bytearray, days: int, n_rows: int, day: int, sch, row_of: Dict[int, int]) -> None:
+    col = day - 1
+    if sch is not None and getattr(sch, "closed", False):
+        cells[col::days] = bytes([CLOSED]) * n_rows
+        return
+    cells[col::days] = bytes(n_rows)
+    for r, code in _day_codes(sch, row_of).items():
+        cells[r * days + col] = code
+
+
+class RosterHeatmapModel(QAbstractTableModel):
+    def __init__(self, grid: RosterGrid, parent=None):
+        super().__init__(parent)
+        # role → 코드별 값(칸 값은 코드로 인덱싱)
+        self._by_role = {
+            _DISPLAY: LABELS,
+            _BACKGROUND: tuple(QBrush(QColor(c)) for c in COLORS),
+            _ALIGN: (_CENTER,) * len(COLORS),
+        }
+        self._set_grid(grid)
+
+    def _set_grid(self, grid: RosterGrid):
+        self.grid = grid
+        self._row_of = {emp_id: r for r, emp_id in enumerate(grid.emp_ids)}
+        self._col_headers = [
+            f"{d}\n{WEEKDAYS_MON[calendar.weekday(grid.year, grid.month, d)]}"
+            for d in range(1, grid.days + 1)
+        ]
+
+    # ---- Qt 모델 ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.grid.emp_ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.grid.days
+
+    def headerData(self, section, orientation, role=_DISPLAY):
+        if role != _DISPLAY:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._col_headers[section]
+        return self.grid.names[section]
+
+    def data(self, index, role=_DISPLAY):
+        values = self._by_role.get(role)
+        if values is None and role != _TOOLTIP:
+            return None
+        g = self.grid
+        code = g.cells[index.row() * g.days + index.column()]
+        if values is not None:
+            return values[code]
+        return f"{g.names[index.row()]} · {g.year}-{g.month:02d}-{index.column() + 1:02d} {TIPS[code]}"
+
+    # ---- 갱신 ----
+    def set_grid(self, grid: RosterGrid):
+        self.beginResetModel()
+        self._set_grid(grid)
+        self.endResetModel()
+
+    def update_day(self, day: int, sch) -> None:
+        """하루 열만 다시 계산하고 그 열만 dataChanged."""
+        g = self.grid
+        _fill_column(g.cells, g.days, len(g.emp_ids), day, sch, self._row_of)
+        if g.emp_ids:
+            self.dataChanged.emit(self.index(0, day - 1), self.index(len(g.emp_ids) - 1, day - 1))
+
+
+class RosterHeatmapDialog(QDialog):
+    """전체 직원의 한 달 근무/휴무를 한눈에(읽기 전용). 편집은 다른 창에서 → 저장소 알림으로 반영."""
+    def __init__(self, year: int, month: int, parent=None, store=None):
+        super().__init__(parent)
+        self.setWindowTitle("전체 근무표")
+        self.resize(1200, 640)
+        self.year = year
+        self.month = month
+        self.store = store or get_store()
+
+        top = QHBoxLayout()
+        self.btn_prev = QPushButton("◀")
+        self.btn_next = QPushButton("▶")
+        self.lbl_month = QLabel()
+        self.lbl_legend = QLabel(
+            "  ".join(f"<span style='background:{COLORS[c]}'>&nbsp;{TIPS[c]}&nbsp;</span>"
+                      for c in (OS, HC, OFF, NONE, CLOSED))
+        )
+        top.addWidget(self.btn_prev)
+        top.addWidget(self.lbl_month)
+        top.addWidget(self.btn_next)
+        top.addStretch(1)
+        top.addWidget(self.lbl_legend)
+
+        self.model = RosterHeatmapModel(self._build_grid(), self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # 칸 크기 고정: 스크롤/갱신 때 행·열 크기를 재지 않음
+        hh, vh = self.table.horizontalHeader(), self.table.verticalHeader()
+        hh.setSectionResizeMode(QHeaderView.Fixed)
+        hh.setDefaultSectionSize(30)
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(22)
+        self.table.setShowGrid(True)
+        self.table.setWordWrap(False)
+        self.table.setStyleSheet("QTableView { font-size: 11px; }")
+
+        root = QVBoxLayout(self)
+        root.addLayout(top)
+        root.addWidget(self.table)
+
+        self.btn_prev.clicked.connect(lambda: self._move_month(-1))
+        self.btn_next.clicked.connect(lambda: self._move_month(1))
+
+        self._unsubs = [
+            self.store.subscribe("day_changed", self._on_store_day_changed),
+            self.store.subscribe("employee_changed", lambda _emp_id: self._reload()),
+            self.store.subscribe("reloaded", self._reload),
+        ]
+        self.finished.connect(self._detach_store)
+        self._update_month_label()
+
+    def _detach_store(self, *_):
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    def _build_grid(self) -> RosterGrid:
+        return build_roster_grid(self.year, self.month, self.store.employees, self.store.schedules)
+
+    def _reload(self):
+        self.model.set_grid(self._build_grid())
+        self._update_month_label()
+
+    def _update_month_label(self):
+        self.lbl_month.setText(f"{self.year}-{self.month:02d}  (직원 {len(self.model.grid.emp_ids)}명)")
+
+    def _move_month(self, delta: int):
+        self.year, self.month = shift_month(self.year, self.month, delta)
+        self._reload()
+
+    def _on_store_day_changed(self, key: str):
+        if key[:7] != f"{self.year:04d}-{self.month:02d}":
+            return
+        self.model.update_day(int(key[8:10]), self.store.schedules.get(key))
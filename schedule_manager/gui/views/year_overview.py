@@ -0,0 +1,197 @@
+# schedule_manager/gui/views/year_overview.py
+"""
+연간 보기(히트맵): 행 = 월, 열 = 일 + 달 합계.
+
+칸 색 = 그날 충원 수(지점별 필요 인원까지만, 0~4), 휴업은 회색. 저장소 월별 집계(month_aggregates())만 읽고
+날짜 기록은 훑지 않는다. 날짜가 바뀌면 그 달 행만 다시 그린다. 날짜 칸 더블클릭 → date_activated(날짜 키).
+"""
+from __future__ import annotations
+from typing import List
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtGui import QColor, QBrush
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QLabel, QPushButton
+)
+
+from schedule_manager.data.store import get_store
+from schedule_manager.data.month_agg import MonthAgg, BRANCHES, REQUIRED_PER_BRANCH, filled
+
+DAY_COLUMNS = 31
+SUMMARY = ["충원", "휴업", "휴무", "부족"]
+FULL = REQUIRED_PER_BRANCH * len(BRANCHES)
+# 충원 수(0..FULL)별 색 → 휴업 → 없는 날(31일 없는 달 등)
+FILL_COLORS = ("#f8a5a5", "#fbc7a4", "#fde9a9", "#d6efb0", "#a9dfa0")
+CLOSED_COLOR = "#d5d8dc"
+NO_DAY_COLOR = "#ffffff"
+
+_DISPLAY = Qt.DisplayRole
+_BACKGROUND = Qt.BackgroundRole
+_ALIGN = Qt.TextAlignmentRole
+_TOOLTIP = Qt.ToolTipRole
+_CENTER = Qt.AlignCenter
+
+
+class YearOverviewModel(QAbstractTableModel):
+    def __init__(self, year: int, months: List[MonthAgg], parent=None):
+        super().__init__(parent)
+        self._fill_brushes = tuple(QBrush(QColor(c)) for c in FILL_COLORS)
+        self._closed_brush = QBrush(QColor(CLOSED_COLOR))
+        self._no_day_brush = QBrush(QColor(NO_DAY_COLOR))
+        self.year = year
+        self.months = months
+
+    # ---- Qt 모델 ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 12
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else DAY_COLUMNS + len(SUMMARY)
+
+    def headerData(self, section, orientation, role=_DISPLAY):
+        if role != _DISPLAY:
+            return None
+        if orientation == Qt.Vertical:
+            return f"{section + 1}월"
+        return str(section + 1) if section < DAY_COLUMNS else SUMMARY[section - DAY_COLUMNS]
+
+    def data(self, index, role=_DISPLAY):
+        if role == _ALIGN:
+            return _CENTER
+        agg = self.months[index.row()]
+        col = index.column()
+        if col >= DAY_COLUMNS:
+            return self._summary(agg, col - DAY_COLUMNS, role)
+        day = col + 1
+        if day > agg.days_in_month:
+            return self._no_day_brush if role == _BACKGROUND else None
+        stats = agg.get(day)
+        closed = stats is not None and stats[3]
+        n = 0 if stats is None or closed else filled(stats)
+        if role == _BACKGROUND:
+            return self._closed_brush if closed else self._fill_brushes[n]
+        if role == _DISPLAY:
+            return "휴" if closed else str(n)
+        if role == _TOOLTIP:
+            key = f"{self.year:04d}-{agg.month:02d}-{day:02d}"
+            if stats is None:
+                return f"{key} · 기록 없음(충원 0/{FULL})"
+            if closed:
+                return f"{key} · 휴업"
+            return (f"{key} · OS {stats[0]}/{REQUIRED_PER_BRANCH} · HC {stats[1]}/{REQUIRED_PER_BRANCH}"
+                    f" · 휴무 {stats[2]}명")
+        return None
+
+    def _summary(self, agg: MonthAgg, which: int, role):
+        if role == _DISPLAY:
+            return (f"{agg.filled}/{agg.required}", str(agg.closed_days),
+                    str(agg.off_total), str(agg.short_days))[which]
+        if role == _TOOLTIP:
+            return ("충원/필요(휴업일 제외, 지점별 필요 인원까지만)", "휴업일 수",
+                    "휴무 인원 합(휴업일 제외)", "덜 채운 날(기록 없는 날 포함)")[which]
+        return None
+
+    # ---- 갱신 ----
+    def set_year(self, year: int, months: List[MonthAgg]):
+        self.beginResetModel()
+        self.year, self.months = year, months
+        self.endResetModel()
+
+    def update_month(self, month: int, agg: MonthAgg) -> None:
+        """한 달 행만 바꾸고 그 행만 dataChanged."""
+        self.months[month - 1] = agg
+        self.dataChanged.emit(self.index(month - 1, 0), self.index(month - 1, self.columnCount() - 1))
+
+
+class YearOverviewDialog(QDialog):
+    """한 해 12개월의 날짜별 충원/휴업/휴무(읽기 전용). 편집은 다른 창에서 → 저장소 알림으로 반영."""
+    date_activated = Signal(str)
+
+    def __init__(self, year: int, parent=None, store=None):
+        super().__init__(parent)
+        self.setWindowTitle("연간 보기")
+        self.resize(1280, 420)
+        self.year = year
+        self.store = store or get_store()
+
+        top = QHBoxLayout()
+        self.btn_prev = QPushButton("◀")
+        self.btn_next = QPushButton("▶")
+        self.lbl_year = QLabel()
+        self.lbl_legend = QLabel(
+            "  ".join(f"<span style='background:{c}'>&nbsp;충원 {n}/{FULL}&nbsp;</span>"
+                      for n, c in enumerate(FILL_COLORS))
+            + f"  <span style='background:{CLOSED_COLOR}'>&nbsp;휴업&nbsp;</span>"
+        )
+        top.addWidget(self.btn_prev)
+        top.addWidget(self.lbl_year)
+        top.addWidget(self.btn_next)
+        top.addStretch(1)
+        top.addWidget(self.lbl_legend)
+
+        self.model = YearOverviewModel(year, self._months(), self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        hh, vh = self.table.horizontalHeader(), self.table.verticalHeader()
+        hh.setSectionResizeMode(QHeaderView.Fixed)
+        hh.setDefaultSectionSize(28)
+        for i in range(len(SUMMARY)):
+            hh.resizeSection(DAY_COLUMNS + i, 72 if i == 0 else 44)
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(24)
+        self.table.setShowGrid(True)
+        self.table.setWordWrap(False)
+        self.table.setStyleSheet("QTableView { font-size: 11px; }")
+
+        root = QVBoxLayout(self)
+        root.addLayout(top)
+        root.addWidget(self.table)
+
+        self.btn_prev.clicked.connect(lambda: self._move_year(-1))
+        self.btn_next.clicked.connect(lambda: self._move_year(1))
+        self.table.doubleClicked.connect(self._on_double)
+
+        self._unsubs = [
+            self.store.subscribe("day_changed", self._on_store_day_changed),
+            self.store.subscribe("reloaded", self._reload),
+        ]
+        self.finished.connect(self._detach_store)
+        self._update_year_label()
+
+    def _detach_store(self, *_):
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    def _months(self) -> List[MonthAgg]:
+        aggs = self.store.month_aggregates()
+        return [aggs.month(self.year, m) for m in range(1, 13)]
+
+    def _reload(self):
+        self.model.set_year(self.year, self._months())
+        self._update_year_label()
+
+    def _update_year_label(self):
+        months = self.model.months
+        need = sum(a.required for a in months)
+        got = sum(a.filled for a in months)
+        rate = f"{got / need * 100:.1f}%" if need else "-"
+        self.lbl_year.setText(f"{self.year}년  (충원 {got}/{need}, {rate} · 휴업 {sum(a.closed_days for a in months)}일)")
+
+    def _move_year(self, delta: int):
+        self.year += delta
+        self._reload()
+
+    def _on_store_day_changed(self, key: str):
+        if key[:4] != f"{self.year:04d}":
+            return
+        month = int(key[5:7])
+        self.model.update_month(month, self.store.month_aggregates().month(self.year, month))
+        self._update_year_label()
+
+    def _on_double(self, index: QModelIndex):
+        if not index.isValid() or index.column() >= DAY_COLUMNS:
+            return
+        month, day = index.row() + 1, index.column() + 1
+        if day <= self.model.months[month - 1].days_in_month:
+            self.date_activated.emit(f"{self.year:04d}-{month:02d}-{day:02d}")
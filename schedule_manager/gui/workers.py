@@ -0,0 +1,146 @@
+# gui/workers.py
+from __future__ import annotations
+import copy
+import threading
+import traceback
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from schedule_manager.data.data_manager import write_snapshot
+from schedule_manager.exceptions import CancelAction
+from schedule_manager.gui.calendar_widget import prepare_month
+from schedule_manager.logic.local_search import improve_schedule
+from schedule_manager.logic.rotation import plan_with_rotations
+from schedule_manager.logic.scheduler import plan_assignments, clone_day
+
+BOUNDARY_DAYS = 6   # 기간 앞뒤로 같은 주에 걸칠 수 있는 최대 일수
+
+
+class AutoAssignSignals(QObject):
+    progress = Signal(str, int, int)   # (단계 이름, 완료, 전체)
+    finished = Signal(object)          # AssignResult
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class AutoAssignWorker(QRunnable):
+    """
+    자동 배정을 QThreadPool에서 실행한다.
+    - 시작 시점의 직원/해당 기간 스케줄을 복사해서 쓰므로, 실행 중 메인 스레드 편집과 충돌하지 않는다.
+    - cancel()은 협조적 취소: 다음 날짜/다음 1024회 이동 경계에서 멈춘다.
+    - 결과는 finished 시그널로 넘기고, 반영(apply/저장)은 받는 쪽(메인 스레드)에서 한다.
+    - rotations가 있으면 템플릿을 먼저 깔고 빈 칸만 배정(웜 스타트). 템플릿 결과(충돌 등)는 self.tiled.
+    """
+    def __init__(self, employees, schedules: Dict, start_date: str, days: int,
+                 overwrite: bool = False, improve_iterations: int = 0, seed: Optional[int] = None,
+                 rotations=None):
+        super().__init__()
+        self.signals = AutoAssignSignals()
+        self._cancel = threading.Event()
+        self.employees = [copy.copy(e) for e in (employees or [])]
+        # 기간 + 앞뒤 경계 주(주간 근무/휴무 카운터가 기간 밖 기존 배정도 센다)
+        first = datetime.strptime(start_date, "%Y-%m-%d")
+        lo = (first - timedelta(days=BOUNDARY_DAYS)).strftime("%Y-%m-%d")
+        hi = (first + timedelta(days=days - 1 + BOUNDARY_DAYS)).strftime("%Y-%m-%d")
+        self.schedules = {k: clone_day(v, k) for k, v in schedules.items()
+                          if lo <= k <= hi and v is not None}
+        self.start_date = start_date
+        self.days = days
+        self.overwrite = overwrite
+        self.improve_iterations = improve_iterations
+        self.seed = seed
+        self.rotations = list(rotations or [])
+        self.tiled = None
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def run(self):
+        try:
+            progress = lambda done, total: self.signals.progress.emit("배정", done, total)
+            if self.rotations:
+                result, self.tiled = plan_with_rotations(
+                    self.employees, self.schedules, self.rotations, self.start_date, self.days,
+                    seed=self.seed, progress=progress, should_cancel=self.is_cancelled,
+                )
+            else:
+                result = plan_assignments(
+                    self.employees, self.schedules, self.start_date, self.days,
+                    overwrite=self.overwrite, seed=self.seed,
+                    progress=progress, should_cancel=self.is_cancelled,
+                )
+            if self.improve_iterations > 0:
+                improve_schedule(
+                    result, self.employees, iterations=self.improve_iterations,
+                    progress=lambda done, total: self.signals.progress.emit("공정성 개선", done, total),
+                    should_cancel=self.is_cancelled, schedules=self.schedules,
+                )
+        except CancelAction:
+            self.signals.cancelled.emit()
+            return
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+            return
+        self.signals.finished.emit(result)
+
+
+class MonthPrefetchSignals(QObject):
+    ready = Signal(object)   # MonthView (한 달씩)
+    done = Signal()
+
+
+class MonthPrefetchWorker(QRunnable):
+    """
+    주변 달의 MonthView를 미리 계산한다(읽기 전용).
+    스케줄 딕셔너리는 복사하지 않고 읽기만 하므로, 도중에 편집이 있으면 결과가 낡을 수 있다
+    → version을 같이 넘기고 받는 쪽(MonthCache.put)에서 어긋난 결과를 버린다.
+    """
+    def __init__(self, months: List[Tuple[int, int]], employees, schedules: Dict, version: int):
+        super().__init__()
+        self.signals = MonthPrefetchSignals()
+        self.months = list(months)
+        self.employees = list(employees or [])
+        self.schedules = schedules
+        self.version = version
+
+    def run(self):
+        for year, month in self.months:
+            try:
+                view = prepare_month(year, month, self.employees, self.schedules, version=self.version)
+            except Exception:
+                # 읽는 도중 편집과 겹친 경우 등: 미리 읽기는 실패해도 무시(필요할 때 다시 계산)
+                continue
+            self.signals.ready.emit(view)
+        self.signals.done.emit()
+
+
+class SaveSignals(QObject):
+    saved = Signal(str)          # kind
+    failed = Signal(str, str)    # (kind, 오류 메시지)
+    done = Signal()
+
+
+class SaveWorker(QRunnable):
+    """
+    저장 스냅샷({"schedules": dict, "employees": list})을 JSON으로 써 준다(들여쓰기 직렬화 + 파일 교체).
+    스냅샷은 저장소가 commit 때 만든 고치지 않는 dict라 복사 없이 그대로 읽는다.
+    """
+    def __init__(self, payloads: Dict[str, object]):
+        super().__init__()
+        self.signals = SaveSignals()
+        self.payloads = dict(payloads)
+
+    def run(self):
+        for kind, payload in self.payloads.items():
+            try:
+                write_snapshot(kind, payload)
+            except Exception as e:
+                self.signals.failed.emit(kind, f"{type(e).__name__}: {e}")
+                continue
+            self.signals.saved.emit(kind)
+        self.signals.done.emit()
@@ -0,0 +1,157 @@
+# logic/constraints.py
+"""
+주 단위 제약 카운터.
+
+주 정의 두 가지를 '절대 주 번호'로 관리하므로 월 경계에서 끊기거나 다른 달 주차와 섞이지 않는다.
+  - 근무 주(월~일): 주간 최소/최대 근무 횟수
+  - 휴무 주(일~토): 주간 휴무 상한(달력 주차)
+
+카운터는 (주, 직원) 평탄 리스트 [주 * 직원수 + 직원]로 두어 조회/갱신이 O(1).
+schedules를 넘기면 기간 밖이지만 첫/마지막 주에 걸친 날짜의 기존 근무/휴무를 미리 센다
+(달마다 나눠 돌려도 경계 주의 다른 쪽 절반을 보고 상한/최소를 판단).
+"""
+from __future__ import annotations
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+def work_week_no(d: date) -> int:
+    """월요일 시작 주 번호(0001-01-01이 월요일)."""
+    return (d.toordinal() - 1) // 7
+
+
+def off_week_no(d: date) -> int:
+    """일요일 시작 주 번호(달력 일~토 주차)."""
+    return d.toordinal() // 7
+
+
+class WeekConstraints:
+    def __init__(self, employees, start_date: str, days: int, weekly_off_cap: int = 2,
+                 schedules: Optional[Dict] = None):
+        self.employees = list(employees)
+        self.n = len(self.employees)
+        self.index = {e.id: i for i, e in enumerate(self.employees)}
+        self.min_shifts = [getattr(e, "min_shifts_per_week", 0) or 0 for e in self.employees]
+        self.max_shifts = [getattr(e, "max_shifts_per_week", 6) for e in self.employees]
+        self.weekly_off_cap = weekly_off_cap
+
+        self.start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        self.days = max(0, days)
+        last = self.start + timedelta(days=max(0, self.days - 1))
+        self._ww0 = work_week_no(self.start)
+        self._ow0 = off_week_no(self.start)
+        n_ww = work_week_no(last) - self._ww0 + 1
+        n_ow = off_week_no(last) - self._ow0 + 1
+
+        # 날짜 오프셋 → 주 인덱스 (미리 계산)
+        self.work_week = [work_week_no(self.start + timedelta(days=i)) - self._ww0 for i in range(self.days)]
+        self.off_week = [off_week_no(self.start + timedelta(days=i)) - self._ow0 for i in range(self.days)]
+
+        # 근무 주마다 기간 안에 들어온 날짜 수 / 해당 주의 마지막 날짜 오프셋
+        self.week_len = [0] * n_ww
+        self.week_last = [0] * n_ww
+        for i, w in enumerate(self.work_week):
+            self.week_len[w] += 1
+            self.week_last[w] = i
+
+        self.shifts = [0] * (n_ww * self.n)
+        self.offs = [0] * (n_ow * self.n)
+        if schedules and self.days:
+            self._count_outside(schedules, last)
+
+    def _count_outside(self, schedules: Dict, last: date) -> None:
+        """기간 앞뒤로 첫/마지막 근무 주(월~일)·휴무 주(일~토)에 걸친 날짜의 기존 배정을 센다."""
+        ww_first = self.start - timedelta(days=self.start.weekday())
+        ww_end = last + timedelta(days=6 - last.weekday())
+        ow_first = self.start - timedelta(days=(self.start.weekday() + 1) % 7)
+        ow_end = last + timedelta(days=6 - (last.weekday() + 1) % 7)
+        begin = min(ww_first, ow_first)
+        outside = [begin + timedelta(days=i) for i in range((self.start - begin).days)]
+        outside += [last + timedelta(days=i) for i in range(1, (max(ww_end, ow_end) - last).days + 1)]
+        for d in outside:
+            sch = schedules.get(d.strftime("%Y-%m-%d"))
+            if sch is None or getattr(sch, "closed", False):
+                continue
+            if ww_first <= d <= ww_end:
+                if d < self.start:
+                    self.week_len[0] += 1   # 기록이 있는 앞쪽 날짜는 첫 주 최소 근무 목표에도 포함
+                base = (work_week_no(d) - self._ww0) * self.n
+                for i in (sch.working.get("OS") or []) + (sch.working.get("HC") or []):
+                    e = self.index.get(i)
+                    if e is not None:
+                        self.shifts[base + e] += 1
+            if ow_first <= d <= ow_end:
+                base = (off_week_no(d) - self._ow0) * self.n
+                for i in sch.holidays or []:
+                    e = self.index.get(i)
+                    if e is not None:
+                        self.offs[base + e] += 1
+
+    # ---- 조회 ----
+    def shift_count(self, e: int, di: int) -> int:
+        return self.shifts[self.work_week[di] * self.n + e]
+
+    def off_count(self, e: int, di: int) -> int:
+        return self.offs[self.off_week[di] * self.n + e]
+
+    def can_work(self, e: int, di: int) -> bool:
+        """주간 최대 근무에 여유가 있는가."""
+        return self.shift_count(e, di) < self.max_shifts[e]
+
+    def min_target(self, e: int, w: int) -> int:
+        """기간에 일부만 걸친 주는 최소 근무 목표를 일수 비율만큼 줄인다."""
+        if self.week_len[w] >= 7:
+            return self.min_shifts[e]
+        return (self.min_shifts[e] * self.week_len[w]) // 7
+
+    def min_priority(self, e: int, di: int) -> int:
+        """
+        최소 근무 충족 긴급도
+          2: 남은 날(오늘 포함)을 다 일해야 겨우 채움 → 반드시 우선
+          1: 아직 미달
+          0: 충족
+        """
+        w = self.work_week[di]
+        short = self.min_target(e, w) - self.shifts[w * self.n + e]
+        if short <= 0:
+            return 0
+        remaining = self.week_last[w] - di + 1
+        return 2 if short >= remaining else 1
+
+    def under_off_cap(self, e: int, di: int) -> bool:
+        return self.off_count(e, di) < self.weekly_off_cap
+
+    # ---- 갱신 ----
+    def add_shift(self, e: int, di: int, n: int = 1) -> None:
+        self.shifts[self.work_week[di] * self.n + e] += n
+
+    def add_off(self, e: int, di: int, n: int = 1) -> None:
+        self.offs[self.off_week[di] * self.n + e] += n
+
+    # ---- 검증 ----
+    def violations(self) -> Dict[str, int]:
+        """(주, 직원) 단위 위반 수: 최대 근무 초과 / 최소 근무 미달 / 휴무 상한 초과."""
+        over = under = off_over = 0
+        for w in range(len(self.week_len)):
+            base = w * self.n
+            for e in range(self.n):
+                c = self.shifts[base + e]
+                if c > self.max_shifts[e]:
+                    over += 1
+                if c < self.min_target(e, w):
+                    under += 1
+        for c in self.offs:
+            if c > self.weekly_off_cap:
+                off_over += c - self.weekly_off_cap
+        return {"max_shifts": over, "min_shifts": under, "off_cap": off_over}
+
+    def min_shortfalls(self) -> List[Tuple[str, int, int]]:
+        """[(주 시작 월요일, 직원 ID, 부족 일수), ...]"""
+        out = []
+        for w in range(len(self.week_len)):
+            monday = date.fromordinal((self._ww0 + w) * 7 + 1)
+            for e in range(self.n):
+                short = self.min_target(e, w) - self.shifts[w * self.n + e]
+                if short > 0:
+                    out.append((monday.strftime("%Y-%m-%d"), self.employees[e].id, short))
+        return out
@@ -0,0 +1,105 @@
+# logic/golden.py
+"""
+스케줄러 재현성 계약(골든 출력) 검사.
+
+고정된 직원/스케줄 픽스처 + 고정 시드로 plan_assignments를 돌려 결과 해시를 기록값과 비교한다.
+스케줄러 속도 개선이 '결과를 바꾸지 않는지' 확인할 때 사용.
+
+    python -m schedule_manager.logic.golden            # 검증(불일치 시 종료코드 1)
+    python -m schedule_manager.logic.golden --update   # 현재 해시 출력(의도된 동작 변경 시 GOLDEN 갱신용)
+"""
+from __future__ import annotations
+import hashlib
+import json
+import sys
+from typing import Dict, List
+
+from schedule_manager.logic.scheduler import AssignResult, plan_assignments
+from schedule_manager.models.employee import Employee
+from schedule_manager.models.schedule import DailySchedule
+
+# (이름, 직급, 숙련, 지점, 고정휴무, 신청휴무, 주간 최소, 주간 최대)
+_FIXTURE_EMPLOYEES = [
+    ("가", "사장",   "C", "OS", [],     [],                           4, 6),
+    ("나", "매니저", "C", "HC", [6],    [],                           0, 6),
+    ("다", "직원",   "N", "OS", [],     ["2025-08-15"],               3, 5),
+    ("라", "직원",   "N", "HC", [2],    [],                           0, 6),
+    ("마", "직원",   "C", "OS", [],     [],                           0, 6),
+    ("바", "직원",   "N", "HC", [],     ["2025-08-03", "2025-08-04"], 0, 6),
+    ("사", "직원",   "N", "OS", [0],    [],                           2, 6),
+    ("아", "직원",   "C", "HC", [],     [],                           0, 6),
+    ("자", "직원",   "N", "OS", [],     [],                           0, 6),
+    ("차", "매니저", "N", "HC", [5, 6], [],                           0, 3),
+]
+
+# 케이스 이름 → (plan_assignments 인자, 기대 해시)
+GOLDEN: Dict[str, tuple] = {
+    "aug-month-seed1": (dict(start_date="2025-08-01", days=31, seed=1),
+        "0fd4fb5d0ea74935b0a86f591926f162c22c8bfc7b3ffada13035533b84e70b5"),
+    "aug-month-seed7-overwrite": (dict(start_date="2025-08-01", days=31, seed=7, overwrite=True),
+        "c2f1e06262d0bf7c81cc35b37ed153f36faeda76d252308c83b7e07da045e0f6"),
+    "quarter-seed42": (dict(start_date="2025-07-28", days=92, seed=42, weekly_off_cap=1),
+        "299126e62ca203397d180974390752c073d8bce31a88ff5a0143b9c3d3db576e"),
+    "aug-2weeks-pinned-off": (dict(start_date="2025-08-04", days=14, seed=3,
+                                   pinned_off={"2025-08-06": [5, 6, 7], "2025-08-12": [1, 8]}),
+        "3d9a88df49117b9a9209d822950a1d775a8b0228bd6529a844ddf41cad102a4b"),
+}
+
+
+def fixture_employees() -> List[Employee]:
+    return [
+        Employee(i, name, role, skill, branch, fixed_holidays=list(fixed), holiday_requests=list(req),
+                 min_shifts_per_week=min_w, max_shifts_per_week=max_w)
+        for i, (name, role, skill, branch, fixed, req, min_w, max_w) in enumerate(_FIXTURE_EMPLOYEES, start=1)
+    ]
+
+
+def fixture_schedules() -> Dict[str, DailySchedule]:
+    """수동 배정/휴업/메모가 섞인 기존 스케줄."""
+    schedules = {}
+    closed = DailySchedule("2025-08-15"); closed.closed = True; closed.memo = "광복절"
+    manual = DailySchedule("2025-08-05"); manual.working["OS"] = [1]; manual.holidays = [3]
+    full = DailySchedule("2025-08-20"); full.working = {"OS": [1, 3], "HC": [2, 4]}
+    for ds in (closed, manual, full):
+        schedules[ds.date] = ds
+    return schedules
+
+
+def golden_digest(result: AssignResult) -> str:
+    """결과 날짜들의 내용(정렬된 JSON)에 대한 sha256."""
+    payload = {k: result.days[k].to_dict() for k in sorted(result.days)}
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def run_case(name: str) -> str:
+    kwargs, _expected = GOLDEN[name]
+    result = plan_assignments(fixture_employees(), fixture_schedules(), **kwargs)
+    return golden_digest(result)
+
+
+def verify() -> List[str]:
+    """불일치 케이스 설명 목록(비어 있으면 통과)."""
+    failures = []
+    for name, (_kwargs, expected) in GOLDEN.items():
+        got = run_case(name)
+        if got != expected:
+            failures.append(f"{name}: expected {expected}, got {got}")
+    return failures
+
+
+def main(argv: List[str]) -> int:
+    if "--update" in argv:
+        for name in GOLDEN:
+            print(f"{name}: {run_case(name)}")
+        return 0
+    failures = verify()
+    for f in failures:
+        print("FAIL", f)
+    if not failures:
+        print(f"OK ({len(GOLDEN)} cases)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,326 @@
+# logic/local_search.py
+"""
+자동 배정 결과에 대한 전역 공정성 개선(시뮬레이티드 어닐링).
+
+plan_assignments는 하루씩 탐욕적으로 채우기 때문에 공정성이 '그 주' 안에서만 맞춰진다.
+여기서는 생성된 결과 전체를 대상으로 교환(swap) 이동을 반복하며 아래 목적함수를 줄인다.
+
+  목적함수(작을수록 좋음, 가중치는 DEFAULT_WEIGHTS)
+    - shift_var   : 직원별 총 근무일수 제곱합(총합이 고정이므로 분산과 동치)
+    - weekend_var : 직원별 주말(토/일) 휴무일수 제곱합
+    - cross       : 홈 지점이 아닌 지점 근무 횟수
+    - min_shift   : 주(월~일)별 최소 근무 미달 일수
+    - pair        : 조리+비조리 조합이 안 맞는 지점·일 수
+    - off_cap     : 달력 주(일~토)별 휴무 상한 초과 일수
+
+  이동
+    - work↔off : 같은 날 근무자 1명과 휴무자 1명을 맞바꿈
+    - OS↔HC    : 같은 날 OS 근무자와 HC 근무자의 지점을 맞바꿈
+
+  하드 제약(절대 위반하지 않음)
+    - 휴업일/수동 보존 배정(result.locked)은 건드리지 않는다
+    - 고정 휴무 요일, 신청 휴무일에는 근무로 바꾸지 않는다
+    - 주(월~일) 최대 근무 횟수를 넘기지 않는다
+
+모든 카운터는 (주, 직원) / (일, 직원) 평탄 리스트로 두고, 이동마다 바뀌는 항목만
+O(1)로 델타를 계산한다(전체 재채점 없음).
+
+멈춤 조건은 시간이 아니라 이동 횟수(iterations)라서 같은 입력 + 같은 시드 + 같은 횟수면
+결과가 같다(컴퓨터 속도와 무관). 쓴 설정은 result.improve에 남아 generation_record로 저장된다.
+"""
+from __future__ import annotations
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from schedule_manager.exceptions import CancelAction
+from schedule_manager.logic.constraints import WeekConstraints, off_week_no, work_week_no
+from schedule_manager.logic.scheduler import AssignResult
+
+DEFAULT_ITERATIONS = 60_000   # 한 달 · 직원 10명 기준 약 0.4초
+
+DEFAULT_WEIGHTS = {
+    "shift_var": 1.0,
+    "weekend_var": 1.0,
+    "cross": 2.0,
+    "min_shift": 20.0,
+    "pair": 15.0,
+    "off_cap": 5.0,
+}
+
+NONE, OS, HC, OFF = 0, 1, 2, 3
+_BRANCH_CODE = {"OS": OS, "HC": HC}
+
+
+@dataclass
+class ImproveReport:
+    iterations: int = 0
+    accepted: int = 0
+    start_energy: float = 0.0
+    end_energy: float = 0.0
+    seconds: float = 0.0
+    changed_keys: List[str] = field(default_factory=list)
+
+    @property
+    def moves_per_second(self) -> float:
+        return self.iterations / self.seconds if self.seconds > 0 else 0.0
+
+
+def improve_schedule(result: AssignResult, employees, iterations: int = DEFAULT_ITERATIONS,
+                     weights: Optional[Dict[str, float]] = None, seed: Optional[int] = None,
+                     t_start: float = 4.0, t_end: float = 0.05,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     should_cancel: Optional[Callable[[], bool]] = None,
+                     schedules: Optional[Dict] = None) -> ImproveReport:
+    """
+    result.days를 제자리에서 개선하고 diff를 다시 계산한다.
+    - iterations: 이동 시도 횟수. 온도도 이 횟수 기준으로 내린다(시간과 무관 → 재현 가능).
+    - seed: 이동 선택 RNG 시드. 없으면 result.seed를 쓴다.
+    - 쓴 설정(iterations/seed/온도/가중치)은 result.improve에 남긴다(generation_record로 저장 → 재실행용).
+    - progress(한 이동 수, 전체 이동 수)를 1024회 이동마다 호출. should_cancel()이 True면 CancelAction 발생
+      (그 경우 result는 손대지 않은 상태로 남는다).
+    - schedules: 배정 전 스케줄. 주면 기간 밖이지만 첫/마지막 주에 걸친 날짜의 기존 근무/휴무를
+      주간 카운터에 미리 넣는다(plan_assignments와 같은 WeekConstraints 기준).
+    """
+    w = dict(DEFAULT_WEIGHTS)
+    w.update(weights or {})
+    report = ImproveReport()
+    employees = list(employees or [])
+    keys = sorted(k for k, d in result.days.items() if not getattr(d, "closed", False))
+    if not employees or not keys:
+        return report
+
+    seed = result.seed if seed is None else seed
+    rng = random.Random(seed)
+    n = len(employees)
+    idx_of = {e.id: i for i, e in enumerate(employees)}
+    is_cook = [getattr(e, "skill_level", "") in ("C", "cook") for e in employees]
+    home = [_BRANCH_CODE.get(getattr(e, "home_branch", ""), NONE) for e in employees]
+    max_shift = [getattr(e, "max_shifts_per_week", 6) for e in employees]
+    cap = result.weekly_off_cap
+
+    # ---- 날짜 축 ----
+    n_days = len(keys)
+    dates = [datetime.strptime(k, "%Y-%m-%d").date() for k in keys]
+    mweek = [work_week_no(d) - work_week_no(dates[0]) for d in dates]   # 월~일 주 번호
+    sweek = [off_week_no(d) - off_week_no(dates[0]) for d in dates]     # 일~토 주 번호
+    weekend = [d.weekday() >= 5 for d in dates]
+    n_mw = mweek[-1] + 1
+
+    # 경계 주의 기간 밖 근무/휴무 + 부분 주의 최소 근무 목표(일수 비율)는 WeekConstraints로
+    wc = WeekConstraints(employees, keys[0], (dates[-1] - dates[0]).days + 1, cap, schedules)
+    min_target = [0] * (n_mw * n)
+    for wk in range(n_mw):
+        for e in range(n):
+            min_target[wk * n + e] = wc.min_target(e, wk)
+
+    # ---- 상태 ----
+    state = [NONE] * (n_days * n)
+    locked = [False] * (n_days * n)
+    avail = [True] * (n_days * n)
+    members = [[[], [], []] for _ in range(n_days)]   # [_, OS 목록, HC 목록] (직원 인덱스)
+    off_list: List[List[int]] = [[] for _ in range(n_days)]
+
+    for di, key in enumerate(keys):
+        daily = result.days[key]
+        wd = dates[di].weekday()
+        for e_i, e in enumerate(employees):
+            if wd in (getattr(e, "fixed_holidays", []) or []) or key in (getattr(e, "holiday_requests", []) or []):
+                avail[di * n + e_i] = False
+        for b, code in _BRANCH_CODE.items():
+            for emp_id in daily.working.get(b, []) or []:
+                e_i = idx_of.get(emp_id)
+                if e_i is not None and state[di * n + e_i] == NONE:
+                    state[di * n + e_i] = code
+                    members[di][code].append(e_i)
+        for emp_id in daily.holidays or []:
+            e_i = idx_of.get(emp_id)
+            if e_i is not None and state[di * n + e_i] == NONE:
+                state[di * n + e_i] = OFF
+                off_list[di].append(e_i)
+        for emp_id in result.locked.get(key, []):
+            e_i = idx_of.get(emp_id)
+            if e_i is not None:
+                locked[di * n + e_i] = True
+
+    shifts = [0] * n
+    wk_off = [0] * n
+    mw_shifts = list(wc.shifts)
+    sw_offs = list(wc.offs)
+    for di in range(n_days):
+        for e_i in range(n):
+            st = state[di * n + e_i]
+            if st in (OS, HC):
+                shifts[e_i] += 1
+                mw_shifts[mweek[di] * n + e_i] += 1
+            elif st == OFF:
+                sw_offs[sweek[di] * n + e_i] += 1
+                if weekend[di]:
+                    wk_off[e_i] += 1
+
+    def pair_bad(group) -> int:
+        cooks = sum(1 for x in group if is_cook[x])
+        return 0 if (cooks and cooks < len(group)) else 1
+
+    def energy() -> float:
+        total = w["shift_var"] * sum(x * x for x in shifts)
+        total += w["weekend_var"] * sum(x * x for x in wk_off)
+        total += w["cross"] * sum(1 for di in range(n_days) for code in (OS, HC)
+                                  for x in members[di][code] if home[x] != code)
+        total += w["min_shift"] * sum(max(0, min_target[i] - mw_shifts[i]) for i in range(n_mw * n))
+        total += w["pair"] * sum(pair_bad(members[di][code]) for di in range(n_days) for code in (OS, HC))
+        total += w["off_cap"] * sum(max(0, c - cap) for c in sw_offs)
+        return total
+
+    w_sv, w_wv, w_x, w_min, w_pair, w_cap = (w["shift_var"], w["weekend_var"], w["cross"],
+                                             w["min_shift"], w["pair"], w["off_cap"])
+
+    current = energy()
+    report.start_energy = current
+    touched = set()
+
+    started = time.perf_counter()
+    limit = max(0, iterations)
+    temp = t_start
+    cool = math.log(t_end / t_start) if t_start > 0 and t_end > 0 else 0.0
+    rand = rng.random
+    randrange = rng.randrange
+    it = 0
+
+    while it < limit:
+        if (it & 1023) == 0:
+            if should_cancel and should_cancel():
+                raise CancelAction()
+            if progress:
+                progress(it, limit)
+            temp = t_start * math.exp(cool * it / limit)
+        it += 1
+
+        di = randrange(n_days)
+        row = di * n
+        if rand() < 0.8:
+            # ---- work ↔ off ----
+            code = OS if rand() < 0.5 else HC
+            grp = members[di][code]
+            offs = off_list[di]
+            if not grp or not offs:
+                continue
+            gi = randrange(len(grp))
+            oi = randrange(len(offs))
+            a = grp[gi]          # 근무 → 휴무
+            b = offs[oi]         # 휴무 → 근무
+            if locked[row + a] or locked[row + b] or not avail[row + b]:
+                continue
+            mw = mweek[di] * n
+            if mw_shifts[mw + b] >= max_shift[b]:
+                continue
+            sw = sweek[di] * n
+
+            delta = w_sv * 2 * (shifts[b] - shifts[a] + 1)
+            if weekend[di]:
+                delta += w_wv * 2 * (wk_off[a] - wk_off[b] + 1)
+            delta += w_x * ((home[b] != code) - (home[a] != code))
+            if mw_shifts[mw + a] <= min_target[mw + a]:
+                delta += w_min
+            if mw_shifts[mw + b] < min_target[mw + b]:
+                delta -= w_min
+            new_grp = grp[:gi] + [b] + grp[gi + 1:]
+            delta += w_pair * (pair_bad(new_grp) - pair_bad(grp))
+            if sw_offs[sw + a] >= cap:
+                delta += w_cap
+            if sw_offs[sw + b] > cap:
+                delta -= w_cap
+
+            if delta > 0 and (temp <= 0 or rand() >= math.exp(-delta / temp)):
+                continue
+
+            grp[gi] = b
+            offs[oi] = a
+            state[row + a], state[row + b] = OFF, code
+            shifts[a] -= 1; shifts[b] += 1
+            mw_shifts[mw + a] -= 1; mw_shifts[mw + b] += 1
+            sw_offs[sw + a] += 1; sw_offs[sw + b] -= 1
+            if weekend[di]:
+                wk_off[a] += 1; wk_off[b] -= 1
+        else:
+            # ---- OS ↔ HC ----
+            g_os, g_hc = members[di][OS], members[di][HC]
+            if not g_os or not g_hc:
+                continue
+            i_os = randrange(len(g_os))
+            i_hc = randrange(len(g_hc))
+            a, b = g_os[i_os], g_hc[i_hc]
+            if locked[row + a] or locked[row + b]:
+                continue
+            new_os = g_os[:i_os] + [b] + g_os[i_os + 1:]
+            new_hc = g_hc[:i_hc] + [a] + g_hc[i_hc + 1:]
+            delta = w_x * ((home[a] != HC) + (home[b] != OS) - (home[a] != OS) - (home[b] != HC))
+            delta += w_pair * (pair_bad(new_os) + pair_bad(new_hc) - pair_bad(g_os) - pair_bad(g_hc))
+            if delta > 0 and (temp <= 0 or rand() >= math.exp(-delta / temp)):
+                continue
+            g_os[i_os], g_hc[i_hc] = b, a
+            state[row + a], state[row + b] = HC, OS
+
+        current += delta
+        report.accepted += 1
+        touched.add(di)
+
+    report.iterations = it
+    result.improve = {"iterations": limit, "seed": seed, "t_start": t_start, "t_end": t_end, "weights": w}
+    report.seconds = time.perf_counter() - started
+    report.end_energy = current
+
+    # ---- 결과 반영(바뀐 날만) ----
+    for di in sorted(touched):
+        key = keys[di]
+        daily = result.days[key]
+        # 직원 목록 밖의 ID(삭제된 직원 등)는 그대로 유지
+        for b, code in _BRANCH_CODE.items():
+            unknown = [i for i in (daily.working.get(b) or []) if i not in idx_of]
+            daily.working[b] = unknown + [employees[x].id for x in members[di][code]]
+        daily.holidays = [employees[x].id for x in off_list[di]] + \
+            [i for i in (daily.holidays or []) if i not in idx_of]
+    result.refresh_diff([keys[di] for di in touched])
+
+    # ---- 통계도 개선 결과 기준으로 다시 센다 ----
+    stats = result.stats
+    for e_i, e in enumerate(employees):
+        stats.shifts[e.id] = shifts[e_i]
+        stats.offs[e.id] = sum(1 for di in range(n_days) if state[di * n + e_i] == OFF)
+    # 바뀐 날의 채우기 완화 종류: 최종 조합으로 다시 분류(빈 칸 수는 이동으로 바뀌지 않음)
+    for di in touched:
+        old = stats.fallbacks.get(keys[di])
+        c = Counter(unfilled=old["unfilled"] if old else 0)
+        for code in (OS, HC):
+            grp = [x for x in members[di][code] if not locked[di * n + x]]
+            if not grp:
+                continue
+            if pair_bad(members[di][code]):
+                c["ignore_skill"] += len(grp)
+            elif all(home[x] == code for x in grp):
+                c["home_pair"] += len(grp)
+            else:
+                c["cross_topup"] += len(grp)
+        stats.fallbacks[keys[di]] = +c
+    # 상한 초과 휴무: 주(일~토)마다 날짜 순으로 세어 상한을 넘긴 날에 기록(기간 밖 경계 주 휴무 포함)
+    for c in stats.fallbacks.values():
+        c.pop("second_bucket_off", None)
+    running = list(wc.offs)
+    for di in range(n_days):
+        sw = sweek[di] * n
+        for e_i in off_list[di]:
+            running[sw + e_i] += 1
+            if running[sw + e_i] > cap:
+                stats.count_fallback(keys[di], "second_bucket_off")
+    stats.cap_violations["off_cap"] = sum(max(0, c - cap) for c in sw_offs)
+    stats.cap_violations["max_shifts"] = sum(
+        1 for wk in range(n_mw) for e_i in range(n) if mw_shifts[wk * n + e_i] > max_shift[e_i])
+    stats.cap_violations["min_shifts"] = sum(
+        1 for i in range(n_mw * n) if mw_shifts[i] < min_target[i])
+    report.changed_keys = [keys[di] for di in sorted(touched)]
+    stats.phase_seconds["improve"] += report.seconds
+    return report
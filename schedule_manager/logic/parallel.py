@@ -0,0 +1,106 @@
+# logic/parallel.py
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from statistics import pvariance
+from typing import Dict, List, Optional, Tuple
+
+from schedule_manager.logic.scheduler import AssignResult, new_seed, plan_assignments
+from schedule_manager.models.employee import Employee
+from schedule_manager.models.schedule import DailySchedule
+
+
+BOUNDARY_DAYS = 6   # 기간 앞뒤로 같은 주(근무 월~일 / 휴무 일~토)에 걸칠 수 있는 최대 일수
+
+
+def score_result(result: AssignResult, employees) -> float:
+    """
+    후보 평가(클수록 좋음)
+      - 충원율(채운 칸 / 필요한 칸) × 1000
+      - 조리+비조리 조합을 못 맞춘 지점·일 수 × 10 감점
+      - 직원별 근무일수 분산, 휴무일수 분산 감점(공정성)
+    """
+    stats = result.stats
+    coverage = stats.slots_filled / stats.slots_required if stats.slots_required else 1.0
+
+    skill_by_id = {e.id: getattr(e, "skill_level", "") for e in employees}
+    pair_misses = 0
+    for daily in result.days.values():
+        for b in ("OS", "HC"):
+            skills = [skill_by_id.get(i) for i in daily.working.get(b, [])]
+            if not ("C" in skills and any(s != "C" for s in skills)):
+                pair_misses += 1
+
+    ids = list(skill_by_id.keys())
+    shifts = [stats.shifts.get(i, 0) for i in ids]
+    offs = [stats.offs.get(i, 0) for i in ids]
+    fairness = (pvariance(shifts) if len(ids) > 1 else 0.0) + (pvariance(offs) if len(ids) > 1 else 0.0)
+
+    return coverage * 1000.0 - pair_misses * 10.0 - fairness
+
+
+def _normalize_employees(employees) -> List[Employee]:
+    """프로세스 경계를 넘길 수 있도록 Employee 인스턴스로 통일(GUI의 임시 객체 대응)."""
+    out = []
+    for e in employees:
+        out.append(Employee(
+            e.id, e.name, getattr(e, "role", ""), getattr(e, "skill_level", ""),
+            getattr(e, "home_branch", ""),
+            fixed_holidays=list(getattr(e, "fixed_holidays", []) or []),
+            holiday_requests=list(getattr(e, "holiday_requests", []) or []),
+            min_shifts_per_week=getattr(e, "min_shifts_per_week", 0),
+            max_shifts_per_week=getattr(e, "max_shifts_per_week", 6),
+        ))
+    return out
+
+
+def _run_scenario(task) -> Tuple[int, float, AssignResult]:
+    """워커 프로세스 진입점. 기간 전체를 한 시드로 풀어 (시드, 점수, 결과)를 돌려준다."""
+    seed, employees, sub_schedules, start, days, overwrite, weekly_off_cap = task
+    schedules = {k: DailySchedule.from_dict(v) for k, v in sub_schedules.items()}
+    result = plan_assignments(employees, schedules, start, days,
+                              overwrite=overwrite, weekly_off_cap=weekly_off_cap, seed=seed)
+    return seed, score_result(result, employees), result
+
+
+def generate_parallel(employees, schedules: Dict[str, DailySchedule], start_date: str,
+                      days: int, scenarios: int = 4, overwrite: bool = False,
+                      weekly_off_cap: int = 2, max_workers: Optional[int] = None,
+                      base_seed: Optional[int] = None) -> AssignResult:
+    """
+    시드가 다른 시나리오 scenarios개가 각자 기간 전체를 풀고, 가장 점수가 높은 결과를 고른다.
+    시나리오끼리는 나눠 가질 상태가 없어서 ProcessPoolExecutor로 한 번에 분산한다(시나리오당 직렬화 1회).
+    기간을 나누지 않으므로 주간 카운터·통계는 plan_assignments 결과 그대로 맞다.
+    - 입력 schedules는 변경하지 않는다(plan_assignments와 동일하게 apply()로 반영).
+    - max_workers=1(또는 코어/시나리오가 1개)이면 프로세스 풀 없이 현재 프로세스에서 순차 실행.
+    - 시나리오 시드는 base_seed + k. 채택된 시드는 result.seed에 남는다.
+    """
+    employees = _normalize_employees(employees or [])
+    if not employees or days <= 0:
+        return AssignResult(start_date, days, overwrite, weekly_off_cap)
+
+    scenarios = max(1, scenarios)
+    if base_seed is None:
+        base_seed = new_seed()
+
+    # 기간 + 앞뒤 경계 주 날짜만 직렬화해서 넘긴다
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    lo = (start_dt - timedelta(days=BOUNDARY_DAYS)).strftime("%Y-%m-%d")
+    hi = (start_dt + timedelta(days=days - 1 + BOUNDARY_DAYS)).strftime("%Y-%m-%d")
+    sub = {k: v.to_dict() for k, v in schedules.items() if lo <= k <= hi and v is not None}
+    tasks = [(base_seed + k, employees, sub, start_date, days, overwrite, weekly_off_cap)
+             for k in range(scenarios)]
+
+    workers = min(max_workers or os.cpu_count() or 1, scenarios)
+    if workers <= 1:   # 풀을 띄워 봐야 직렬화·기동 비용만 든다
+        runs = [_run_scenario(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            runs = list(ex.map(_run_scenario, tasks))
+
+    best: Optional[Tuple[float, AssignResult]] = None
+    for _seed, score, result in runs:   # 동점이면 앞 시드(실행 순서와 무관하게 같은 결과)
+        if best is None or score > best[0]:
+            best = (score, result)
+    return best[1]
@@ -0,0 +1,158 @@
+# logic/range_ops.py
+"""
+기간 일괄 작업 엔진(일괄 편집 다이얼로그용).
+
+RangeEditor는 원본 schedules를 건드리지 않고 '덮어쓰기 층'(key → DailySchedule | None)에만 기록한다.
+작업을 여러 개 이어서 걸어도(예: 비우기 + 메모) 각 작업은 기간을 한 번만 훑고,
+result()는 원본과 실제로 달라진 날짜만 담은 ChangeSet 하나를 돌려준다.
+ChangeSet.apply(schedules) → 바뀐 키 목록 → 저장소 commit_days(keys) 한 번(저장 1회, 실행 취소 1회).
+
+날짜 인자는 datetime.date, 키는 "YYYY-MM-DD".
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from schedule_manager.logic.scheduler import clone_day
+from schedule_manager.models.schedule import DailySchedule
+
+_MISSING = object()
+
+
+def day_key(d: date) -> str:
+    return d.strftime("%Y-%m-%d")
+
+
+def iter_keys(start: date, end: date) -> Iterator[Tuple[date, str]]:
+    d = start
+    while d <= end:
+        yield d, day_key(d)
+        d += timedelta(days=1)
+
+
+def _content(sch) -> Optional[tuple]:
+    """비교용 내용(None = 일정 없음)."""
+    if sch is None:
+        return None
+    working = getattr(sch, "working", None) or {}
+    return (tuple(working.get("OS") or []), tuple(working.get("HC") or []),
+            tuple(getattr(sch, "holidays", None) or []),
+            getattr(sch, "memo", "") or "", bool(getattr(sch, "closed", False)))
+
+
+@dataclass
+class ChangeSet:
+    changes: Dict[str, Optional[DailySchedule]] = field(default_factory=dict)  # None = 삭제
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    @property
+    def keys(self) -> List[str]:
+        return sorted(self.changes)
+
+    def apply(self, schedules: Dict) -> List[str]:
+        for key, sch in self.changes.items():
+            if sch is None:
+                schedules.pop(key, None)
+            else:
+                schedules[key] = sch
+        return self.keys
+
+
+class RangeEditor:
+    def __init__(self, schedules: Dict):
+        self.schedules = schedules
+        self._overlay: Dict[str, Optional[DailySchedule]] = {}
+
+    # ---- 덮어쓰기 층 ----
+    def get(self, key: str):
+        sch = self._overlay.get(key, _MISSING)
+        return self.schedules.get(key) if sch is _MISSING else sch
+
+    def editable(self, key: str) -> DailySchedule:
+        """이 키의 복사본(처음 고칠 때 한 번만 복사)."""
+        sch = self._overlay.get(key, _MISSING)
+        if sch is _MISSING or sch is None:
+            sch = clone_day(self.schedules.get(key) if sch is _MISSING else None, key)
+            self._overlay[key] = sch
+        return sch
+
+    def _put(self, key: str, sch: Optional[DailySchedule]) -> None:
+        self._overlay[key] = sch
+
+    # ---- 작업 ----
+    def delete(self, start: date, end: date) -> "RangeEditor":
+        for _, key in iter_keys(start, end):
+            if self.get(key) is not None:
+                self._put(key, None)
+        return self
+
+    def clear(self, start: date, end: date) -> "RangeEditor":
+        """근무/휴무/메모 비우고 휴업 해제(일정이 있는 날만)."""
+        for _, key in iter_keys(start, end):
+            sch = self.get(key)
+            if sch is not None and _content(sch) != _content(DailySchedule(key)):
+                self._put(key, DailySchedule(key))
+        return self
+
+    def set_closed(self, start: date, end: date, closed: bool) -> "RangeEditor":
+        for _, key in iter_keys(start, end):
+            sch = self.get(key)
+            current = bool(getattr(sch, "closed", False)) if sch is not None else False
+            if current != closed:
+                self.editable(key).closed = closed
+        return self
+
+    def set_memo(self, start: date, end: date, memo: str) -> "RangeEditor":
+        for _, key in iter_keys(start, end):
+            sch = self.get(key)
+            if (getattr(sch, "memo", "") or "") != memo:
+                self.editable(key).memo = memo
+        return self
+
+    def copy_week(self, week_start: date, weeks: int) -> "RangeEditor":
+        """week_start부터 7일의 배정(근무/휴무/휴업)을 이어지는 weeks주에 그대로 복사. 메모는 대상 날짜 것을 유지."""
+        pattern = []
+        for d, key in iter_keys(week_start, week_start + timedelta(days=6)):
+            pattern.append(_content(self.get(key)))
+        for w in range(1, weeks + 1):
+            for i, src in enumerate(pattern):
+                key = day_key(week_start + timedelta(days=7 * w + i))
+                os_ids, hc_ids, off_ids, _memo, closed = src or ((), (), (), "", False)
+                cur = _content(self.get(key))
+                memo = cur[3] if cur else ""
+                if cur == (os_ids, hc_ids, off_ids, memo, closed):
+                    continue
+                if cur is None and not (os_ids or hc_ids or off_ids or closed):
+                    continue  # 빈 날을 빈 날로
+                sch = self.editable(key)
+                sch.working = {"OS": list(os_ids), "HC": list(hc_ids)}
+                sch.holidays = list(off_ids)
+                sch.closed = closed
+        return self
+
+    def shift(self, start: date, end: date, days: int) -> "RangeEditor":
+        """기간 전체를 days일 만큼 옮긴다(음수면 앞으로). 옮긴 자리에 덮어쓰고, 비게 된 원래 날짜는 삭제."""
+        if days == 0:
+            return self
+        block = [(d, key, self.get(key)) for d, key in iter_keys(start, end)]  # 먼저 다 읽어 둠(겹쳐도 안전)
+        targets = set()
+        for d, _key, sch in block:
+            tkey = day_key(d + timedelta(days=days))
+            targets.add(tkey)
+            self._put(tkey, clone_day(sch, tkey) if sch is not None else None)
+        for _d, key, sch in block:
+            if key not in targets and sch is not None:
+                self._put(key, None)
+        return self
+
+    # ---- 결과 ----
+    def result(self) -> ChangeSet:
+        """원본과 실제로 달라진 날짜만."""
+        out = ChangeSet()
+        for key, sch in self._overlay.items():
+            if _content(sch) != _content(self.schedules.get(key)):
+                out.changes[key] = sch
+        return out
@@ -0,0 +1,168 @@
+# logic/rotation.py
+"""
+반복 근무 템플릿(로테이션)을 기간에 깔기.
+
+- tile_rotations: 템플릿마다 패턴을 기간 길이만큼 이어 붙여 한 번에 잘라낸 뒤(직원별 코드 행),
+  휴업일/고정 휴무 요일/신청 휴무/지점 정원(2명)/다른 칸 배정과 겹치는 칸은 건너뛰고 충돌로 남긴다.
+  결과는 range_ops.ChangeSet(바뀐 날짜만) + 충돌 목록 + 날짜별 '템플릿 휴무' 목록.
+- plan_with_rotations: 템플릿을 먼저 깐 스케줄을 plan_assignments(overwrite=False)에 넘겨
+  남은 빈 칸만 자동 배정한다(웜 스타트). 템플릿 휴무는 pinned_off로 고정.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from schedule_manager.logic.range_ops import ChangeSet, RangeEditor, day_key
+from schedule_manager.logic.scheduler import AssignResult, plan_assignments
+
+CODES = ("OS", "HC", "OFF")
+
+# 충돌 사유
+CONFLICT_LABELS = {
+    "closed": "휴업일",
+    "fixed_holiday": "고정 휴무 요일",
+    "holiday_request": "신청 휴무",
+    "full": "지점 정원 초과",
+    "busy": "다른 칸에 배정됨",
+    "unknown": "없는 직원",
+}
+
+
+@dataclass
+class Conflict:
+    date: str
+    emp_id: int
+    code: str
+    reason: str
+    rotation: str
+
+    def __str__(self) -> str:
+        return f"{self.date} {self.emp_id} {self.code}: {CONFLICT_LABELS[self.reason]} ({self.rotation})"
+
+
+@dataclass
+class TileResult:
+    changes: ChangeSet = field(default_factory=ChangeSet)
+    conflicts: List[Conflict] = field(default_factory=list)
+    pinned_off: Dict[str, List[int]] = field(default_factory=dict)   # 날짜 → 템플릿상 휴무인 직원
+    cells: int = 0                                                    # 템플릿이 채운 칸 수(이미 같던 칸 포함)
+
+    def summary(self) -> str:
+        return (f"템플릿 {self.cells}칸 반영, 바뀐 날짜 {len(self.changes)}일, "
+                f"충돌 {len(self.conflicts)}칸")
+
+
+def tile_codes(rotation, start: date, n: int, member: int = 0) -> List[Optional[str]]:
+    """member번째 팀원의 start부터 n일치 코드. 패턴을 필요한 만큼 반복해 한 번에 자른다."""
+    period = len(rotation.pattern)
+    if period == 0 or n <= 0:
+        return [None] * max(n, 0)
+    anchor = datetime.strptime(rotation.anchor, "%Y-%m-%d").date()
+    phase = ((start - anchor).days - member * (rotation.stagger or 0)) % period
+    reps = (phase + n) // period + 1
+    return (list(rotation.pattern) * reps)[phase:phase + n]
+
+
+def tile_rotations(rotations, employees, schedules: Dict, start: date, end: date,
+                   overwrite: bool = False) -> TileResult:
+    """
+    템플릿을 start~end에 깐 결과(입력 schedules는 변경하지 않음. 반영은 result.changes.apply).
+    - overwrite=False: 그날 이미 다른 칸(다른 지점/휴무)에 있는 직원은 충돌로 건너뜀
+    - overwrite=True: 템플릿이 우선, 다른 칸에서 빼고 넣는다(휴업/휴무 요일/신청 휴무/정원은 여전히 충돌)
+    """
+    out = TileResult()
+    n = (end - start).days + 1
+    if n <= 0:
+        return out
+    emp_by_id = {e.id: e for e in employees}
+    editor = RangeEditor(schedules)
+
+    # 날짜 축(한 번만 계산)
+    days = [start + timedelta(days=i) for i in range(n)]
+    keys = [day_key(d) for d in days]
+    weekdays = [d.weekday() for d in days]
+    closed = [bool(getattr(schedules.get(k), "closed", False)) for k in keys]
+
+    for rot in rotations:
+        for member, emp_id in enumerate(rot.emp_ids):
+            row = tile_codes(rot, start, n, member)
+            e = emp_by_id.get(emp_id)
+            off_weekdays = set(getattr(e, "fixed_holidays", []) or []) if e else set()
+            requests = set(getattr(e, "holiday_requests", []) or []) if e else set()
+            for i, code in enumerate(row):
+                if code not in CODES:
+                    continue
+                key = keys[i]
+
+                def conflict(reason):
+                    out.conflicts.append(Conflict(key, emp_id, code, reason, rot.name))
+
+                if e is None:
+                    conflict("unknown")
+                    continue
+                if closed[i]:
+                    conflict("closed")
+                    continue
+                if code != "OFF":
+                    if weekdays[i] in off_weekdays:
+                        conflict("fixed_holiday")
+                        continue
+                    if key in requests:
+                        conflict("holiday_request")
+                        continue
+                if _place(editor, key, emp_id, code, overwrite, conflict):
+                    out.cells += 1
+                    if code == "OFF":
+                        out.pinned_off.setdefault(key, []).append(emp_id)
+
+    out.changes = editor.result()
+    return out
+
+
+def _place(editor: RangeEditor, key: str, emp_id: int, code: str, overwrite: bool, conflict) -> bool:
+    """한 칸 넣기. 넣었으면(이미 같은 칸이었어도) True."""
+    sch = editor.get(key)
+    working = (getattr(sch, "working", None) or {}) if sch is not None else {}
+    slots = {"OS": working.get("OS") or [], "HC": working.get("HC") or [],
+             "OFF": (getattr(sch, "holidays", None) or []) if sch is not None else []}
+    if emp_id in slots[code]:
+        return True
+    elsewhere = [s for s in CODES if s != code and emp_id in slots[s]]
+    if elsewhere and not overwrite:
+        conflict("busy")
+        return False
+    if code != "OFF" and len(slots[code]) >= 2:
+        conflict("full")
+        return False
+    daily = editor.editable(key)
+    for s in elsewhere:
+        if s == "OFF":
+            daily.holidays = [i for i in daily.holidays if i != emp_id]
+        else:
+            daily.working[s] = [i for i in daily.working[s] if i != emp_id]
+    if code == "OFF":
+        daily.holidays.append(emp_id)
+    else:
+        daily.working[code].append(emp_id)
+    return True
+
+
+def plan_with_rotations(employees, schedules: Dict, rotations, start_date: str, days: int,
+                        **plan_kwargs) -> Tuple[AssignResult, TileResult]:
+    """
+    템플릿을 깐 뒤 남은 칸만 자동 배정(입력 schedules는 변경하지 않음).
+    반환된 AssignResult의 diff/base는 원래 schedules 기준이라 apply() 한 번이면 템플릿 + 자동 배정이 같이 들어간다.
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    tiled = tile_rotations(rotations, employees, schedules, start, start + timedelta(days=days - 1))
+    seeded = dict(schedules)
+    tiled.changes.apply(seeded)
+    plan_kwargs["overwrite"] = False   # 템플릿 배정은 보존해야 웜 스타트
+    result = plan_assignments(employees, seeded, start_date, days,
+                              pinned_off=tiled.pinned_off, **plan_kwargs)
+    # 비교 기준을 템플릿 전 원본으로 되돌려 diff에 템플릿 변경도 포함
+    result.base = {k: schedules.get(k) for k in result.base}
+    result.diff.clear()
+    result.refresh_diff()
+    return result, tiled
@@ -1,85 +1,307 @@
 # logic/scheduler.py
-from schedule_manager.data.data_manager import load_employees, load_schedules, save_schedules
+from schedule_manager.data.data_manager import load_employees, load_schedules, save_schedules, append_generation
 from schedule_manager.models.schedule import DailySchedule
+from schedule_manager.exceptions import CancelAction
+from schedule_manager.logic.constraints import WeekConstraints
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
 import random
-import calendar
-from collections import defaultdict
-
-def auto_assign(start_date: str, days: int = 7, overwrite: bool = False, weekly_off_cap: int = 2):
+import time
+from collections import Counter, defaultdict
+
+SLOTS = ("OS", "HC", "OFF")
+
+# 완화(fallback) 종류: 어떤 규칙으로 칸이 채워졌는지/못 채웠는지
+FALLBACKS = (
+    "home_pair",          # 1) 홈지점 조리+비조리 조합
+    "cross_topup",        # 2) 홈+크로스 혼합으로 조리/비조리 보충
+    "ignore_skill",       # 3) 유형 무시 채우기
+    "unfilled",           # 4) 빈 칸
+    "second_bucket_off",  # 휴무 상한을 넘겨서 휴무 배정
+)
+FALLBACK_LABELS = {
+    "home_pair": "홈 C+N",
+    "cross_topup": "혼합 보충",
+    "ignore_skill": "유형 무시",
+    "unfilled": "빈 칸",
+    "second_bucket_off": "상한 초과 휴무",
+}
+
+
+def new_seed() -> int:
+    """시드 미지정 시 사용할 무작위 시드(항상 기록할 수 있도록 정수로 뽑는다)."""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def _day_content(sch) -> Optional[tuple]:
+    """비교용 날짜 내용(None = 일정 없음)."""
+    if sch is None:
+        return None
+    working = sch.working or {}
+    return (tuple(working.get("OS") or []), tuple(working.get("HC") or []), tuple(sch.holidays or []),
+            sch.memo or "", bool(sch.closed))
+
+
+def clone_day(sch, date_str: str) -> DailySchedule:
+    """원본 스케줄을 건드리지 않도록 DailySchedule 복사본을 만든다(없으면 빈 날)."""
+    if sch is None:
+        return DailySchedule(date_str)
+    d = sch.to_dict()
+    ds = DailySchedule(date_str)
+    working = d.get("working") or {}
+    ds.working = {b: list(working.get(b) or []) for b in ("OS", "HC")}
+    ds.holidays = list(d.get("holidays") or [])
+    ds.memo = d.get("memo") or ""
+    ds.closed = bool(d.get("closed", False))
+    return ds
+
+
+def _slot_ids(sch) -> Dict[str, List[int]]:
+    if sch is None:
+        return {k: [] for k in SLOTS}
+    working = getattr(sch, "working", None) or {}
+    return {
+        "OS": list(working.get("OS") or []),
+        "HC": list(working.get("HC") or []),
+        "OFF": list(getattr(sch, "holidays", None) or []),
+    }
+
+
+@dataclass
+class DayDiff:
+    """하루치 변경 내역. added/removed 키는 'OS'/'HC'/'OFF'."""
+    date: str
+    added: Dict[str, List[int]]
+    removed: Dict[str, List[int]]
+
+    @property
+    def changed(self) -> bool:
+        return any(self.added.values()) or any(self.removed.values())
+
+    @staticmethod
+    def between(date_str: str, before, after) -> "DayDiff":
+        old, new = _slot_ids(before), _slot_ids(after)
+        added = {k: [i for i in new[k] if i not in old[k]] for k in SLOTS}
+        removed = {k: [i for i in old[k] if i not in new[k]] for k in SLOTS}
+        return DayDiff(date_str, added, removed)
+
+
+@dataclass
+class AssignStats:
+    days_total: int = 0
+    days_closed: int = 0
+    slots_required: int = 0
+    slots_filled: int = 0
+    shifts: Dict[int, int] = field(default_factory=lambda: defaultdict(int))   # emp_id → 근무일수
+    offs: Dict[int, int] = field(default_factory=lambda: defaultdict(int))     # emp_id → 휴무일수
+    phase_seconds: Dict[str, float] = field(default_factory=lambda: defaultdict(float))  # 단계별 소요 시간
+    fallbacks: Dict[str, Counter] = field(default_factory=dict)                # 날짜 → 완화 종류별 횟수
+    cap_violations: Dict[str, int] = field(default_factory=lambda: defaultdict(int))     # off_cap / max_shifts / min_shifts
+
+    @property
+    def slots_unfilled(self) -> int:
+        return self.slots_required - self.slots_filled
+
+    def count_fallback(self, date_str: str, kind: str, n: int = 1) -> None:
+        if n > 0:
+            self.fallbacks.setdefault(date_str, Counter())[kind] += n
+
+    def fallback_totals(self) -> Counter:
+        total = Counter()
+        for c in self.fallbacks.values():
+            total.update(c)
+        return total
+
+    def merge(self, other: "AssignStats") -> None:
+        """다른 구간의 통계를 더한다(병렬 청크 이어 붙이기용)."""
+        self.days_total += other.days_total
+        self.days_closed += other.days_closed
+        self.slots_required += other.slots_required
+        self.slots_filled += other.slots_filled
+        for src, dst in ((other.shifts, self.shifts), (other.offs, self.offs),
+                         (other.phase_seconds, self.phase_seconds),
+                         (other.cap_violations, self.cap_violations)):
+            for k, v in src.items():
+                dst[k] += v
+        for key, c in other.fallbacks.items():
+            self.fallbacks.setdefault(key, Counter()).update(c)
+
+    def report(self) -> str:
+        """CLI/GUI 표시용 여러 줄 요약."""
+        totals = self.fallback_totals()
+        lines = [
+            f"일수 {self.days_total} (휴업 {self.days_closed}) · 충원 {self.slots_filled}/{self.slots_required}칸"
+            f" · 빈 칸 {self.slots_unfilled}",
+            "완화: " + ", ".join(f"{FALLBACK_LABELS[k]} {totals.get(k, 0)}" for k in FALLBACKS),
+            "상한 위반: " + ", ".join(f"{k} {v}" for k, v in sorted(self.cap_violations.items()))
+            if self.cap_violations else "상한 위반: 없음",
+            "단계별 시간: " + ", ".join(f"{k} {v * 1000:.1f}ms" for k, v in self.phase_seconds.items()),
+        ]
+        worst = sorted(self.fallbacks.items(),
+                       key=lambda kv: (-(kv[1]["unfilled"] + kv[1]["ignore_skill"]), kv[0]))[:5]
+        worst = [(k, c) for k, c in worst if c["unfilled"] or c["ignore_skill"]]
+        if worst:
+            lines.append("주의 날짜: " + ", ".join(
+                f"{k}(빈 칸 {c['unfilled']}, 유형 무시 {c['ignore_skill']})" for k, c in worst))
+        return "\n".join(lines)
+
+
+@dataclass
+class AssignResult:
+    """
+    plan_assignments 결과.
+    - days: 새로 계산된 날짜별 스케줄(휴업일 제외). 입력 스케줄과 객체를 공유하지 않는다.
+    - diff: 실제로 바뀐 날짜만 담은 변경 내역
+    - seed/segments: 재현용 시드. segments는 [(구간 시작일, 일수, 시드), ...]
+    - base: 날짜별 원본 스케줄(없던 날은 None), locked: 보존된 수동 근무 배정(후처리에서 건드리지 않음)
+    - improve: 공정성 후처리(local_search)를 돌렸으면 그 설정(iterations/seed/온도/가중치), 아니면 None
+    - skipped: apply() 때 원본이 계산 시점과 달라져 반영하지 않은 날짜
+    """
+    start_date: str
+    days_count: int
+    overwrite: bool
+    weekly_off_cap: int
+    days: Dict[str, DailySchedule] = field(default_factory=dict)
+    diff: Dict[str, DayDiff] = field(default_factory=dict)
+    stats: AssignStats = field(default_factory=AssignStats)
+    seed: Optional[int] = None
+    segments: List[Tuple[str, int, int]] = field(default_factory=list)
+    base: Dict[str, Optional[DailySchedule]] = field(default_factory=dict, repr=False)
+    locked: Dict[str, List[int]] = field(default_factory=dict, repr=False)
+    improve: Optional[Dict] = None
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def changed_keys(self) -> List[str]:
+        return sorted(self.diff.keys())
+
+    def refresh_diff(self, keys=None) -> None:
+        """days를 직접 고친 뒤(후처리 등) 해당 날짜의 diff를 다시 계산한다."""
+        for key in (self.days.keys() if keys is None else keys):
+            diff = DayDiff.between(key, self.base.get(key), self.days[key])
+            if diff.changed:
+                self.diff[key] = diff
+            else:
+                self.diff.pop(key, None)
+
+    def apply(self, schedules: Dict[str, DailySchedule]) -> List[str]:
+        """
+        바뀐 날짜만 스케줄 매핑에 반영하고 반영한 날짜 키 목록을 돌려준다.
+        계산에 쓴 원본(base)과 지금 내용이 다른 날짜(계산 중 다른 창에서 편집 등)는 덮어쓰지 않고 skipped에 남긴다.
+        """
+        applied, self.skipped = [], []
+        for key in self.changed_keys:
+            if _day_content(schedules.get(key)) != _day_content(self.base.get(key)):
+                self.skipped.append(key)
+                continue
+            schedules[key] = self.days[key]
+            applied.append(key)
+        return applied
+
+    def summary(self) -> str:
+        return (f"{self.days_count}일간 자동 배정 완료(수동 배정 보존={not self.overwrite}, "
+                f"휴업일 스킵, 주차별 휴무 상한={self.weekly_off_cap}, 시드={self.seed})")
+
+    def generation_record(self) -> Dict:
+        """generations.json에 남길 재현 정보."""
+        return {
+            "start": self.start_date,
+            "days": self.days_count,
+            "seed": self.seed,
+            "segments": [list(seg) for seg in self.segments],
+            "overwrite": self.overwrite,
+            "weekly_off_cap": self.weekly_off_cap,
+            "improve": self.improve,
+        }
+
+
+def plan_assignments(employees, schedules: Dict[str, DailySchedule], start_date: str,
+                     days: int = 7, overwrite: bool = False, weekly_off_cap: int = 2,
+                     seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     should_cancel: Optional[Callable[[], bool]] = None,
+                     pinned_off: Optional[Dict[str, List[int]]] = None) -> AssignResult:
     """
-    자동 배정
+    자동 배정(순수 함수). 파일 I/O·출력 없이 결과만 계산한다.
+    - 입력 schedules는 변경하지 않는다. 반영은 AssignResult.apply()로.
     - overwrite=False: 기존 수동 배정은 보존, 빈 칸만 채움
     - 휴업일은 스킵
     - A/B 중복 금지
     - C 1 + N 1(조리 1 + 비조리 1) 우선, 부족하면 완화
     - 가용 인원 < 2면 남은 칸은 비워둠(추후 수동 보완)
     - 달력(일~토) 주차 기준으로 직급 무관 '직원별 주당 휴무 상한' 적용(기본 2일)
+    - 주(월~일) 최소/최대 근무를 WeekConstraints로 추적(수동 배정 + 기간 밖 경계 주의 기존 배정 포함, 월 경계에서 끊기지 않음).
+      최대 근무는 하드 제약, 최소 근무 미달자는 후보 정렬에서 우선.
+    - 재현성: 같은 입력 + 같은 seed → 같은 결과. rng를 넘기면 그 RNG를 그대로 쓴다(seed는 기록용).
+      seed/rng 모두 없으면 새 시드를 뽑아 result.seed에 남긴다.
+    - progress(완료 일수, 전체 일수)를 하루마다 호출. should_cancel()이 True면 CancelAction 발생.
+    - pinned_off: {날짜: [직원 ID]} 그날 반드시 휴무(로테이션 템플릿 등). 근무 후보에서 빠지고
+      휴무로 먼저 기록되며, 후처리에서도 움직이지 않도록 locked에 들어간다.
     """
 
-    # ---- 내부 헬퍼: 해당 '월'의 달력 주차 인덱스 맵(일요일 시작, 월 경계 내만) ----
-    def month_week_index_map_local(year: int, month: int) -> dict[str, int]:
-        cal = calendar.Calendar(firstweekday=6)  # 6 = Sunday
-        weeks = cal.monthdatescalendar(year, month)  # 각 주 7일
-        idx = 0
-        result = {}
-        for w in weeks:
-            in_month = [d for d in w if d.month == month]
-            if not in_month:
-                continue
-            idx += 1
-            for d in in_month:
-                result[d.strftime("%Y-%m-%d")] = idx
-        return result
-
-    employees = load_employees()
+    if rng is None:
+        if seed is None:
+            seed = new_seed()
+        rng = random.Random(seed)
+    result = AssignResult(start_date, days, overwrite, weekly_off_cap, seed=seed)
+    result.segments.append((start_date, days, seed))
+    employees = list(employees or [])
     if not employees:
-        print("직원 데이터가 없습니다. 먼저 직원을 등록해주세요.")
-        return
+        return result
 
     emp_by_id = {e.id: e for e in employees}
-    schedules = load_schedules()
 
-    # 주간 근무 횟수(월~일 기준). 시작일 기준 주간으로 초기화
-    weekly_shifts = defaultdict(int)
-
-    # 달력 주차(일~토) 기준 휴무 카운트: key=(week_idx, emp_id)
-    off_count = defaultdict(int)
+    # 주간 근무(월~일) / 휴무(일~토) 카운터: (주, 직원) 배열
+    wc = WeekConstraints(employees, start_date, days, weekly_off_cap, schedules)
+    emp_idx = wc.index
 
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    # 시작 월의 주차 맵 생성
-    cur_week_map = month_week_index_map_local(start_dt.year, start_dt.month)
+
+    stats = result.stats
+    perf = time.perf_counter
+    run_started = perf()
 
     for d in range(days):
+        t0 = perf()
+        if should_cancel and should_cancel():
+            raise CancelAction()
+        if progress:
+            progress(d, days)
+        result.stats.days_total += 1
         cur_dt = start_dt + timedelta(days=d)
         date_str = cur_dt.strftime("%Y-%m-%d")
         weekday = cur_dt.weekday()  # 0=월 ... 6=일
 
-        # 달이 바뀌면 해당 월의 주차 맵 재생성
-        if date_str not in cur_week_map:
-            cur_week_map = month_week_index_map_local(cur_dt.year, cur_dt.month)
-        week_idx = cur_week_map.get(date_str, None)  # None 방어 (이론상 없어야 함)
-
-        # 주간 리셋(월요일에 리셋)
-        if weekday == 0 and d != 0:
-            weekly_shifts = defaultdict(int)
-
-        # 스케줄 객체 준비
-        daily = schedules.get(date_str) or DailySchedule(date_str)
-        if daily.closed:
+        # 스케줄 객체 준비(원본은 건드리지 않도록 복사본에서 작업)
+        before = schedules.get(date_str)
+        if before is not None and getattr(before, "closed", False):
             # 휴업일: 건드리지 않음
-            schedules[date_str] = daily
+            result.stats.days_closed += 1
             continue
+        daily = clone_day(before, date_str)
 
-        # 기존 수동 배정 보존 옵션
+        # 기존 수동 배정 보존 옵션(직원 목록에 없는 ID = 아직 정리 안 된 삭제 직원은 자리를 차지하지 않음)
         if not overwrite:
-            a_fixed = daily.working['OS'][:]
-            b_fixed = daily.working['HC'][:]
+            a_fixed = [i for i in daily.working['OS'] if i in emp_by_id]
+            b_fixed = [i for i in daily.working['HC'] if i in emp_by_id]
         else:
             a_fixed, b_fixed = [], []
 
+        # 고정 휴무(근무 배정된 사람은 제외: 수동 배정이 우선)
+        pinned = [i for i in (pinned_off or {}).get(date_str, ())
+                  if i in emp_idx and i not in a_fixed and i not in b_fixed]
+        pinned_set = set(pinned)
+
+        # 보존된 수동 배정도 주간 근무 횟수에 포함
+        for emp_id in a_fixed + b_fixed:
+            if emp_id in emp_idx:
+                wc.add_shift(emp_idx[emp_id], d)
+
         # 오늘 근무 가능 후보 필터
         def is_available(e):
+            if e.id in pinned_set:
+                return False
             # 고정 휴무(요일; 0=월..6=일)
             if weekday in getattr(e, "fixed_holidays", []):
                 return False
@@ -87,11 +309,13 @@ def auto_assign(start_date: str, days: int = 7, overwrite: bool = False, weekly_
             if date_str in getattr(e, "holiday_requests", []):
                 return False
             # 주간 최대 근무 초과 방지
-            if weekly_shifts[e.id] >= getattr(e, "max_shifts_per_week", 6):
+            if not wc.can_work(emp_idx[e.id], d):
                 return False
             return True
 
         available = [e for e in employees if is_available(e)]
+        t1 = perf()
+        stats.phase_seconds["candidates"] += t1 - t0
 
         # 이미 다른 지점/고정 배정된 ID는 제외
         already_assigned = set(a_fixed + b_fixed)
@@ -107,7 +331,7 @@ def auto_assign(start_date: str, days: int = 7, overwrite: bool = False, weekly_
             return max(0, 2 - len(fixed_ids))
 
         # 조합 선택 유틸(안전)
-        def choose_for_branch(branch, fixed_ids):
+        def choose_for_branch(branch, fixed_ids, rng):
             """
             우선순위:
               1) 홈지점에서 C 1 + N 1
@@ -130,10 +354,19 @@ def auto_assign(start_date: str, days: int = 7, overwrite: bool = False, weekly_
             chosen = fixed_ids[:]
             already = set(already_assigned) | set(chosen)
 
-            # 1) 홈지점에서 cook+nocook 시도
+            # 최소 근무 미달 긴급도(클수록 우선). 섞은 뒤 안정 정렬 → 같은 긴급도 안에서는 무작위
+            def urgency(e):
+                return wc.min_priority(emp_idx[e.id], d)
+
+            def most_urgent_first(pool):
+                return sorted(pool, key=urgency, reverse=True)
+
+            # 1) 홈지점에서 cook+nocook 시도 (pop()은 뒤에서 꺼내므로 긴급한 사람을 뒤로)
             home_cooks, home_nocooks = split_skill(home)
-            random.shuffle(home_cooks)
-            random.shuffle(home_nocooks)
+            rng.shuffle(home_cooks)
+            rng.shuffle(home_nocooks)
+            home_cooks.sort(key=urgency)
+            home_nocooks.sort(key=urgency)
 
             while need > 0 and home_cooks and home_nocooks:
                 c = home_cooks.pop()
@@ -142,42 +375,45 @@ def auto_assign(start_date: str, days: int = 7, overwrite: bool = False, weekly_
                     if cand.id not in already:
                         chosen.append(cand.id)
                         already.add(cand.id)
-                        weekly_shifts[cand.id] += 1
+                        wc.add_shift(emp_idx[cand.id], d)
                         need -= 1
+                        stats.count_fallback(date_str, "home_pair")
                         if need == 0:
                             break
 
             # 2) 부족하면 홈+크로스 혼합으로 cook/nocook 맞추기
             if need > 0:
                 cross_cooks, cross_nocooks = split_skill(cross)
-                random.shuffle(cross_cooks)
-                random.shuffle(cross_nocooks)
+                rng.shuffle(cross_cooks)
+                rng.shuffle(cross_nocooks)
 
                 # cook 없는 경우 보충
                 if not any(emp_by_id[i].skill_level == "C" for i in chosen):
                     # 홈 cook → 없으면 크로스 cook
-                    pools = [home_cooks + home, cross_cooks + cross]
+                    pools = [most_urgent_first(home_cooks + home), most_urgent_first(cross_cooks + cross)]
                     for pool in pools:
                         for e in pool:
                             if getattr(e, "skill_level", "") == "C" and e.id not in already:
                                 chosen.append(e.id)
                                 already.add(e.id)
-                                weekly_shifts[e.id] += 1
+                                wc.add_shift(emp_idx[e.id], d)
                                 need -= 1
+                                stats.count_fallback(date_str, "cross_topup")
                                 break
                         if need <= 0:
                             break
 
                 # nocook 없는 경우 보충
                 if need > 0 and not any(emp_by_id[i].skill_level != "C" for i in chosen):
-                    pools = [home_nocooks + home, cross_nocooks + cross]
+                    pools = [most_urgent_first(home_nocooks + home), most_urgent_first(cross_nocooks + cross)]
                     for pool in pools:
                         for e in pool:
                             if getattr(e, "skill_level", "") != "C" and e.id not in already:
                                 chosen.append(e.id)
                                 already.add(e.id)
-                                weekly_shifts[e.id] += 1
+                                wc.add_shift(emp_idx[e.id], d)
                                 need -= 1
+                                stats.count_fallback(date_str, "cross_topup")
                                 break
                         if need <= 0:
                             break
@@ -185,58 +421,116 @@ def auto_assign(start_date: str, days: int = 7, overwrite: bool = False, weekly_
             # 3) 그래도 부족하면 유형 무시하고 채우기(홈 우선 → 크로스)
             if need > 0:
                 filler = [e for e in home + cross if e.id not in already]
-                random.shuffle(filler)
+                rng.shuffle(filler)
+                filler = most_urgent_first(filler)
                 for e in filler:
                     chosen.append(e.id)
                     already.add(e.id)
-                    weekly_shifts[e.id] += 1
+                    wc.add_shift(emp_idx[e.id], d)
                     need -= 1
+                    stats.count_fallback(date_str, "ignore_skill")
                     if need == 0:
                         break
 
             # 4) 여전히 need > 0 이면 빈 자리 남김(예: 가용 인원 1명)
+            stats.count_fallback(date_str, "unfilled", need)
             return chosen[:2]  # 안전상 절대 2명 넘지 않게
 
         # A 먼저 채우고, B는 A와 중복 금지
-        a_done = choose_for_branch('OS', a_fixed)
+        a_done = choose_for_branch('OS', a_fixed, rng)
         already_assigned.update(a_done)
-        b_done = choose_for_branch('HC', b_fixed)
+        b_done = choose_for_branch('HC', b_fixed, rng)
+        t2 = perf()
+        stats.phase_seconds["branch_fill"] += t2 - t1
 
         # 근무 확정
         daily.working['OS'] = a_done
         daily.working['HC'] = b_done
+        result.stats.slots_required += 4
+        result.stats.slots_filled += len(a_done) + len(b_done)
+        for emp_id in a_done + b_done:
+            result.stats.shifts[emp_id] += 1
 
         # ---- 휴무 결정: '달력 주차(일~토) 기준'으로 직원별 주당 휴무 상한 적용 ----
         assigned_ids = set(a_done + b_done)
         off_slots = max(0, len(employees) - len(assigned_ids))   # 오늘 휴무로 표기할 최대 인원 수
 
         # 오늘 근무에 배정되지 않은 사람 = 휴무 후보
-        off_candidates = [e for e in employees if e.id not in assigned_ids]
+        off_candidates = [e for e in employees if e.id not in assigned_ids and e.id not in pinned_set]
+        # 동률(휴무 횟수 같음)일 때 직원 목록 순서가 아니라 시드 기반으로 섞어서 고른다
+        rng.shuffle(off_candidates)
 
         # 1순위: 이번 달-주차에서 휴무 횟수가 weekly_off_cap 미만인 사람(덜 쉼 → 우선 휴무)
         # 2순위: 이미 상한 도달/초과(불가피할 때만)
-        first_bucket  = [e for e in off_candidates if off_count[(week_idx, e.id)] < weekly_off_cap]
-        second_bucket = [e for e in off_candidates if off_count[(week_idx, e.id)] >= weekly_off_cap]
+        def offs_this_week(e):
+            return wc.off_count(emp_idx[e.id], d)
+
+        first_bucket  = [e for e in off_candidates if offs_this_week(e) < weekly_off_cap]
+        second_bucket = [e for e in off_candidates if offs_this_week(e) >= weekly_off_cap]
 
         # 공정하게: 이번 주에 '덜 쉰' 순으로 정렬
-        first_bucket.sort(key=lambda e: off_count[(week_idx, e.id)])
-        second_bucket.sort(key=lambda e: off_count[(week_idx, e.id)])
+        first_bucket.sort(key=offs_this_week)
+        second_bucket.sort(key=offs_this_week)
 
-        todays_off = []
+        todays_off = list(pinned)
+        off_slots -= len(pinned)
         take = min(off_slots, len(first_bucket))
         todays_off.extend(e.id for e in first_bucket[:take])
 
-        remain = off_slots - len(todays_off)
+        remain = off_slots - take   # todays_off에는 고정 휴무(pinned)도 들어 있으므로 take 기준
         if remain > 0 and second_bucket:
             todays_off.extend(e.id for e in second_bucket[:remain])
+            over = min(remain, len(second_bucket))
+            stats.count_fallback(date_str, "second_bucket_off", over)
+            stats.cap_violations["off_cap"] += over
 
         daily.holidays = todays_off
 
         # 카운트 갱신(달력 주차 기준)
         for emp_id in todays_off:
-            off_count[(week_idx, emp_id)] += 1
-
-        schedules[date_str] = daily
+            wc.add_off(emp_idx[emp_id], d)
+            result.stats.offs[emp_id] += 1
+
+        result.days[date_str] = daily
+        result.base[date_str] = before
+        result.locked[date_str] = a_fixed + b_fixed + pinned
+        t3 = perf()
+        stats.phase_seconds["off_days"] += t3 - t2
+        diff = DayDiff.between(date_str, before, daily)
+        if diff.changed:
+            result.diff[date_str] = diff
+        stats.phase_seconds["diff"] += perf() - t3
+
+    for kind, n in wc.violations().items():
+        if kind != "off_cap":  # 휴무 상한 초과는 배정 중에 이미 셈
+            stats.cap_violations[kind] = n
+    stats.phase_seconds["total"] += perf() - run_started
+    if progress:
+        progress(days, days)
+    return result
+
+
+def auto_assign(start_date: str, days: int = 7, overwrite: bool = False, weekly_off_cap: int = 2,
+                seed: Optional[int] = None, improve_iterations: int = 0):
+    """
+    자동 배정 후 저장(plan_assignments의 얇은 래퍼).
+    직원/스케줄을 파일에서 읽고, 결과를 반영해 한 번 저장한다. 사용한 시드는 generations.json에 기록.
+    improve_iterations > 0 이면 저장 전에 local_search.improve_schedule로 그 횟수만큼 공정성 후처리.
+    """
+    employees = load_employees()
+    if not employees:
+        print("직원 데이터가 없습니다. 먼저 직원을 등록해주세요.")
+        return None
 
+    schedules = load_schedules()
+    result = plan_assignments(employees, schedules, start_date, days,
+                              overwrite=overwrite, weekly_off_cap=weekly_off_cap, seed=seed)
+    if improve_iterations > 0:
+        from schedule_manager.logic.local_search import improve_schedule  # 순환 import 방지
+        improve_schedule(result, employees, iterations=improve_iterations, schedules=schedules)
+    result.apply(schedules)
     save_schedules(schedules)
-    print(f"{days}일간 자동 배정 완료(수동 배정 보존={not overwrite}, 휴업일 스킵, 주차별 휴무 상한={weekly_off_cap})")
+    append_generation(result.generation_record())
+    print(result.summary())
+    print(result.stats.report())
+    return result
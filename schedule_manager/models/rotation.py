@@ -0,0 +1,31 @@
+# models/rotation.py
+class Rotation:
+    """
+    반복 근무 템플릿. pattern을 anchor 날짜부터 N일 주기로 되풀이한다.
+    pattern 칸: 'OS' / 'HC'(근무), 'OFF'(휴무), None(비움 → 자동 배정이 채움)
+    emp_ids가 여러 명(팀)이면 i번째 직원은 stagger*i일 밀린 위상으로 돈다(0이면 모두 같은 날 같은 칸).
+    """
+    def __init__(self, name, emp_ids, pattern, anchor, stagger=0):
+        self.name = name
+        self.emp_ids = emp_ids or []    # 직원 ID 목록(한 명 또는 팀)
+        self.pattern = pattern or []    # ['OS', 'OS', 'OFF', None, ...]
+        self.anchor = anchor            # YYYY-MM-DD (pattern[0]이 걸리는 날)
+        self.stagger = stagger          # 팀원 간 위상 차(일)
+
+    @property
+    def period(self):
+        return len(self.pattern)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'emp_ids': self.emp_ids,
+            'pattern': self.pattern,
+            'anchor': self.anchor,
+            'stagger': self.stagger,
+        }
+
+    @staticmethod
+    def from_dict(data):
+        return Rotation(data['name'], data.get('emp_ids', []), data.get('pattern', []),
+                        data['anchor'], data.get('stagger', 0))
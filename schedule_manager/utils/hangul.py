@@ -0,0 +1,122 @@
+# utils/hangul.py
+"""
+직원 이름 검색(접두/부분 문자열/초성).
+
+- choseong("홍길동") == "ㅎㄱㄷ": 완성형 음절만 초성으로 바꾸고 나머지 글자는 그대로(소문자화).
+- 질의 글자 하나는 이름의 같은 위치 글자와 같거나, 초성 자모면 그 글자의 초성과 같으면 일치.
+  → "길동", "ㅎㄱㄷ", "홍ㄱ", "ㄱㄷ" 모두 홍길동에 걸린다.
+- NameIndex: 이름을 초성 문자열로 바꿔 1·2-gram 역색인. 질의도 초성 문자열로 바꿔
+  그 gram을 모두 가진 직원만 후보로 뽑고 실제 위치를 확인한다(키 입력마다 전체 이름을 훑지 않음).
+  set()/remove()로 직원 한 명씩 갱신.
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHO_SET = frozenset(CHOSEONG)
+_SYLLABLE_FIRST, _SYLLABLE_LAST = 0xAC00, 0xD7A3
+_PER_CHOSEONG = 21 * 28
+
+
+def _cho(ch: str) -> str:
+    code = ord(ch)
+    if _SYLLABLE_FIRST <= code <= _SYLLABLE_LAST:
+        return CHOSEONG[(code - _SYLLABLE_FIRST) // _PER_CHOSEONG]
+    return ch
+
+
+def choseong(text: str) -> str:
+    """글자 수를 그대로 둔 초성 문자열("홍길동 B" → "ㅎㄱㄷ b")."""
+    return "".join(_cho(ch) for ch in (text or "").casefold())
+
+
+def match_pos(query: str, name: str) -> int:
+    """query가 name 어디에 걸리는지(없으면 -1). 둘 다 casefold 된 문자열."""
+    return _find(query, choseong(query), name, choseong(name))
+
+
+def _find(query: str, cq: str, name: str, cn: str) -> int:
+    fixed = [(j, ch) for j, ch in enumerate(query) if ch not in _CHO_SET]   # 초성 자모가 아닌 글자는 그대로 같아야
+    i = cn.find(cq)
+    while i >= 0:
+        if all(name[i + j] == ch for j, ch in fixed):
+            return i
+        i = cn.find(cq, i + 1)
+    return -1
+
+
+def _squash(text: str) -> str:
+    """소문자 + 공백 제거("Kim 철수" → "kim철수")."""
+    return "".join((text or "").casefold().split())
+
+
+def _grams(cho: str) -> Set[str]:
+    return set(cho) | {cho[i:i + 2] for i in range(len(cho) - 1)}
+
+
+class NameIndex:
+    def __init__(self):
+        self._names: Dict[int, Tuple[str, str]] = {}       # 직원 ID → (공백 뺀 소문자 이름, 초성 문자열)
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+
+    @classmethod
+    def build(cls, employees: Iterable) -> "NameIndex":
+        index = cls()
+        for e in employees:
+            index.set(e.id, e.name)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def set(self, emp_id: int, name: str) -> None:
+        norm = _squash(name)
+        old = self._names.get(emp_id)
+        if old is not None and old[0] == norm:
+            return
+        cho = choseong(norm)
+        old_grams = _grams(old[1]) if old else set()
+        new_grams = _grams(cho)
+        for g in old_grams - new_grams:
+            self._drop(g, emp_id)
+        for g in new_grams - old_grams:
+            self._postings[g].add(emp_id)
+        self._names[emp_id] = (norm, cho)
+
+    def remove(self, emp_id: int) -> None:
+        old = self._names.pop(emp_id, None)
+        if old is not None:
+            for g in _grams(old[1]):
+                self._drop(g, emp_id)
+
+    def _drop(self, g: str, emp_id: int) -> None:
+        ids = self._postings.get(g)
+        if ids is not None:
+            ids.discard(emp_id)
+            if not ids:
+                del self._postings[g]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """일치하는 직원 ID. 앞에서 걸린 순(접두 일치 먼저) → ID 순."""
+        q = _squash(query)
+        if not q:
+            return []
+        cq = choseong(q)
+        grams = [cq] if len(cq) == 1 else [cq[i:i + 2] for i in range(len(cq) - 1)]
+        sets = [self._postings.get(g) for g in grams]
+        if any(s is None for s in sets):
+            return []
+        sets.sort(key=len)
+        cand = set(sets[0])
+        for s in sets[1:]:
+            cand &= s
+        ranked = []
+        for emp_id in cand:
+            norm, cho = self._names[emp_id]
+            pos = _find(q, cq, norm, cho)
+            if pos >= 0:
+                ranked.append((pos, emp_id))
+        ranked.sort()
+        ids = [emp_id for _, emp_id in ranked]
+        return ids if limit is None else ids[:limit]
@@ -21,4 +21,16 @@ def get_input(prompt: str, allow_empty: bool = False, default: str | None = None
         if not v:
             print("값을 입력하거나 '취소/뒤로'를 입력하세요.")
             continue
-        return v
\ No newline at end of file
+        return v
+
+
+def get_optional_int(prompt: str) -> int | None:
+    """정수 입력(비우면 None). 숫자가 아니면 다시 묻는다."""
+    while True:
+        v = get_input(prompt, allow_empty=True)
+        if not v:
+            return None
+        try:
+            return int(v)
+        except ValueError:
+            print("정수를 입력하거나 비워 두세요.")